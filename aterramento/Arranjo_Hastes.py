@@ -0,0 +1,273 @@
+import argparse
+import math
+
+import numpy as np
+
+from Metodo_Momentos import gradiente_conjugado
+from Motor_Calculo import resistencia_haste_unica
+
+# Até este número de hastes a matriz de resistências é montada inteira e resolvida diretamente
+LIMITE_SOLUCAO_DIRETA = 2000
+# Raio de corte padrão (múltiplos do comprimento da haste): além dele o acoplamento é
+# aproximado por fontes pontuais agrupadas por célula
+CORTE_PADRAO = 10.0
+# Máximo de células ocupadas no campo distante (a matriz célula × célula fica na memória)
+MAXIMO_CELULAS = 2000
+
+
+# Arranjos típicos: posições (x, y) em metros, forma (n, 2)
+
+def arranjo_linha(n_hastes, espacamento):
+    """Hastes em linha reta com espaçamento uniforme"""
+    return np.column_stack([np.arange(n_hastes) * espacamento, np.zeros(n_hastes)])
+
+
+def arranjo_anel(n_hastes, raio):
+    """Hastes igualmente espaçadas numa circunferência"""
+    angulos = 2 * math.pi * np.arange(n_hastes) / n_hastes
+    return raio * np.column_stack([np.cos(angulos), np.sin(angulos)])
+
+
+def _perimetro(vertices, hastes_por_lado):
+    """Hastes ao longo do polígono fechado, hastes_por_lado contando os dois vértices"""
+    t = np.arange(hastes_por_lado - 1)[:, None] / (hastes_por_lado - 1)
+    vertices = np.asarray(vertices, dtype=float)
+    lados = [a + t * (b - a) for a, b in zip(vertices, np.roll(vertices, -1, axis=0))]
+    return np.vstack(lados)
+
+
+def arranjo_triangulo(lado, hastes_por_lado=2):
+    """Triângulo equilátero; hastes_por_lado=2 são só os três vértices"""
+    return _perimetro([(0, 0), (lado, 0), (lado / 2, lado * math.sqrt(3) / 2)], hastes_por_lado)
+
+
+def arranjo_quadrado(lado, hastes_por_lado=2):
+    """Perímetro de um quadrado; hastes_por_lado=2 são só os quatro cantos"""
+    return _perimetro([(0, 0), (lado, 0), (lado, lado), (0, lado)], hastes_por_lado)
+
+
+def arranjo_grade(n_x, n_y, espacamento_x, espacamento_y=None):
+    """Grade retangular preenchida de n_x × n_y hastes"""
+    espacamento_y = espacamento_x if espacamento_y is None else espacamento_y
+    X, Y = np.meshgrid(np.arange(n_x) * espacamento_x, np.arange(n_y) * espacamento_y)
+    return np.column_stack([X.ravel(), Y.ravel()])
+
+
+# Modelo de resistências mútuas (ρ = 1)
+
+def _primitiva(u, distancia):
+    """Dupla primitiva de 1/√(s² + u²) em u"""
+    return u * np.arcsinh(u / distancia) - np.sqrt(u ** 2 + distancia ** 2)
+
+
+def resistencia_mutua(distancia, comprimento_i, comprimento_j):
+    """
+    Resistência mútua (ρ = 1) entre duas hastes verticais partindo da superfície,
+    afastadas de distancia: potencial médio ao longo de uma com corrente uniforme na
+    outra, incluindo a imagem. Tende a 1/(2π·s) para s ≫ L.
+    """
+    soma = _primitiva(comprimento_i + comprimento_j, distancia)
+    diferenca = _primitiva(np.abs(comprimento_i - comprimento_j), distancia)
+    return (soma - diferenca) / (4 * math.pi * comprimento_i * comprimento_j)
+
+
+def _preparar(posicoes, comprimento, diametro):
+    posicoes = np.atleast_2d(np.asarray(posicoes, dtype=float))
+    if posicoes.ndim != 2 or posicoes.shape[1] != 2:
+        raise ValueError("posicoes deve ter forma (n, 2)")
+    n = len(posicoes)
+    comprimento = np.broadcast_to(np.asarray(comprimento, dtype=float), (n,)).copy()
+    diametro = np.broadcast_to(np.asarray(diametro, dtype=float), (n,)).copy()
+    if np.any(comprimento <= 0) or np.any(diametro <= 0):
+        raise ValueError("Comprimento e diâmetro das hastes devem ser positivos")
+    return posicoes, comprimento, diametro
+
+
+def _valores_pares(posicoes, comprimento, diametro, i, j):
+    """Termos da matriz para os pares (i, j): própria na diagonal, mútua fora dela"""
+    distancia = np.hypot(*(posicoes[i] - posicoes[j]).T)
+    proprio = i == j
+    if np.any(distancia[~proprio] <= np.maximum(diametro[i], diametro[j])[~proprio]):
+        raise ValueError("Hastes sobrepostas: a distância entre hastes deve ser maior que o diâmetro")
+    valores = np.empty(len(i))
+    valores[proprio] = resistencia_haste_unica(1.0, comprimento[i[proprio]], diametro[i[proprio]])
+    valores[~proprio] = resistencia_mutua(distancia[~proprio], comprimento[i[~proprio]],
+                                          comprimento[j[~proprio]])
+    return valores
+
+
+def matriz_resistencias(posicoes, comprimento, diametro):
+    """
+    Matriz n × n de resistências próprias e mútuas (ρ = 1). A diagonal é a haste única de
+    Motor_Calculo, então uma haste isolada reproduz resistencia_haste_unica.
+    """
+    posicoes, comprimento, diametro = _preparar(posicoes, comprimento, diametro)
+    n = len(posicoes)
+    i, j = np.divmod(np.arange(n * n), n)
+    return _valores_pares(posicoes, comprimento, diametro, i, j).reshape(n, n)
+
+
+class OperadorAproximado:
+    """
+    Matriz de resistências de um arranjo grande sem montá-la inteira.
+
+    As hastes são agrupadas numa grade de células de lado ≥ raio_corte/2. Pares em células
+    vizinhas (até 2 células de distância em x e y, o que cobre o raio de corte) usam o
+    modelo exato e ficam em listas esparsas; entre células mais afastadas as correntes de
+    cada célula são somadas e tratadas como uma fonte pontual no centroide (1/(2π·s)).
+    O produto matriz-vetor custa O(pares próximos + células²).
+    """
+
+    def __init__(self, posicoes, comprimento, diametro, raio_corte):
+        posicoes, comprimento, diametro = _preparar(posicoes, comprimento, diametro)
+        self.n = n = len(posicoes)
+
+        # Células maiores se houver ocupadas demais para a matriz do campo distante
+        lado = raio_corte / 2
+        while True:
+            indices = np.floor((posicoes - posicoes.min(axis=0)) / lado).astype(np.int64)
+            largura = indices[:, 1].max() + 1
+            chaves = indices[:, 0] * largura + indices[:, 1]
+            if len(np.unique(chaves)) <= MAXIMO_CELULAS:
+                break
+            lado *= 1.5
+        self.lado_celula = lado
+
+        ordem = np.argsort(chaves, kind='stable')
+        celulas, inicio, contagem = np.unique(chaves[ordem], return_index=True, return_counts=True)
+        self.celula = np.searchsorted(celulas, chaves)
+        cx, cy = np.divmod(celulas, largura)
+
+        # Pares próximos: produto cartesiano das hastes de cada par de células vizinhas
+        linhas, colunas = [], []
+        for dx in range(-2, 3):
+            for dy in range(-2, 3):
+                vizinha = (cx + dx) * largura + (cy + dy)
+                valida = (cx + dx >= 0) & (cy + dy >= 0) & (cy + dy < largura)
+                posicao = np.minimum(np.searchsorted(celulas, vizinha), len(celulas) - 1)
+                a = np.flatnonzero(valida & (celulas[posicao] == vizinha))
+                b = posicao[a]
+                pares = contagem[a] * contagem[b]
+                grupo = np.repeat(np.arange(len(a)), pares)
+                k = np.arange(pares.sum()) - np.repeat(np.cumsum(pares) - pares, pares)
+                linhas.append(ordem[inicio[a][grupo] + k // contagem[b][grupo]])
+                colunas.append(ordem[inicio[b][grupo] + k % contagem[b][grupo]])
+        self.linhas = np.concatenate(linhas).astype(np.int32)
+        self.colunas = np.concatenate(colunas).astype(np.int32)
+        self.valores = _valores_pares(posicoes, comprimento, diametro, self.linhas, self.colunas)
+        self.diagonal = resistencia_haste_unica(1.0, comprimento, diametro)
+
+        # Campo distante entre centroides das células não vizinhas
+        n_celulas = len(celulas)
+        centroides = np.column_stack([np.bincount(self.celula, posicoes[:, eixo], n_celulas)
+                                      for eixo in range(2)]) / np.bincount(self.celula, minlength=n_celulas)[:, None]
+        vizinhas = (np.abs(cx[:, None] - cx[None, :]) <= 2) & (np.abs(cy[:, None] - cy[None, :]) <= 2)
+        distante = np.subtract.outer(centroides[:, 0], centroides[:, 0]) ** 2
+        distante += np.subtract.outer(centroides[:, 1], centroides[:, 1]) ** 2
+        distante[vizinhas] = 1.0
+        np.sqrt(distante, out=distante)
+        np.divide(1 / (2 * math.pi), distante, out=distante)
+        distante[vizinhas] = 0.0
+        self.distante = distante
+        self.n_celulas = n_celulas
+
+    @property
+    def pares_proximos(self):
+        return len(self.valores)
+
+    def __matmul__(self, x):
+        proximo = np.bincount(self.linhas, self.valores * x[self.colunas], minlength=self.n)
+        por_celula = np.bincount(self.celula, x, minlength=self.n_celulas)
+        return proximo + (self.distante @ por_celula)[self.celula]
+
+
+def resistencia_arranjo(resistividade, posicoes, comprimento, diametro, metodo='auto',
+                        raio_corte=None, tolerancia=1e-8):
+    """
+    Resistência de um arranjo de hastes verticais em posições (x, y) quaisquer.
+
+    Todas as hastes ficam no mesmo potencial (interligadas): resolve R·i = 1 e
+    R_total = ρ / Σi. metodo: 'direto' (matriz completa), 'aproximado' (raio de corte e
+    campo distante agrupado, gradiente conjugado) ou 'auto' (pelo número de hastes).
+    raio_corte: padrão CORTE_PADRAO × maior comprimento de haste.
+    """
+    posicoes, comprimento, diametro = _preparar(posicoes, comprimento, diametro)
+    n = len(posicoes)
+    uns = np.ones(n)
+
+    if metodo == 'auto':
+        metodo = 'direto' if n <= LIMITE_SOLUCAO_DIRETA else 'aproximado'
+
+    iteracoes, pares_proximos = None, None
+    if metodo == 'direto':
+        correntes = np.linalg.solve(matriz_resistencias(posicoes, comprimento, diametro), uns)
+        pares_proximos = n * n
+    elif metodo == 'aproximado':
+        raio_corte = raio_corte or CORTE_PADRAO * comprimento.max()
+        operador = OperadorAproximado(posicoes, comprimento, diametro, raio_corte)
+        correntes, iteracoes = gradiente_conjugado(operador, uns, tolerancia, diagonal=operador.diagonal)
+        pares_proximos = operador.pares_proximos
+    else:
+        raise ValueError(f"Método desconhecido: {metodo}")
+
+    total = correntes.sum()
+    # Fator de utilização: hastes isoladas em paralelo / arranjo (1 = sem interferência)
+    paralelo = 1 / np.sum(1 / resistencia_haste_unica(1.0, comprimento, diametro))
+    return {
+        'resistencia': resistividade / total,
+        'correntes': correntes / total,
+        'fator_utilizacao': paralelo * total,
+        'metodo': metodo,
+        'iteracoes': iteracoes,
+        'hastes': n,
+        'pares_proximos': pares_proximos,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Resistência de arranjos de hastes verticais pela matriz de resistências mútuas.")
+    parser.add_argument('arranjo', choices=['linha', 'anel', 'triangulo', 'quadrado', 'grade', 'csv'],
+                        help="forma do arranjo ('csv' lê colunas x,y de --arquivo)")
+    parser.add_argument('--resistividade', type=float, default=100.0, help="Ω·m (padrão: 100)")
+    parser.add_argument('--comprimento', type=float, default=2.4, help="comprimento das hastes em m")
+    parser.add_argument('--diametro', type=float, default=0.016, help="diâmetro das hastes em m")
+    parser.add_argument('-n', '--hastes', type=int, default=4,
+                        help="hastes (linha, anel), por lado (triângulo, quadrado) ou por fila (grade)")
+    parser.add_argument('--espacamento', type=float, default=3.0,
+                        help="espaçamento (linha, grade), raio (anel) ou lado (triângulo, quadrado) em m")
+    parser.add_argument('--arquivo', help="CSV com colunas x e y (arranjo csv)")
+    parser.add_argument('--metodo', choices=['auto', 'direto', 'aproximado'], default='auto')
+    parser.add_argument('--raio-corte', type=float, help="raio de corte do método aproximado em m")
+    args = parser.parse_args()
+
+    if args.arranjo == 'csv':
+        import csv
+        if not args.arquivo:
+            parser.error("o arranjo csv requer --arquivo")
+        with open(args.arquivo, newline='', encoding='utf-8') as arquivo:
+            posicoes = [(float(linha['x']), float(linha['y'])) for linha in csv.DictReader(arquivo)]
+    else:
+        posicoes = {
+            'linha': lambda: arranjo_linha(args.hastes, args.espacamento),
+            'anel': lambda: arranjo_anel(args.hastes, args.espacamento),
+            'triangulo': lambda: arranjo_triangulo(args.espacamento, args.hastes),
+            'quadrado': lambda: arranjo_quadrado(args.espacamento, args.hastes),
+            'grade': lambda: arranjo_grade(args.hastes, args.hastes, args.espacamento),
+        }[args.arranjo]()
+
+    resultado = resistencia_arranjo(args.resistividade, posicoes, args.comprimento, args.diametro,
+                                    args.metodo, args.raio_corte)
+    R_uma = resistencia_haste_unica(args.resistividade, args.comprimento, args.diametro)
+
+    print("=" * 50)
+    print("ARRANJO DE HASTES - RESISTÊNCIAS MÚTUAS")
+    print("=" * 50)
+    print(f"Hastes: {resultado['hastes']} ({args.arranjo})")
+    print(f"Resistência de uma haste isolada: {R_uma:.2f} Ω")
+    print(f"Resistência do arranjo: {resultado['resistencia']:.3f} Ω")
+    print(f"Fator de utilização: η = {resultado['fator_utilizacao']:.3f}")
+    metodo = resultado['metodo']
+    if resultado['iteracoes'] is not None:
+        metodo += f" ({resultado['iteracoes']} iterações, {resultado['pares_proximos']} pares próximos)"
+    print(f"Método: {metodo}")
@@ -0,0 +1,317 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+
+import numpy as np
+
+from Motor_Calculo import FORMULAS
+
+# Geometria típica de cada tipo (a mesma ordem de parâmetros de FORMULAS)
+PARAMETROS_TIPICOS = {
+    'haste_unica': {'comprimento': 2.4, 'diametro': 0.016},
+    'multiplas_hastes': {'n_hastes': 4, 'comprimento': 3.0, 'diametro': 0.016, 'espacamento': 3.0},
+    'condutor_horizontal': {'comprimento': 20.0, 'diametro': 0.01, 'profundidade': 0.6},
+    'malha': {'area': 36.0, 'comprimento_total': 24.0, 'profundidade': 0.5},
+    'haste_tratada': {'comprimento': 2.4, 'diametro': 0.016, 'diametro_tratamento': 0.15,
+                      'resistividade_tratamento': 2.5},
+    'condutor_tratado': {'comprimento': 20.0, 'diametro': 0.01, 'profundidade': 0.6, 'diametro_tratamento': 0.3,
+                         'resistividade_tratamento': 2.5},
+}
+RESISTIVIDADE_TIPICA = 100.0
+
+SECOES = ['latencia', 'vazao', 'varredura', 'gui', 'memoria']
+# Acima deste tamanho a vazão é medida reavaliando blocos deste tamanho (memória constante)
+ELEMENTOS_POR_BLOCO = 1_000_000
+
+
+def _metrica(valor, unidade, melhor='menor'):
+    return {'valor': float(valor), 'unidade': unidade, 'melhor': melhor}
+
+
+def _entradas_vetoriais(tipo, n, gerador):
+    """ρ e geometria sorteados em ±50% dos valores típicos"""
+    _, nomes = FORMULAS[tipo]
+    tipicos = [RESISTIVIDADE_TIPICA] + [PARAMETROS_TIPICOS[tipo][nome] for nome in nomes]
+    return [valor * gerador.uniform(0.5, 1.5, n) for valor in tipicos]
+
+
+def medir_latencia(repeticoes=5):
+    """Tempo por chamada escalar (caminho math) de cada fórmula"""
+    metricas = {}
+    for tipo, (formula, nomes) in FORMULAS.items():
+        argumentos = [RESISTIVIDADE_TIPICA] + [PARAMETROS_TIPICOS[tipo][nome] for nome in nomes]
+        temporizador = timeit.Timer(lambda: formula(*argumentos))
+        numero, _ = temporizador.autorange()
+        melhor = min(temporizador.repeat(repeticoes, numero)) / numero
+        metricas[f'latencia.{tipo}'] = _metrica(melhor * 1e9, 'ns')
+    return metricas
+
+
+def medir_vazao(tamanhos, repeticoes=3, semente=0):
+    """Elementos avaliados por segundo pela fórmula vetorizada, para cada tamanho de entrada"""
+    gerador = np.random.default_rng(semente)
+    metricas = {}
+    for tipo, (formula, _) in FORMULAS.items():
+        for n in tamanhos:
+            bloco = min(n, ELEMENTOS_POR_BLOCO)
+            entradas = _entradas_vetoriais(tipo, bloco, gerador)
+            blocos = -(-n // bloco)
+            tempos = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                for _ in range(blocos):
+                    formula(*entradas)
+                tempos.append(time.perf_counter() - inicio)
+            metricas[f'vazao.{tipo}.{n:.0e}'] = _metrica(blocos * bloco / min(tempos), 'elementos/s', 'maior')
+    return metricas
+
+
+def medir_varredura(pontos=4_000_000, processos=None):
+    """Tempo de Varredura.varrer (só estatísticas) com 1, 2, 4, ... processos"""
+    from Varredura import varrer
+
+    if processos is None:
+        processos, p = [], 1
+        while p <= (os.cpu_count() or 1):
+            processos.append(p)
+            p *= 2
+    lado = int(pontos ** 0.5)
+    metricas = {}
+    tempo_um = None
+    for p in processos:
+        inicio = time.perf_counter()
+        varrer('haste_unica', processos=p, tamanho_bloco=250_000, armazenar=False,
+               resistividade=np.linspace(10, 5000, lado), comprimento=np.linspace(0.5, 10, lado), diametro=0.016)
+        tempo = time.perf_counter() - inicio
+        tempo_um = tempo_um or tempo
+        metricas[f'varredura.{p}_processos'] = _metrica(tempo, 's')
+        metricas[f'varredura.{p}_processos.aceleracao'] = _metrica(tempo_um / tempo, 'x', 'maior')
+    return metricas
+
+
+@contextmanager
+def display_virtual():
+    """Garante um display para o Tk: usa o atual ou sobe um Xvfb temporário. Produz False se não houver"""
+    if os.name == 'nt' or sys.platform == 'darwin' or os.environ.get('DISPLAY'):
+        yield True
+        return
+    xvfb = shutil.which('Xvfb')
+    if xvfb is None:
+        yield False
+        return
+    processo = subprocess.Popen([xvfb, ':99', '-screen', '0', '1280x1024x24'],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ['DISPLAY'] = ':99'
+    time.sleep(0.5)
+    try:
+        yield True
+    finally:
+        del os.environ['DISPLAY']
+        processo.terminate()
+        processo.wait()
+
+
+def medir_gui(iteracoes=500):
+    """
+    Latência do recálculo ao vivo da calculadora Tk (entrada → rótulos atualizados e
+    layout refeito) e de uma atualização de slider da demonstração matplotlib (Agg).
+    """
+    metricas = {}
+
+    with display_virtual() as disponivel:
+        if disponivel:
+            import tkinter as tk
+            from Calculo_Geral_Aterramento import CalculadoraAterramento
+
+            root = tk.Tk()
+            app = CalculadoraAterramento(root)
+            app.opcao_var.set("1")
+            app.mostrar_campos()
+            app.resistividade_var.set("100")
+            app.campos_haste_unica['diametro'].variavel.set("0.016")
+            comprimento = app.campos_haste_unica['comprimento'].variavel
+
+            tempos = []
+            for i in range(iteracoes):
+                comprimento.set(f"{0.5 + (i % 200) / 20:.2f}")
+                inicio = time.perf_counter()
+                app.recalcular_ao_vivo()
+                root.update_idletasks()
+                tempos.append(time.perf_counter() - inicio)
+            app.fechar()
+            metricas['gui.tk.recalculo_mediana'] = _metrica(1e3 * np.median(tempos), 'ms')
+            metricas['gui.tk.recalculo_p99'] = _metrica(1e3 * np.percentile(tempos, 99), 'ms')
+        else:
+            print("⚠️  Sem display nem Xvfb: latência da interface Tk não medida", file=sys.stderr)
+
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot as plt
+    from Interface_Grafica import DemonstracaoAterramentoSeparada
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # glifos de emoji ausentes nas fontes padrão
+        demo = DemonstracaoAterramentoSeparada()
+        demo.fig_controles.canvas.draw()
+        demo.fig_principal.canvas.draw()
+        n = max(20, iteracoes // 10)
+        inicio = time.perf_counter()
+        for i in range(n):
+            demo.slider_L.set_val(0.5 + (i % 90) / 10)
+        metricas['gui.demo.atualizacao_slider'] = _metrica(1e3 * (time.perf_counter() - inicio) / n, 'ms')
+    plt.close('all')
+    return metricas
+
+
+@contextmanager
+def _pico_memoria(metricas, nome):
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        metricas[f'memoria.{nome}'] = _metrica(pico / 2 ** 20, 'MiB')
+
+
+def medir_memoria(registros_lote=50_000, semente=0):
+    """Pico de memória alocada (tracemalloc) nos caminhos vetorizado, lote, varredura e Monte Carlo"""
+    from Calculo_Lote import processar_arquivo
+    from Monte_Carlo import simular
+    from Varredura import varrer
+
+    metricas = {}
+    gerador = np.random.default_rng(semente)
+
+    entradas = _entradas_vetoriais('multiplas_hastes', 1_000_000, gerador)
+    formula, _ = FORMULAS['multiplas_hastes']
+    with _pico_memoria(metricas, 'vetorizado_1e6'):
+        formula(*entradas)
+    del entradas
+
+    with tempfile.TemporaryDirectory() as pasta:
+        entrada = os.path.join(pasta, 'sites.csv')
+        with open(entrada, 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(['tipo', 'resistividade', 'comprimento', 'diametro'])
+            for rho, L in zip(gerador.uniform(10, 1000, registros_lote), gerador.uniform(1, 6, registros_lote)):
+                escritor.writerow(['1', f'{rho:.1f}', f'{L:.2f}', '0.016'])
+        with _pico_memoria(metricas, 'lote_csv'):
+            processar_arquivo(entrada, os.path.join(pasta, 'saida.csv'), tamanho_bloco=10000)
+
+    with _pico_memoria(metricas, 'varredura_estatisticas'):
+        varrer('haste_unica', processos=1, tamanho_bloco=250_000, armazenar=False,
+               resistividade=np.linspace(10, 5000, 2000), comprimento=np.linspace(0.5, 10, 2000), diametro=0.016)
+
+    with _pico_memoria(metricas, 'monte_carlo_1e6'):
+        simular('haste_unica', {'resistividade': ('lognormal', 100, 0.5),
+                                'comprimento': ('tolerancia', 2.4, 0.02), 'diametro': 0.016},
+                n_amostras=1_000_000, semente=semente)
+    return metricas
+
+
+def executar_benchmark(secoes=SECOES, max_elementos=10 ** 7, iteracoes_gui=500):
+    tamanhos = [10 ** k for k in range(3, 9) if 10 ** k <= max_elementos]
+    medidores = {
+        'latencia': medir_latencia,
+        'vazao': lambda: medir_vazao(tamanhos),
+        'varredura': medir_varredura,
+        'gui': lambda: medir_gui(iteracoes_gui),
+        'memoria': medir_memoria,
+    }
+    metricas = {}
+    for secao in secoes:
+        print(f"⏱️  {secao}...", file=sys.stderr)
+        metricas.update(medidores[secao]())
+
+    return {
+        'metadados': {
+            'data': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'processadores': os.cpu_count(),
+        },
+        'metricas': metricas,
+    }
+
+
+def comparar(atual, base, tolerancia=0.2):
+    """
+    Compara as métricas em comum com uma execução de referência.
+    Retorna [(nome, base, atual, piora)], piora relativa > 0 quando o resultado ficou pior.
+    """
+    comparacoes = []
+    for nome, metrica in atual['metricas'].items():
+        referencia = base['metricas'].get(nome)
+        if referencia is None or referencia['valor'] <= 0 or metrica['valor'] <= 0:
+            continue
+        if metrica['melhor'] == 'menor':
+            piora = metrica['valor'] / referencia['valor'] - 1
+        else:
+            piora = referencia['valor'] / metrica['valor'] - 1
+        comparacoes.append((nome, referencia['valor'], metrica['valor'], piora))
+    return comparacoes
+
+
+def imprimir_relatorio(resultado, comparacoes=None, tolerancia=0.2):
+    print("=" * 78)
+    print("BENCHMARK DE DESEMPENHO")
+    print("=" * 78)
+    for chave, valor in resultado['metadados'].items():
+        print(f"{chave}: {valor}")
+    print("-" * 78)
+
+    piora = {nome: (antes, p) for nome, antes, _, p in comparacoes or []}
+    for nome, metrica in resultado['metricas'].items():
+        linha = f"{nome:<44}{metrica['valor']:>14.4g} {metrica['unidade']:<12}"
+        if nome in piora:
+            antes, p = piora[nome]
+            marca = "❌" if p > tolerancia else ("✅" if p < -tolerancia else "  ")
+            linha += f" {marca} {-100 * p:+.0f}% (base {antes:.4g})"
+        print(linha)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark das fórmulas e pontos de entrada da calculadora de aterramento.")
+    parser.add_argument('--secoes', nargs='+', choices=SECOES, default=SECOES,
+                        help="partes a medir (padrão: todas)")
+    parser.add_argument('--max-elementos', type=float, default=1e7,
+                        help="maior tamanho da medição de vazão vetorizada, até 1e8 (padrão: 1e7)")
+    parser.add_argument('--iteracoes-gui', type=int, default=500,
+                        help="recálculos medidos na interface Tk (padrão: 500)")
+    parser.add_argument('--saida', help="grava os resultados neste arquivo JSON")
+    parser.add_argument('--base', help="JSON de uma execução anterior para detectar regressões")
+    parser.add_argument('--tolerancia', type=float, default=0.2,
+                        help="piora relativa aceita antes de acusar regressão (padrão: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    resultado = executar_benchmark(args.secoes, int(args.max_elementos), args.iteracoes_gui)
+
+    comparacoes = None
+    if args.base:
+        with open(args.base, encoding='utf-8') as arquivo:
+            comparacoes = comparar(resultado, json.load(arquivo), args.tolerancia)
+
+    imprimir_relatorio(resultado, comparacoes, args.tolerancia)
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+
+    regressoes = [nome for nome, _, _, piora in comparacoes or [] if piora > args.tolerancia]
+    if regressoes:
+        print(f"\n❌ {len(regressoes)} regressão(ões) acima de {100 * args.tolerancia:.0f}%: {', '.join(regressoes)}")
+        sys.exit(1)
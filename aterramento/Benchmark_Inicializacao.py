@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Pontos de entrada medidos por padrão: núcleo, CLIs, calculadora Tk e demonstração matplotlib
+MODULOS_PADRAO = ['Motor_Calculo', 'Cache_Calculo', 'Calculo_Simples', 'Calculo_Lote', 'Calculo_Geral_Aterramento',
+                  'Interface_Grafica']
+# Dependências pesadas cuja importação é sinalizada no relatório
+DEPENDENCIAS_PESADAS = ['numpy', 'matplotlib', 'tkinter', 'concurrent.futures']
+
+
+def _executar(codigo, importtime=False):
+    comando = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', codigo]
+    inicio = time.perf_counter()
+    processo = subprocess.run(comando, cwd=DIRETORIO, capture_output=True, text=True)
+    duracao = time.perf_counter() - inicio
+    if processo.returncode != 0:
+        raise RuntimeError(f"Falha ao executar {codigo!r}:\n{processo.stderr}")
+    return duracao, processo.stderr
+
+
+def ler_importtime(saida):
+    """
+    Linhas de 'python -X importtime': {'modulo': (próprio_us, cumulativo_us, nível)}.
+    O nível vem da indentação do nome (0 = importado diretamente pelo código).
+    """
+    modulos = {}
+    for linha in saida.splitlines():
+        if not linha.startswith('import time:') or '|' not in linha:
+            continue
+        proprio, cumulativo, nome = linha[len('import time:'):].split('|')
+        if not proprio.strip().isdigit():
+            continue  # cabeçalho
+        nivel = (len(nome) - len(nome.lstrip()) - 1) // 2
+        modulos[nome.strip()] = (int(proprio), int(cumulativo), nivel)
+    return modulos
+
+
+def medir_inicializacao(codigo, repeticoes=5):
+    """Tempo de parede de um processo novo executando codigo (mediana) e o perfil de importações"""
+    tempos = [_executar(codigo)[0] for _ in range(repeticoes)]
+    _, saida = _executar(codigo, importtime=True)
+    modulos = ler_importtime(saida)
+    return {
+        'tempo_ms': 1000 * statistics.median(tempos),
+        'importacao_ms': sum(c for _, c, nivel in modulos.values() if nivel == 0) / 1000,
+        'modulos_importados': len(modulos),
+        'dependencias_pesadas': [d for d in DEPENDENCIAS_PESADAS if d in modulos],
+        'mais_lentos': sorted(((nome, c / 1000) for nome, (_, c, nivel) in modulos.items() if nivel <= 1),
+                              key=lambda item: -item[1])[:5],
+    }
+
+
+def executar_benchmark(modulos=MODULOS_PADRAO, repeticoes=5):
+    resultados = {'interpretador': medir_inicializacao('pass', repeticoes)}
+    resultados['calculo_escalar'] = medir_inicializacao(
+        "import Motor_Calculo; Motor_Calculo.calcular('haste_unica', 100.0, comprimento=2.4, diametro=0.016)",
+        repeticoes)
+    for modulo in modulos:
+        resultados[modulo] = medir_inicializacao(f'import {modulo}', repeticoes)
+    return resultados
+
+
+def imprimir_relatorio(resultados):
+    base = resultados['interpretador']['tempo_ms']
+    print("=" * 78)
+    print("TEMPO DE INICIALIZAÇÃO (processo novo, mediana)")
+    print("=" * 78)
+    print(f"{'Ponto de entrada':<28}{'Total (ms)':>11}{'- base (ms)':>13}{'Imports (ms)':>14}  Pesadas")
+    print("-" * 78)
+    for nome, r in resultados.items():
+        pesadas = ", ".join(r['dependencias_pesadas']) or "-"
+        print(f"{nome:<28}{r['tempo_ms']:>11.1f}{r['tempo_ms'] - base:>13.1f}{r['importacao_ms']:>14.1f}  {pesadas}")
+
+    print("\nImportações mais lentas por ponto de entrada (cumulativo, ms):")
+    for nome, r in resultados.items():
+        if nome == 'interpretador':
+            continue
+        lentos = ", ".join(f"{modulo} {ms:.1f}" for modulo, ms in r['mais_lentos'])
+        print(f"  {nome}: {lentos}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Mede o tempo de partida dos módulos da calculadora com 'python -X importtime'.")
+    parser.add_argument('modulos', nargs='*', default=MODULOS_PADRAO,
+                        help="módulos a importar (padrão: núcleo, CLI, interface Tk e demonstração)")
+    parser.add_argument('--repeticoes', type=int, default=5,
+                        help="processos por medição; o relatório usa a mediana (padrão: 5)")
+    parser.add_argument('--json', help="grava os resultados também neste arquivo JSON")
+    args = parser.parse_args()
+
+    resultados = executar_benchmark(args.modulos, args.repeticoes)
+    imprimir_relatorio(resultados)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
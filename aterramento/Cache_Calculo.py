@@ -0,0 +1,88 @@
+import os
+import threading
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """Cache limitado com descarte do item usado há mais tempo (LRU) e estatísticas"""
+
+    def __init__(self, tamanho_maximo=1024):
+        if tamanho_maximo < 0:
+            raise ValueError("tamanho_maximo deve ser >= 0")
+        self.tamanho_maximo = tamanho_maximo
+        self.acertos = 0
+        self.falhas = 0
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+
+    @staticmethod
+    def chave(formula, parametros):
+        """Chave canônica: nome da fórmula + parâmetros ordenados, com floats normalizados"""
+        return (formula,) + tuple(sorted((nome, float(f"{float(valor):.12g}"))
+                                         for nome, valor in parametros.items()))
+
+    def obter(self, formula, parametros, calcular_valor):
+        """Retorna o valor em cache ou calcula com calcular_valor() e armazena"""
+        encontrado, valor = self.consultar(formula, parametros)
+        if encontrado:
+            return valor
+
+        # Calcula fora da trava para não serializar fórmulas lentas
+        valor = calcular_valor()
+        self.armazenar(formula, parametros, valor)
+        return valor
+
+    def consultar(self, formula, parametros):
+        """(True, valor) se a entrada está em cache, (False, None) caso contrário"""
+        chave = self.chave(formula, parametros)
+        with self._trava:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return True, self._itens[chave]
+            self.falhas += 1
+            return False, None
+
+    def armazenar(self, formula, parametros, valor):
+        chave = self.chave(formula, parametros)
+        with self._trava:
+            if self.tamanho_maximo > 0:
+                self._itens[chave] = valor
+                self._itens.move_to_end(chave)
+                while len(self._itens) > self.tamanho_maximo:
+                    self._itens.popitem(last=False)
+
+    def redimensionar(self, tamanho_maximo):
+        if tamanho_maximo < 0:
+            raise ValueError("tamanho_maximo deve ser >= 0")
+        with self._trava:
+            self.tamanho_maximo = tamanho_maximo
+            while len(self._itens) > tamanho_maximo:
+                self._itens.popitem(last=False)
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+            self.acertos = 0
+            self.falhas = 0
+
+    def estatisticas(self):
+        with self._trava:
+            consultas = self.acertos + self.falhas
+            return {
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+                'tamanho': len(self._itens),
+                'tamanho_maximo': self.tamanho_maximo,
+            }
+
+    def __len__(self):
+        return len(self._itens)
+
+
+# Cache compartilhado pelas curvas da demonstração. Só vale a pena para resultados caros
+# (curvas, tiles do mapa): montar a chave e tomar a trava custa mais que uma fórmula
+# fechada, que é sempre chamada direto do Motor_Calculo.
+# O tamanho pode ser ajustado pela variável de ambiente ATERRAMENTO_CACHE.
+cache_global = CacheLRU(int(os.environ.get('ATERRAMENTO_CACHE', 1024)))
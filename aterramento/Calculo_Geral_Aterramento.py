@@ -2,6 +2,17 @@ import math
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from Motor_Calculo import CLASSIFICACOES, calcular, classificar_norma, gerar_sugestoes
+from Execucao_Segundo_Plano import ExecutorTarefas
+from Instrumentacao import etapa
+
+# Pausa na digitação antes do recálculo automático (ms)
+ATRASO_RECALCULO_MS = 150
+
+# Marca e cor de cada índice de CLASSIFICACOES
+MARCAS_CLASSIFICACAO = ("✅", "✅", "✅", "❌")
+CORES_CLASSIFICACAO = ('#27ae60', '#2ecc71', '#f39c12', '#e74c3c')
+
 class CalculadoraAterramento:
     def __init__(self, root):
         self.root = root
@@ -18,6 +29,15 @@ class CalculadoraAterramento:
         self.campos_multiplas_hastes = {}
         self.campos_condutor_horizontal = {}
         self.campos_malha = {}
+        self.frames_campos = {}
+        
+        self.recalculo_ao_vivo = tk.BooleanVar(value=False)
+        self.recalculo_agendado = None
+        self.resistividade_var.trace_add('write', self.agendar_recalculo)
+        
+        self.executor = ExecutorTarefas(self.root)
+        self.tarefa_atual = None
+        self.root.protocol("WM_DELETE_WINDOW", self.fechar)
         
         self.criar_interface()
     
@@ -102,44 +122,60 @@ class CalculadoraAterramento:
         self.frame_campos = ttk.LabelFrame(main_frame, text="📝 DADOS DO ELETRODO", padding="15")
         self.frame_campos.pack(fill="x", pady=(0, 15))
         
+        self.criar_campos_haste_unica()
+        self.criar_campos_multiplas_hastes()
+        self.criar_campos_condutor_horizontal()
+        self.criar_campos_malha()
+        
         
-        btn_frame = ttk.Frame(main_frame)
-        btn_frame.pack(fill="x", pady=10)
+        self.btn_frame = ttk.Frame(main_frame)
+        self.btn_frame.pack(fill="x", pady=10)
         
-        self.btn_calcular = ttk.Button(btn_frame, text="🧮 CALCULAR RESISTÊNCIA", 
+        self.btn_calcular = ttk.Button(self.btn_frame, text="🧮 CALCULAR RESISTÊNCIA", 
                   command=self.calcular, style='Botao.TButton')
         self.btn_calcular.pack(pady=10)
         
+        ttk.Checkbutton(self.btn_frame, text="⚡ Recalcular automaticamente ao digitar", 
+                       variable=self.recalculo_ao_vivo, command=self.agendar_recalculo).pack()
         
-        self.frame_resultado = ttk.LabelFrame(main_frame, text="📊 RESULTADO", padding="20")
-        self.frame_resultado.pack(fill="x", pady=(10, 0))
         
+        self.progresso_frame = ttk.Frame(main_frame)
         
-        self.frame_resultado.pack_forget()
+        self.barra_progresso = ttk.Progressbar(self.progresso_frame, mode='indeterminate', length=400)
+        self.barra_progresso.pack(side="left", padx=(0, 10))
+        
+        ttk.Button(self.progresso_frame, text="✖ Cancelar", 
+                  command=self.cancelar_calculo).pack(side="left")
+        
+        
+        self.frame_resultado = ttk.LabelFrame(main_frame, text="📊 RESULTADO", padding="20")
+        self.criar_resultado()
     
     def mostrar_campos(self):
-      
-        for widget in self.frame_campos.winfo_children():
-            widget.destroy()
+        # Os campos de cada tipo são criados uma única vez; aqui só se troca o frame visível
+        for frame in self.frames_campos.values():
+            frame.pack_forget()
         
         opcao = self.opcao_var.get()
         
-        if opcao == "1":
-            self.criar_campos_haste_unica()
-        elif opcao == "2":
-            self.criar_campos_multiplas_hastes()
-        elif opcao == "3":
-            self.criar_campos_condutor_horizontal()
-        elif opcao == "4":
-            self.criar_campos_malha()
+        if opcao in self.frames_campos:
+            self.frames_campos[opcao].pack(fill="x")
         
        
         self.frame_resultado.pack_forget()
+        self.agendar_recalculo()
+    
+    def criar_entrada(self, master):
+        variavel = tk.StringVar()
+        variavel.trace_add('write', self.agendar_recalculo)
+        entrada = ttk.Entry(master, textvariable=variavel, width=15, font=('Arial', 11))
+        entrada.variavel = variavel
+        return entrada
     
     def criar_campos_haste_unica(self):
         
         inner_frame = ttk.Frame(self.frame_campos)
-        inner_frame.pack(fill="x")
+        self.frames_campos["1"] = inner_frame
         
         ttk.Label(inner_frame, text="Haste Vertical Única", 
                  style='Subtitulo.TLabel').grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 15))
@@ -151,7 +187,7 @@ class CalculadoraAterramento:
         
         for i, (label, key, exemplo) in enumerate(campos):
             ttk.Label(inner_frame, text=label, style='Grande.TLabel').grid(row=1+i, column=0, sticky="w", pady=8)
-            self.campos_haste_unica[key] = ttk.Entry(inner_frame, width=15, font=('Arial', 11))
+            self.campos_haste_unica[key] = self.criar_entrada(inner_frame)
             self.campos_haste_unica[key].grid(row=1+i, column=1, sticky="w", pady=8, padx=(10, 0))
             
             ttk.Label(inner_frame, text=exemplo, style='Normal.TLabel', 
@@ -159,7 +195,7 @@ class CalculadoraAterramento:
     
     def criar_campos_multiplas_hastes(self):
         inner_frame = ttk.Frame(self.frame_campos)
-        inner_frame.pack(fill="x")
+        self.frames_campos["2"] = inner_frame
         
         ttk.Label(inner_frame, text="Múltiplas Hastes em Linha", 
                  style='Subtitulo.TLabel').grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 15))
@@ -173,7 +209,7 @@ class CalculadoraAterramento:
         
         for i, (label, key, exemplo) in enumerate(campos):
             ttk.Label(inner_frame, text=label, style='Grande.TLabel').grid(row=1+i, column=0, sticky="w", pady=8)
-            self.campos_multiplas_hastes[key] = ttk.Entry(inner_frame, width=15, font=('Arial', 11))
+            self.campos_multiplas_hastes[key] = self.criar_entrada(inner_frame)
             self.campos_multiplas_hastes[key].grid(row=1+i, column=1, sticky="w", pady=8, padx=(10, 0))
             
             ttk.Label(inner_frame, text=exemplo, style='Normal.TLabel', 
@@ -181,7 +217,7 @@ class CalculadoraAterramento:
     
     def criar_campos_condutor_horizontal(self):
         inner_frame = ttk.Frame(self.frame_campos)
-        inner_frame.pack(fill="x")
+        self.frames_campos["3"] = inner_frame
         
         ttk.Label(inner_frame, text="Condutor Horizontal Enterrado", 
                  style='Subtitulo.TLabel').grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 15))
@@ -201,7 +237,7 @@ class CalculadoraAterramento:
         
         for i, (label, key, exemplo) in enumerate(campos):
             ttk.Label(inner_frame, text=label, style='Grande.TLabel').grid(row=2+i, column=0, sticky="w", pady=8)
-            self.campos_condutor_horizontal[key] = ttk.Entry(inner_frame, width=15, font=('Arial', 11))
+            self.campos_condutor_horizontal[key] = self.criar_entrada(inner_frame)
             self.campos_condutor_horizontal[key].grid(row=2+i, column=1, sticky="w", pady=8, padx=(10, 0))
             
             ttk.Label(inner_frame, text=exemplo, style='Normal.TLabel', 
@@ -209,7 +245,7 @@ class CalculadoraAterramento:
     
     def criar_campos_malha(self):
         inner_frame = ttk.Frame(self.frame_campos)
-        inner_frame.pack(fill="x")
+        self.frames_campos["4"] = inner_frame
         
         ttk.Label(inner_frame, text="Malha de Aterramento", 
                  style='Subtitulo.TLabel').grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 15))
@@ -222,60 +258,117 @@ class CalculadoraAterramento:
         
         for i, (label, key, exemplo) in enumerate(campos):
             ttk.Label(inner_frame, text=label, style='Grande.TLabel').grid(row=1+i, column=0, sticky="w", pady=8)
-            self.campos_malha[key] = ttk.Entry(inner_frame, width=15, font=('Arial', 11))
+            self.campos_malha[key] = self.criar_entrada(inner_frame)
             self.campos_malha[key].grid(row=1+i, column=1, sticky="w", pady=8, padx=(10, 0))
             
             ttk.Label(inner_frame, text=exemplo, style='Normal.TLabel', 
                      foreground='#666').grid(row=1+i, column=2, sticky="w", padx=(10, 0), pady=8)
     
+    @etapa('leitura')
     def obter_valor(self, entry_widget):
         try:
             return float(entry_widget.get())
         except ValueError:
             return None
     
-    def calcular(self):
-        
+    def ler_campos(self, campos):
+        # Lido na thread principal: os widgets do Tk não podem ser acessados pelo cálculo
+        return {key: self.obter_valor(entry) for key, entry in campos.items()}
+    
+    def preparar_calculo(self, avisar=False):
+        """Lê tipo, resistividade e campos na thread principal; None se faltar algo"""
         try:
             resistividade_solo = float(self.resistividade_var.get())
         except ValueError:
-            messagebox.showerror("Erro", "❌ Digite um valor válido para a resistividade do solo!")
-            return
+            if avisar:
+                messagebox.showerror("Erro", "❌ Digite um valor válido para a resistividade do solo!")
+            return None
         
         opcao = self.opcao_var.get()
         
         if not opcao:
-            messagebox.showerror("Erro", "❌ Selecione um tipo de eletrodo!")
-            return
+            if avisar:
+                messagebox.showerror("Erro", "❌ Selecione um tipo de eletrodo!")
+            return None
         
-        try:
-            if opcao == "1":
-                resultado = self.calcular_haste_unica(resistividade_solo)
-            elif opcao == "2":
-                resultado = self.calcular_multiplas_hastes(resistividade_solo)
-            elif opcao == "3":
-                resultado = self.calcular_condutor_horizontal(resistividade_solo)
-            elif opcao == "4":
-                resultado = self.calcular_malha(resistividade_solo)
-            else:
+        calculos = {
+            "1": (self.calcular_haste_unica, self.campos_haste_unica),
+            "2": (self.calcular_multiplas_hastes, self.campos_multiplas_hastes),
+            "3": (self.calcular_condutor_horizontal, self.campos_condutor_horizontal),
+            "4": (self.calcular_malha, self.campos_malha)
+        }
+        
+        if opcao not in calculos:
+            if avisar:
                 messagebox.showerror("Erro", "❌ Selecione uma opção válida!")
-                return
-            
-            self.mostrar_resultado(resultado, resistividade_solo)
-            
-        except ValueError as e:
+            return None
+        
+        funcao, campos = calculos[opcao]
+        return funcao, resistividade_solo, self.ler_campos(campos)
+    
+    @etapa('calcular')
+    def calcular(self):
+        
+        calculo = self.preparar_calculo(avisar=True)
+        if calculo is None:
+            return
+        funcao, resistividade_solo, valores = calculo
+        
+        if self.tarefa_atual is not None:
+            self.tarefa_atual.cancelar()
+        
+        self.iniciar_progresso()
+        self.tarefa_atual = self.executor.executar(
+            lambda tarefa: funcao(resistividade_solo, valores),
+            ao_concluir=lambda resultado: self.concluir_calculo(resultado, resistividade_solo),
+            ao_erro=self.falha_calculo
+        )
+    
+    def concluir_calculo(self, resultado, resistividade_solo):
+        self.parar_progresso()
+        
+        if not math.isfinite(resultado['resistencia']) or resultado['resistencia'] <= 0:
             messagebox.showerror("Erro", "❌ Digite valores numéricos válidos em todos os campos!")
-        except Exception as e:
-            messagebox.showerror("Erro", f"❌ Erro inesperado: {e}")
+            return
+        
+        self.mostrar_resultado(resultado, resistividade_solo)
     
-    def calcular_haste_unica(self, resistividade_solo):
-        comprimento = self.obter_valor(self.campos_haste_unica['comprimento'])
-        diametro = self.obter_valor(self.campos_haste_unica['diametro'])
+    def falha_calculo(self, erro):
+        self.parar_progresso()
+        
+        if isinstance(erro, ValueError):
+            messagebox.showerror("Erro", "❌ Digite valores numéricos válidos em todos os campos!")
+        else:
+            messagebox.showerror("Erro", f"❌ Erro inesperado: {erro}")
+    
+    def iniciar_progresso(self):
+        # Fórmulas fechadas não têm etapas a reportar: a barra só indica que há tarefa em curso
+        self.progresso_frame.pack(fill="x", pady=(0, 10), after=self.btn_frame)
+        self.barra_progresso.start(15)
+    
+    def parar_progresso(self):
+        self.barra_progresso.stop()
+        self.progresso_frame.pack_forget()
+        self.tarefa_atual = None
+    
+    def fechar(self):
+        self.executor.encerrar()
+        self.root.destroy()
+    
+    def cancelar_calculo(self):
+        if self.tarefa_atual is not None:
+            self.tarefa_atual.cancelar()
+        self.parar_progresso()
+    
+    @etapa('formula', tipo='haste_unica')
+    def calcular_haste_unica(self, resistividade_solo, valores):
+        comprimento = valores['comprimento']
+        diametro = valores['diametro']
         
         if comprimento is None or diametro is None:
             raise ValueError("Valores inválidos")
         
-        R = (resistividade_solo / (2 * math.pi * comprimento)) * (math.log((4 * comprimento) / diametro) - 1)
+        R = calcular('haste_unica', resistividade_solo, comprimento=comprimento, diametro=diametro)
         
         return {
             'resistencia': R,
@@ -283,20 +376,19 @@ class CalculadoraAterramento:
             'detalhes': {'comprimento': comprimento, 'diametro': diametro}
         }
     
-    def calcular_multiplas_hastes(self, resistividade_solo):
-        n_hastes = int(self.obter_valor(self.campos_multiplas_hastes['n_hastes']))
-        comprimento = self.obter_valor(self.campos_multiplas_hastes['comprimento'])
-        diametro = self.obter_valor(self.campos_multiplas_hastes['diametro'])
-        espacamento = self.obter_valor(self.campos_multiplas_hastes['espacamento'])
+    @etapa('formula', tipo='multiplas_hastes')
+    def calcular_multiplas_hastes(self, resistividade_solo, valores):
+        n_hastes = valores['n_hastes']
+        comprimento = valores['comprimento']
+        diametro = valores['diametro']
+        espacamento = valores['espacamento']
         
         if any(v is None for v in [n_hastes, comprimento, diametro, espacamento]):
             raise ValueError("Valores inválidos")
         
-       
-        R = resistividade_solo / (2 * math.pi * n_hastes * comprimento) * (
-            math.log(4 * comprimento / diametro) - 1 + 
-            2 * (comprimento / espacamento) * math.log(2 * n_hastes / math.pi)
-        )
+        n_hastes = int(n_hastes)
+        R = calcular('multiplas_hastes', resistividade_solo, n_hastes=n_hastes,
+                      comprimento=comprimento, diametro=diametro, espacamento=espacamento)
         
         return {
             'resistencia': R,
@@ -309,20 +401,17 @@ class CalculadoraAterramento:
             }
         }
     
-    def calcular_condutor_horizontal(self, resistividade_solo):
-        comprimento = self.obter_valor(self.campos_condutor_horizontal['comprimento'])
-        diametro = self.obter_valor(self.campos_condutor_horizontal['diametro'])
-        profundidade = self.obter_valor(self.campos_condutor_horizontal['profundidade'])
+    @etapa('formula', tipo='condutor_horizontal')
+    def calcular_condutor_horizontal(self, resistividade_solo, valores):
+        comprimento = valores['comprimento']
+        diametro = valores['diametro']
+        profundidade = valores['profundidade']
         
         if any(v is None for v in [comprimento, diametro, profundidade]):
             raise ValueError("Valores inválidos")
         
-        
-        R = (resistividade_solo / (2 * math.pi * comprimento)) * (
-            math.log(2 * comprimento / diametro) + 
-            math.log(comprimento / (2 * profundidade)) - 
-            2 + (2 * profundidade / comprimento)
-        )
+        R = calcular('condutor_horizontal', resistividade_solo, comprimento=comprimento,
+                      diametro=diametro, profundidade=profundidade)
         
         return {
             'resistencia': R,
@@ -335,15 +424,17 @@ class CalculadoraAterramento:
             }
         }
     
-    def calcular_malha(self, resistividade_solo):
-        area = self.obter_valor(self.campos_malha['area'])
-        comprimento_total = self.obter_valor(self.campos_malha['comprimento_total'])
-        profundidade = self.obter_valor(self.campos_malha['profundidade'])
+    @etapa('formula', tipo='malha')
+    def calcular_malha(self, resistividade_solo, valores):
+        area = valores['area']
+        comprimento_total = valores['comprimento_total']
+        profundidade = valores['profundidade']
         
         if any(v is None for v in [area, comprimento_total, profundidade]):
             raise ValueError("Valores inválidos")
         
-        R = resistividade_solo * (1/comprimento_total + 1/math.sqrt(20*area)) * (1 + 1/(1 + profundidade * math.sqrt(area/10)))
+        R = calcular('malha', resistividade_solo, area=area,
+                      comprimento_total=comprimento_total, profundidade=profundidade)
         
         return {
             'resistencia': R,
@@ -351,29 +442,23 @@ class CalculadoraAterramento:
             'detalhes': {'area': area, 'comprimento_total': comprimento_total, 'profundidade': profundidade}
         }
     
-    def mostrar_resultado(self, resultado, resistividade_solo):
-        
-        for widget in self.frame_resultado.winfo_children():
-            widget.destroy()
-        
-        resistencia = resultado['resistencia']
-        configuracao = resultado['configuracao']
-        detalhes = resultado['detalhes']
-        
-        
-        self.frame_resultado.pack(fill="x", pady=(10, 0))
-        
-        
-        ttk.Label(self.frame_resultado, text=f"📋 Configuração: {configuracao}", 
+    def criar_resultado(self):
+        # Widgets do resultado criados uma vez; cada cálculo só atualiza os textos
+        self.texto_configuracao = tk.StringVar()
+        self.texto_resistividade = tk.StringVar()
+        self.texto_resistencia = tk.StringVar()
+        self.texto_status = tk.StringVar()
+        self.texto_sugestoes = tk.StringVar()
+        
+        ttk.Label(self.frame_resultado, textvariable=self.texto_configuracao, 
                  style='Subtitulo.TLabel').pack(anchor="w", pady=5)
         
+        self.label_formula = ttk.Label(self.frame_resultado, text=f"📐 Fórmula aplicada: Dwight para condutor horizontal", 
+                                      style='Normal.TLabel', foreground='#666', font=('Arial', 10, 'italic'))
         
-        if configuracao == 'Condutor horizontal enterrado':
-            ttk.Label(self.frame_resultado, text=f"📐 Fórmula aplicada: Dwight para condutor horizontal", 
-                     style='Normal.TLabel', foreground='#666', font=('Arial', 10, 'italic')).pack(anchor="w", pady=2)
-        
-        ttk.Label(self.frame_resultado, text=f"🌱 Resistividade do solo: {resistividade_solo} Ω.m", 
-                 style='Grande.TLabel').pack(anchor="w", pady=2)
+        self.label_resistividade = ttk.Label(self.frame_resultado, textvariable=self.texto_resistividade, 
+                                            style='Grande.TLabel')
+        self.label_resistividade.pack(anchor="w", pady=2)
         
         
         separator1 = ttk.Separator(self.frame_resultado, orient='horizontal')
@@ -383,7 +468,7 @@ class CalculadoraAterramento:
         ttk.Label(self.frame_resultado, text=f"🧮 Resistência de aterramento calculada:", 
                  style='Grande.TLabel').pack(anchor="w", pady=2)
         
-        ttk.Label(self.frame_resultado, text=f"{resistencia:.2f} Ω", 
+        ttk.Label(self.frame_resultado, textvariable=self.texto_resistencia, 
                  font=('Arial', 20, 'bold'), foreground='#2c3e50').pack(anchor="w", pady=(0, 10))
         
         
@@ -394,82 +479,103 @@ class CalculadoraAterramento:
         ttk.Label(self.frame_resultado, text="📊 ANÁLISE CONFORME NORMAS:", 
                  style='Subtitulo.TLabel').pack(anchor="w", pady=(10, 5))
         
-        if resistencia <= 1.0:
-            status_text = "✅ EXCELENTE - Atende: Sistemas de equipamentos sensíveis (≤ 1 Ω)"
-            cor = '#27ae60'
-        elif resistencia <= 5.0:
-            status_text = "✅ ÓTIMO - Atende: Sistemas de telecomunicações (≤ 5 Ω)"
-            cor = '#2ecc71'
-        elif resistencia <= 10.0:
-            status_text = "✅ BOM - Atende: Sistemas de potência e para-raios (≤ 10 Ω)"
-            cor = '#f39c12'
-        else:
-            status_text = "❌ PRECISA MELHORAR - Não atende: Resistência acima dos limites normativos (> 10 Ω)"
-            cor = '#e74c3c'
+        self.label_status = ttk.Label(self.frame_resultado, textvariable=self.texto_status, 
+                                     font=('Arial', 11, 'bold'))
+        self.label_status.pack(anchor="w", pady=5)
         
-        status_label = ttk.Label(self.frame_resultado, text=status_text, 
-                               font=('Arial', 11, 'bold'), foreground=cor)
-        status_label.pack(anchor="w", pady=5)
         
+        self.frame_sugestoes = ttk.Frame(self.frame_resultado)
         
-        if resistencia > 10.0:
-            separator3 = ttk.Separator(self.frame_resultado, orient='horizontal')
-            separator3.pack(fill="x", pady=10)
-            
-            ttk.Label(self.frame_resultado, text="💡 SUGESTÕES PARA REDUZIR A RESISTÊNCIA:", 
-                     style='Subtitulo.TLabel').pack(anchor="w", pady=(15, 10))
-            
-            sugestoes = self.gerar_sugestoes(configuracao, detalhes, resistencia)
-            for sugestao in sugestoes:
-                ttk.Label(self.frame_resultado, text=f"• {sugestao}", 
-                         style='Grande.TLabel').pack(anchor="w", pady=2)
+        separator3 = ttk.Separator(self.frame_sugestoes, orient='horizontal')
+        separator3.pack(fill="x", pady=10)
+        
+        ttk.Label(self.frame_sugestoes, text="💡 SUGESTÕES PARA REDUZIR A RESISTÊNCIA:", 
+                 style='Subtitulo.TLabel').pack(anchor="w", pady=(15, 10))
         
+        ttk.Label(self.frame_sugestoes, textvariable=self.texto_sugestoes, 
+                 style='Grande.TLabel', justify="left").pack(anchor="w", pady=2)
         
-        separator4 = ttk.Separator(self.frame_resultado, orient='horizontal')
-        separator4.pack(fill="x", pady=10)
+        
+        self.separator_observacao = ttk.Separator(self.frame_resultado, orient='horizontal')
+        self.separator_observacao.pack(fill="x", pady=10)
         
         ttk.Label(self.frame_resultado, text="💡 Observação: Este cálculo é para projeto preliminar. Validação requer medição in loco.", 
                  style='Normal.TLabel', foreground='#666').pack(anchor="w", pady=2)
+    
+    @etapa('renderizacao')
+    def mostrar_resultado(self, resultado, resistividade_solo):
+        
+        resistencia = resultado['resistencia']
+        configuracao = resultado['configuracao']
+        detalhes = resultado['detalhes']
+        
+        
+        if not self.frame_resultado.winfo_manager():
+            self.frame_resultado.pack(fill="x", pady=(10, 0))
+        
+        
+        self.texto_configuracao.set(f"📋 Configuração: {configuracao}")
+        
+        
+        if configuracao == 'Condutor horizontal enterrado':
+            self.label_formula.pack(anchor="w", pady=2, before=self.label_resistividade)
+        else:
+            self.label_formula.pack_forget()
+        
+        self.texto_resistividade.set(f"🌱 Resistividade do solo: {resistividade_solo} Ω.m")
+        
+        self.texto_resistencia.set(f"{resistencia:.2f} Ω")
+        
+        status_text, cor = self.classificar(resistencia)
+        
+        self.texto_status.set(status_text)
+        if self.label_status.cget('foreground') != cor:
+            self.label_status.configure(foreground=cor)
         
         
-        self.root.update_idletasks()
+        if resistencia > 10.0:
+            sugestoes = self.gerar_sugestoes(configuracao, detalhes, resistencia)
+            self.texto_sugestoes.set("\n".join(f"• {sugestao}" for sugestao in sugestoes))
+            self.frame_sugestoes.pack(fill="x", before=self.separator_observacao)
+        else:
+            self.frame_sugestoes.pack_forget()
+    
+    def agendar_recalculo(self, *args):
+        # Debounce: só recalcula depois de uma pausa na digitação
+        if self.recalculo_agendado is not None:
+            self.root.after_cancel(self.recalculo_agendado)
+            self.recalculo_agendado = None
+        if self.recalculo_ao_vivo.get():
+            self.recalculo_agendado = self.root.after(ATRASO_RECALCULO_MS, self.recalcular_ao_vivo)
+    
+    @etapa('recalculo_ao_vivo')
+    def recalcular_ao_vivo(self):
+        # As fórmulas fechadas levam microssegundos: no modo ao vivo o cálculo roda direto
+        # na thread principal e entradas incompletas são ignoradas sem mensagem de erro
+        self.recalculo_agendado = None
+        
+        calculo = self.preparar_calculo()
+        if calculo is None:
+            return
+        funcao, resistividade_solo, valores = calculo
+        
+        try:
+            resultado = funcao(resistividade_solo, valores)
+        except (ValueError, ZeroDivisionError):
+            return
+        
+        if math.isfinite(resultado['resistencia']) and resultado['resistencia'] > 0:
+            self.mostrar_resultado(resultado, resistividade_solo)
+    
+    @etapa('classificacao')
+    def classificar(self, resistencia):
+        """Texto e cor do status conforme os limites normativos (classificação do Motor_Calculo)"""
+        indice = classificar_norma(resistencia)
+        return f"{MARCAS_CLASSIFICACAO[indice]} {CLASSIFICACOES[indice]}", CORES_CLASSIFICACAO[indice]
     
+    @etapa('sugestoes')
     def gerar_sugestoes(self, configuracao, detalhes, resistencia):
-        sugestoes = []
-        
-        if configuracao == 'Haste vertical única':
-            sugestoes.extend([
-                "Adicionar mais hastes em paralelo",
-                f"Aumentar comprimento da haste para 4-6m",
-                "Usar haste de maior diâmetro (ex: 19mm)"
-            ])
-        elif configuracao == 'Múltiplas hastes em linha':
-            sugestoes.extend([
-                f"Aumentar número de hastes",
-                f"Aumentar comprimento das hastes para 3-4m",
-                f"Reduzir espaçamento entre hastes"
-            ])
-        elif configuracao == 'Condutor horizontal enterrado':
-            sugestoes.extend([
-                f"Aumentar comprimento do condutor",
-                "Enterrar em maior profundidade (0.8-1.0m)",
-                "Adicionar hastes verticais nos extremos",
-                "Usar condutor de maior diâmetro"
-            ])
-        elif configuracao == 'Malha de aterramento':
-            sugestoes.extend([
-                f"Aumentar área da malha",
-                "Aumentar comprimento dos condutores",
-                "Adicionar hastes verticais nos cantos da malha"
-            ])
-        
-        sugestoes.extend([
-            "Aplicar tratamento químico no solo",
-            "Usar aterramento profundo (hastes de 6-12m)",
-            "Considerar uso de composto eletrocondutor"
-        ])
-        
-        return sugestoes
+        return gerar_sugestoes(configuracao, detalhes, resistencia)
 
 
 if __name__ == "__main__":
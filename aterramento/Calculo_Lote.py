@@ -0,0 +1,212 @@
+import argparse
+import csv
+import math
+import sys
+
+from Motor_Calculo import (FORMULAS, CONFIGURACOES, CLASSIFICACOES, LIMITES_NORMA,
+                           classificar_norma, gerar_sugestoes)
+
+# Mesmos códigos do menu de Calculo_Simples.py / Calculo_Geral_Aterramento.py
+CODIGOS_TIPO = {
+    "1": 'haste_unica',
+    "2": 'multiplas_hastes',
+    "3": 'condutor_horizontal',
+    "4": 'malha',
+}
+
+COLUNAS_SAIDA = ['resistencia', 'classificacao', 'sugestoes', 'erro']
+
+# Grupos até este tamanho são calculados registro a registro com math: arquivos pequenos,
+# processados por muitos processos de vida curta, não pagam a importação do NumPy
+LIMITE_GRUPO_ESCALAR = 256
+
+
+def normalizar_tipo(valor):
+    """Aceita o código do menu (1-4) ou o nome da fórmula"""
+    valor = (valor or "").strip()
+    return CODIGOS_TIPO.get(valor, valor)
+
+
+def ler_blocos(leitor, tamanho_bloco):
+    """Lê o CSV (csv.DictReader) em blocos de tamanho fixo, sem carregar o arquivo inteiro"""
+    bloco = []
+    for linha in leitor:
+        bloco.append(linha)
+        if len(bloco) >= tamanho_bloco:
+            yield bloco
+            bloco = []
+    if bloco:
+        yield bloco
+
+
+def converter_numero(texto):
+    try:
+        return float(texto)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def processar_bloco(linhas):
+    """Calcula resistência, classificação e sugestões para um bloco de registros"""
+    n = len(linhas)
+    resistencias = [math.nan] * n
+    erros = [""] * n
+
+    tipos = [normalizar_tipo(linha.get('tipo')) for linha in linhas]
+
+    # Agrupa por tipo para avaliar cada fórmula uma única vez por bloco
+    grupos = {}
+    for i, tipo in enumerate(tipos):
+        grupos.setdefault(tipo, []).append(i)
+
+    for tipo, indices in grupos.items():
+        if tipo not in FORMULAS:
+            for i in indices:
+                erros[i] = f"Tipo de eletrodo desconhecido: {linhas[i].get('tipo')}"
+            continue
+
+        formula, nomes = FORMULAS[tipo]
+        colunas = ['resistividade'] + list(nomes)
+        valores = [[converter_numero(linhas[i].get(coluna)) for coluna in colunas] for i in indices]
+
+        if len(indices) <= LIMITE_GRUPO_ESCALAR:
+            R = [formula(*registro) for registro in valores]
+        else:
+            import numpy as np
+            with np.errstate(divide='ignore', invalid='ignore'):
+                R = formula(*np.array(valores).reshape(len(indices), len(colunas)).T).tolist()
+
+        for i, r in zip(indices, R):
+            if math.isfinite(r) and r > 0:
+                resistencias[i] = r
+            else:
+                erros[i] = "Valores inválidos"
+
+    # As sugestões dependem só da configuração, então são montadas uma vez por tipo
+    cache_sugestoes = {}
+    resultados = []
+    for i, linha in enumerate(linhas):
+        if erros[i]:
+            resultados.append((None, "", "", erros[i]))
+            continue
+
+        R = resistencias[i]
+        sugestoes = ""
+        if R > LIMITES_NORMA[-1]:
+            if tipos[i] not in cache_sugestoes:
+                cache_sugestoes[tipos[i]] = "; ".join(
+                    gerar_sugestoes(CONFIGURACOES[tipos[i]], linha, R))
+            sugestoes = cache_sugestoes[tipos[i]]
+
+        resultados.append((R, CLASSIFICACOES[classificar_norma(R)], sugestoes, ""))
+
+    return resultados
+
+
+class EscritorCSV:
+    def __init__(self, caminho, colunas):
+        self.arquivo = open(caminho, 'w', newline='', encoding='utf-8')
+        self.escritor = csv.writer(self.arquivo)
+        self.escritor.writerow(colunas)
+        self.colunas_entrada = colunas[:-len(COLUNAS_SAIDA)]
+
+    def escrever(self, linhas, resultados):
+        for linha, (R, classificacao, sugestoes, erro) in zip(linhas, resultados):
+            self.escritor.writerow(
+                [linha.get(coluna, "") for coluna in self.colunas_entrada] +
+                ["" if R is None else f"{R:.4f}", classificacao, sugestoes, erro])
+
+    def fechar(self):
+        self.arquivo.close()
+
+
+class EscritorParquet:
+    def __init__(self, caminho, colunas):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("❌ Saída Parquet requer o pacote pyarrow (pip install pyarrow)")
+
+        self.pa = pa
+        self.colunas_entrada = colunas[:-len(COLUNAS_SAIDA)]
+        campos = [pa.field(coluna, pa.string()) for coluna in self.colunas_entrada]
+        campos += [pa.field('resistencia', pa.float64()), pa.field('classificacao', pa.string()),
+                   pa.field('sugestoes', pa.string()), pa.field('erro', pa.string())]
+        self.schema = pa.schema(campos)
+        self.escritor = pq.ParquetWriter(caminho, self.schema)
+
+    def escrever(self, linhas, resultados):
+        dados = {coluna: [linha.get(coluna) for linha in linhas] for coluna in self.colunas_entrada}
+        for nome, valores in zip(COLUNAS_SAIDA, zip(*resultados)):
+            dados[nome] = list(valores)
+        self.escritor.write_table(self.pa.Table.from_pydict(dados, schema=self.schema))
+
+    def fechar(self):
+        self.escritor.close()
+
+
+def processar_arquivo(entrada, saida, formato='csv', tamanho_bloco=10000):
+    """Processa um CSV de eletrodos bloco a bloco e grava os resultados. Retorna um resumo."""
+    if tamanho_bloco <= 0:
+        raise ValueError("O tamanho do bloco deve ser positivo")
+    resumo = {'registros': 0, 'atendem': 0, 'nao_atendem': 0, 'erros': 0}
+
+    with open(entrada, newline='', encoding='utf-8') as arquivo:
+        # O escritor sai do cabeçalho: um CSV sem registros ainda gera a saída com as colunas
+        leitor = csv.DictReader(arquivo)
+        colunas_saida = [c for c in leitor.fieldnames or [] if c not in COLUNAS_SAIDA] + COLUNAS_SAIDA
+        classe = EscritorParquet if formato == 'parquet' else EscritorCSV
+        escritor = classe(saida, colunas_saida)
+        try:
+            for linhas in ler_blocos(leitor, tamanho_bloco):
+                resultados = processar_bloco(linhas)
+                escritor.escrever(linhas, resultados)
+
+                for R, _, _, erro in resultados:
+                    resumo['registros'] += 1
+                    if erro:
+                        resumo['erros'] += 1
+                    elif R <= LIMITES_NORMA[-1]:
+                        resumo['atendem'] += 1
+                    else:
+                        resumo['nao_atendem'] += 1
+        finally:
+            escritor.fechar()
+
+    return resumo
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Cálculo em lote da resistência de aterramento a partir de um CSV.",
+        epilog="Colunas: tipo (1-4 ou haste_unica, multiplas_hastes, condutor_horizontal, malha, "
+               "haste_tratada, condutor_tratado), resistividade e a geometria do tipo (comprimento, "
+               "diametro, n_hastes, espacamento, profundidade, area, comprimento_total, "
+               "diametro_tratamento, resistividade_tratamento). Demais colunas são copiadas para a saída.")
+    parser.add_argument('entrada', help="CSV de entrada")
+    parser.add_argument('saida', help="arquivo de saída (.csv ou .parquet)")
+    parser.add_argument('--formato', choices=['csv', 'parquet'],
+                        help="formato da saída (padrão: pela extensão do arquivo)")
+    parser.add_argument('--tamanho-bloco', type=int, default=10000,
+                        help="registros processados por bloco (padrão: 10000)")
+    args = parser.parse_args()
+    if args.tamanho_bloco <= 0:
+        parser.error("--tamanho-bloco deve ser positivo")
+
+    formato = args.formato or ('parquet' if args.saida.lower().endswith('.parquet') else 'csv')
+
+    try:
+        resumo = processar_arquivo(args.entrada, args.saida, formato, args.tamanho_bloco)
+    except (OSError, csv.Error) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print("=" * 50)
+    print("CÁLCULO EM LOTE CONCLUÍDO")
+    print("=" * 50)
+    print(f"Registros processados: {resumo['registros']}")
+    print(f"✅ Atendem (≤ 10 Ω): {resumo['atendem']}")
+    print(f"❌ Não atendem (> 10 Ω): {resumo['nao_atendem']}")
+    print(f"⚠️  Com erro: {resumo['erros']}")
+    print(f"Resultados gravados em: {args.saida}")
@@ -1,204 +1,228 @@
 import math
 
-print("=" * 50)
-print("CALCULADORA DE RESISTÊNCIA DE ATERRAMENTO")
-print("=" * 50)
 
-print("\nSelecione o tipo de eletrodo de aterramento:")
-print("1 - Haste vertical única")
-print("2 - Múltiplas hastes em linha")
-print("3 - Condutor horizontal enterrado")
-print("4 - Aterramento em malha")
+# Fórmulas (importáveis sem executar o menu interativo)
 
-opcao = input("\nDigite o número da opção desejada: ")
+def resistencia_haste(resistividade_solo, comprimento, diametro):
+    """Haste vertical única (IEEE Std 142)"""
+    return (resistividade_solo / (2 * math.pi * comprimento)) * (math.log((4 * comprimento) / diametro) - 1)
 
-# Constante - Resistividade do solo (Ω.m)
-resistividade_solo = float(input("\nDigite a resistividade do solo (Ω.m): "))
+def fator_utilizacao_hastes(n_hastes, relacao_espacamento=1.0, relacao_comprimento_diametro=None):
+    """Fator de utilização de n hastes em linha (modelo de Fator_Utilizacao; sem L/d, a haste de 2,4 m × 16 mm)"""
+    # Importado aqui: o menu interativo não carrega o NumPy até o primeiro cálculo de várias hastes
+    from Fator_Utilizacao import RELACAO_COMPRIMENTO_DIAMETRO, fator_utilizacao
+    if relacao_comprimento_diametro is None:
+        relacao_comprimento_diametro = RELACAO_COMPRIMENTO_DIAMETRO
+    return fator_utilizacao(n_hastes, relacao_espacamento, relacao_comprimento_diametro)
 
-def haste_vertical_unica():
+def resistencia_hastes_linha(resistividade_solo, n_hastes, comprimento, diametro, espacamento=None):
+    """Hastes em linha pelo fator de utilização: (R_total, R_uma_haste, fator). Sem espaçamento, s = L."""
+    R_uma_haste = resistencia_haste(resistividade_solo, comprimento, diametro)
+    relacao = 1.0 if espacamento is None else espacamento / comprimento
+    fator_utilizacao = fator_utilizacao_hastes(n_hastes, relacao, comprimento / diametro)
+    return R_uma_haste / (n_hastes * fator_utilizacao), R_uma_haste, fator_utilizacao
+
+def resistencia_condutor_laurent(resistividade_solo, comprimento, diametro, profundidade):
+    """Fórmula de Laurent para condutor horizontal"""
+    return (resistividade_solo / (math.pi * comprimento)) * (
+        math.log((2 * comprimento) / math.sqrt(diametro * profundidade)) + 0.5
+    )
+
+def resistencia_malha_schwarz(resistividade_solo, area, comprimento_total, profundidade):
+    """Fórmula de Schwarz para malha"""
+    return resistividade_solo * (1/comprimento_total + 1/math.sqrt(20*area)) * (1 + 1/(1 + profundidade * math.sqrt(area/10)))
+
+
+# Entrada interativa
+
+def haste_vertical_unica(resistividade_solo):
     print("\n--- Haste Vertical Única ---")
     comprimento = float(input("Comprimento da haste (m): "))
     diametro = float(input("Diâmetro da haste (m): "))
     
-    # Fórmula CORRETA para haste vertical (IEEE Std 142)
-    R = (resistividade_solo / (2 * math.pi * comprimento)) * (math.log((4 * comprimento) / diametro) - 1)
+    R = resistencia_haste(resistividade_solo, comprimento, diametro)
     
     return R, comprimento, diametro
 
-def multiplas_hastes_linha():
+def multiplas_hastes_linha(resistividade_solo):
     print("\n--- Múltiplas Hastes em Linha ---")
     n_hastes = int(input("Número de hastes: "))
     comprimento = float(input("Comprimento de cada haste (m): "))
     diametro = float(input("Diâmetro das hastes (m): "))
     espacamento = float(input("Espaçamento entre hastes (m): "))
     
-    # Resistência de uma haste isolada
-    R_uma_haste = (resistividade_solo / (2 * math.pi * comprimento)) * (math.log((4 * comprimento) / diametro) - 1)
-    
-    # Fator de utilização mais preciso
-    if n_hastes == 2:
-        fator_utilizacao = 0.85
-    elif n_hastes == 3:
-        fator_utilizacao = 0.75
-    elif n_hastes == 4:
-        fator_utilizacao = 0.65
-    elif n_hastes == 5:
-        fator_utilizacao = 0.60
-    elif n_hastes == 6:
-        fator_utilizacao = 0.55
-    elif n_hastes == 8:
-        fator_utilizacao = 0.50
-    elif n_hastes == 10:
-        fator_utilizacao = 0.45
-    else:
-        fator_utilizacao = 0.40
-    
-    R_total = R_uma_haste / (n_hastes * fator_utilizacao)
+    R_total, R_uma_haste, fator_utilizacao = resistencia_hastes_linha(resistividade_solo, n_hastes, comprimento, diametro, espacamento)
     
     return R_total, n_hastes, comprimento, diametro, espacamento, R_uma_haste, fator_utilizacao
 
-def condutor_horizontal():
+def condutor_horizontal(resistividade_solo):
     print("\n--- Condutor Horizontal ---")
     comprimento = float(input("Comprimento do condutor (m): "))
     diametro = float(input("Diâmetro do condutor (m): "))
     profundidade = float(input("Profundidade de enterramento (m): "))
     
-    # Fórmula de Laurent para condutor horizontal
-    R = (resistividade_solo / (math.pi * comprimento)) * (
-        math.log((2 * comprimento) / math.sqrt(diametro * profundidade)) + 0.5
-    )
+    R = resistencia_condutor_laurent(resistividade_solo, comprimento, diametro, profundidade)
     
     return R, comprimento, diametro, profundidade
 
-def malha_aterramento():
+def malha_aterramento(resistividade_solo):
     print("\n--- Malha de Aterramento ---")
     area = float(input("Área da malha (m²): "))
     comprimento_total = float(input("Comprimento total dos condutores (m): "))
     profundidade = float(input("Profundidade da malha (m): "))
     
-    # Fórmula de Schwarz para malha
-    R = resistividade_solo * (1/comprimento_total + 1/math.sqrt(20*area)) * (1 + 1/(1 + profundidade * math.sqrt(area/10)))
+    R = resistencia_malha_schwarz(resistividade_solo, area, comprimento_total, profundidade)
     
     return R, area, comprimento_total, profundidade
 
-# Execução do cálculo baseado na opção escolhida
-try:
-    resistencia = 0
-    config = ""
-    detalhes = {}
-    
-    if opcao == "1":
-        resistencia, comprimento, diametro = haste_vertical_unica()
-        config = "Haste vertical única"
-        detalhes = {"comprimento": comprimento, "diametro": diametro}
-    elif opcao == "2":
-        resistencia, n_hastes, comprimento, diametro, espacamento, R_uma_haste, fator_utilizacao = multiplas_hastes_linha()
-        config = "Múltiplas hastes em linha"
-        detalhes = {"n_hastes": n_hastes, "comprimento": comprimento, "diametro": diametro, "espacamento": espacamento, "R_uma_haste": R_uma_haste, "fator_utilizacao": fator_utilizacao}
-    elif opcao == "3":
-        resistencia, comprimento, diametro, profundidade = condutor_horizontal()
-        config = "Condutor horizontal"
-        detalhes = {"comprimento": comprimento, "diametro": diametro, "profundidade": profundidade}
-    elif opcao == "4":
-        resistencia, area, comprimento_total, profundidade = malha_aterramento()
-        config = "Malha de aterramento"
-        detalhes = {"area": area, "comprimento_total": comprimento_total, "profundidade": profundidade}
-    else:
-        print("Opção inválida!")
-        exit()
-    
-    print("\n" + "=" * 50)
-    print("RESULTADO DO CÁLCULO")
+def main():
     print("=" * 50)
-    print(f"Configuração: {config}")
-    print(f"Resistividade do solo: {resistividade_solo} Ω.m")
-    print(f"Resistência de aterramento calculada: {resistencia:.2f} Ω")
-    
-    # Verificação conforme norma
-    print(f"\n--- ANÁLISE CONFORME NORMAS ---")
-    
-    if resistencia <= 1.0:
-        print("✅ ATENDE: Sistemas de equipamentos sensíveis (≤ 1 Ω)")
-        status = "ATENDE"
-    elif resistencia <= 5.0:
-        print("✅ ATENDE: Sistemas de telecomunicações (≤ 5 Ω)")
-        status = "ATENDE"
-    elif resistencia <= 10.0:
-        print("✅ ATENDE: Sistemas de potência e para-raios (≤ 10 Ω)")
-        status = "ATENDE"
-    else:
-        print("❌ NÃO ATENDE: Resistência acima dos limites normativos (> 10 Ω)")
-        status = "NÃO ATENDE"
-    
-    # Mostrar cálculo detalhado
-    print(f"\n--- DETALHES DO CÁLCULO ---")
-    if opcao == "1":
-        L = detalhes["comprimento"]
-        d = detalhes["diametro"]
-        parte1 = resistividade_solo / (2 * math.pi * L)
-        parte2 = math.log((4 * L) / d) - 1
-        print(f"Fórmula: R = (ρ / (2πL)) × [ln(4L/d) - 1]")
-        print(f"R = ({resistividade_solo} / (2×π×{L})) × [ln(4×{L}/{d}) - 1]")
-        print(f"R = ({resistividade_solo} / {2*math.pi*L:.2f}) × [ln({4*L/d:.1f}) - 1]")
-        print(f"R = {parte1:.2f} × [{math.log(4*L/d):.2f} - 1]")
-        print(f"R = {parte1:.2f} × {parte2:.2f}")
-        print(f"R = {resistencia:.2f} Ω")
-    
-    elif opcao == "2":
-        L = detalhes["comprimento"]
-        d = detalhes["diametro"]
-        n = detalhes["n_hastes"]
-        R_uma = detalhes["R_uma_haste"]
-        fator = detalhes["fator_utilizacao"]
-        
-        print(f"1. Resistência de UMA haste:")
-        print(f"   R_uma = (ρ / (2πL)) × [ln(4L/d) - 1]")
-        print(f"   R_uma = ({resistividade_solo} / (2×π×{L})) × [ln(4×{L}/{d}) - 1]")
-        print(f"   R_uma = {R_uma:.2f} Ω")
-        
-        print(f"\n2. Fator de utilização para {n} hastes: η = {fator}")
-        
-        print(f"\n3. Resistência TOTAL:")
-        print(f"   R_total = R_uma / (n × η)")
-        print(f"   R_total = {R_uma:.2f} / ({n} × {fator})")
-        print(f"   R_total = {R_uma:.2f} / {n * fator:.2f}")
-        print(f"   R_total = {resistencia:.2f} Ω")
-    
-    # Sugestões de melhoria
-    if resistencia > 10.0:
-        print(f"\n--- SUGESTÕES PARA REDUZIR A RESISTÊNCIA ---")
+    print("CALCULADORA DE RESISTÊNCIA DE ATERRAMENTO")
+    print("=" * 50)
+
+    print("\nSelecione o tipo de eletrodo de aterramento:")
+    print("1 - Haste vertical única")
+    print("2 - Múltiplas hastes em linha")
+    print("3 - Condutor horizontal enterrado")
+    print("4 - Aterramento em malha")
+
+    opcao = input("\nDigite o número da opção desejada: ")
+
+    # Constante - Resistividade do solo (Ω.m)
+    resistividade_solo = float(input("\nDigite a resistividade do solo (Ω.m): "))
+
+    # Execução do cálculo baseado na opção escolhida
+    try:
+        resistencia = 0
+        config = ""
+        detalhes = {}
+    
         if opcao == "1":
-            print(f"• Adicionar mais hastes em paralelo")
-            print(f"• Aumentar comprimento da haste para 4-6m")
-            print(f"• Usar haste de maior diâmetro")
+            resistencia, comprimento, diametro = haste_vertical_unica(resistividade_solo)
+            config = "Haste vertical única"
+            detalhes = {"comprimento": comprimento, "diametro": diametro}
         elif opcao == "2":
-            print(f"• Aumentar número de hastes para {detalhes['n_hastes'] + 2}")
-            print(f"• Aumentar comprimento das hastes para 3-4m")
-            print(f"• Reduzir espaçamento entre hastes para 2.0m")
+            resistencia, n_hastes, comprimento, diametro, espacamento, R_uma_haste, fator_utilizacao = multiplas_hastes_linha(resistividade_solo)
+            config = "Múltiplas hastes em linha"
+            detalhes = {"n_hastes": n_hastes, "comprimento": comprimento, "diametro": diametro, "espacamento": espacamento, "R_uma_haste": R_uma_haste, "fator_utilizacao": fator_utilizacao}
         elif opcao == "3":
-            print(f"• Aumentar comprimento do condutor para {detalhes['comprimento'] * 1.5:.1f}m")
-            print(f"• Enterrar em maior profundidade (0.8-1.0m)")
-            print(f"• Adicionar hastes verticais nos extremos")
+            resistencia, comprimento, diametro, profundidade = condutor_horizontal(resistividade_solo)
+            config = "Condutor horizontal"
+            detalhes = {"comprimento": comprimento, "diametro": diametro, "profundidade": profundidade}
         elif opcao == "4":
-            print(f"• Aumentar área da malha para {detalhes['area'] * 1.5:.1f}m²")
-            print(f"• Aumentar comprimento dos condutores")
-            print(f"• Adicionar hastes verticais nos cantos")
+            resistencia, area, comprimento_total, profundidade = malha_aterramento(resistividade_solo)
+            config = "Malha de aterramento"
+            detalhes = {"area": area, "comprimento_total": comprimento_total, "profundidade": profundidade}
+        else:
+            print("Opção inválida!")
+            return
+    
+        print("\n" + "=" * 50)
+        print("RESULTADO DO CÁLCULO")
+        print("=" * 50)
+        print(f"Configuração: {config}")
+        print(f"Resistividade do solo: {resistividade_solo} Ω.m")
+        print(f"Resistência de aterramento calculada: {resistencia:.2f} Ω")
+    
+        # Verificação conforme norma
+        print(f"\n--- ANÁLISE CONFORME NORMAS ---")
+    
+        if resistencia <= 1.0:
+            print("✅ ATENDE: Sistemas de equipamentos sensíveis (≤ 1 Ω)")
+            status = "ATENDE"
+        elif resistencia <= 5.0:
+            print("✅ ATENDE: Sistemas de telecomunicações (≤ 5 Ω)")
+            status = "ATENDE"
+        elif resistencia <= 10.0:
+            print("✅ ATENDE: Sistemas de potência e para-raios (≤ 10 Ω)")
+            status = "ATENDE"
+        else:
+            print("❌ NÃO ATENDE: Resistência acima dos limites normativos (> 10 Ω)")
+            status = "NÃO ATENDE"
+    
+        # Mostrar cálculo detalhado
+        print(f"\n--- DETALHES DO CÁLCULO ---")
+        if opcao == "1":
+            L = detalhes["comprimento"]
+            d = detalhes["diametro"]
+            parte1 = resistividade_solo / (2 * math.pi * L)
+            parte2 = math.log((4 * L) / d) - 1
+            print(f"Fórmula: R = (ρ / (2πL)) × [ln(4L/d) - 1]")
+            print(f"R = ({resistividade_solo} / (2×π×{L})) × [ln(4×{L}/{d}) - 1]")
+            print(f"R = ({resistividade_solo} / {2*math.pi*L:.2f}) × [ln({4*L/d:.1f}) - 1]")
+            print(f"R = {parte1:.2f} × [{math.log(4*L/d):.2f} - 1]")
+            print(f"R = {parte1:.2f} × {parte2:.2f}")
+            print(f"R = {resistencia:.2f} Ω")
+    
+        elif opcao == "2":
+            L = detalhes["comprimento"]
+            d = detalhes["diametro"]
+            n = detalhes["n_hastes"]
+            R_uma = detalhes["R_uma_haste"]
+            fator = detalhes["fator_utilizacao"]
+        
+            print(f"1. Resistência de UMA haste:")
+            print(f"   R_uma = (ρ / (2πL)) × [ln(4L/d) - 1]")
+            print(f"   R_uma = ({resistividade_solo} / (2×π×{L})) × [ln(4×{L}/{d}) - 1]")
+            print(f"   R_uma = {R_uma:.2f} Ω")
+        
+            print(f"\n2. Fator de utilização para {n} hastes (s/L = {detalhes['espacamento'] / L:.2f}): η = {fator:.3f}")
         
-        print(f"• Aplicar tratamento químico no solo (eletrodos químicos)")
-        print(f"• Usar aterramento profundo (hastes de 6-12m)")
-        print(f"• Considerar uso de composto eletrocondutor")
-    
-    # Mostrar próximo passo para atingir ≤ 10 Ω
-    if resistencia > 10.0 and opcao == "2":
-        n_minimo = math.ceil(detalhes['R_uma_haste'] / (10 * detalhes['fator_utilizacao']))
-        print(f"\n--- PARA ATINGIR ≤ 10 Ω ---")
-        print(f"Número mínimo de hastes necessárias: {n_minimo}")
-        print(f"Resistência estimada com {n_minimo} hastes: {detalhes['R_uma_haste']/(n_minimo * detalhes['fator_utilizacao']):.2f} Ω")
-    
-except ValueError:
-    print("Erro: Digite valores numéricos válidos!")
-except Exception as e:
-    print(f"Erro inesperado: {e}")
+            print(f"\n3. Resistência TOTAL:")
+            print(f"   R_total = R_uma / (n × η)")
+            print(f"   R_total = {R_uma:.2f} / ({n} × {fator:.3f})")
+            print(f"   R_total = {R_uma:.2f} / {n * fator:.2f}")
+            print(f"   R_total = {resistencia:.2f} Ω")
+    
+        # Sugestões de melhoria
+        if resistencia > 10.0:
+            print(f"\n--- SUGESTÕES PARA REDUZIR A RESISTÊNCIA ---")
+            if opcao == "1":
+                print(f"• Adicionar mais hastes em paralelo")
+                print(f"• Aumentar comprimento da haste para 4-6m")
+                print(f"• Usar haste de maior diâmetro")
+            elif opcao == "2":
+                print(f"• Aumentar número de hastes para {detalhes['n_hastes'] + 2}")
+                print(f"• Aumentar comprimento das hastes para 3-4m")
+                print(f"• Reduzir espaçamento entre hastes para 2.0m")
+            elif opcao == "3":
+                print(f"• Aumentar comprimento do condutor para {detalhes['comprimento'] * 1.5:.1f}m")
+                print(f"• Enterrar em maior profundidade (0.8-1.0m)")
+                print(f"• Adicionar hastes verticais nos extremos")
+            elif opcao == "4":
+                print(f"• Aumentar área da malha para {detalhes['area'] * 1.5:.1f}m²")
+                print(f"• Aumentar comprimento dos condutores")
+                print(f"• Adicionar hastes verticais nos cantos")
+        
+            print(f"• Aplicar tratamento químico no solo (eletrodos químicos)")
+            print(f"• Usar aterramento profundo (hastes de 6-12m)")
+            print(f"• Considerar uso de composto eletrocondutor")
+    
+        # Mostrar próximo passo para atingir ≤ 10 Ω
+        if resistencia > 10.0 and opcao == "2":
+            # η cai com n: consulta a tabela para todos os n de uma vez e pega o primeiro que atende
+            relacao = detalhes['espacamento'] / detalhes['comprimento']
+            candidatos = range(detalhes['n_hastes'], 101)
+            fatores = fator_utilizacao_hastes(list(candidatos), relacao,
+                                              detalhes['comprimento'] / detalhes['diametro'])
+            atendem = [(n, detalhes['R_uma_haste'] / (n * f)) for n, f in zip(candidatos, fatores)
+                       if detalhes['R_uma_haste'] / (n * f) <= 10.0]
+            print(f"\n--- PARA ATINGIR ≤ 10 Ω ---")
+            if atendem:
+                n_minimo, R_minimo = atendem[0]
+                print(f"Número mínimo de hastes necessárias: {n_minimo}")
+                print(f"Resistência estimada com {n_minimo} hastes: {R_minimo:.2f} Ω")
+            else:
+                print(f"Nem 100 hastes em linha com este espaçamento atingem 10 Ω")
+    
+    except ValueError:
+        print("Erro: Digite valores numéricos válidos!")
+    except Exception as e:
+        print(f"Erro inesperado: {e}")
+
+
+if __name__ == "__main__":
+    main()
 
 '''print("\n" + "=" * 50)
 print("Observações importantes:")
@@ -0,0 +1,160 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+# Geometrias típicas de cada tipo; a resistividade é sorteada em cada pedido
+GEOMETRIAS = {
+    'haste_unica': {'comprimento': 2.4, 'diametro': 0.016},
+    'multiplas_hastes': {'n_hastes': 4, 'comprimento': 2.4, 'diametro': 0.016, 'espacamento': 3.0},
+    'condutor_horizontal': {'comprimento': 20.0, 'diametro': 0.01, 'profundidade': 0.5},
+    'malha': {'area': 100.0, 'comprimento_total': 80.0, 'profundidade': 0.5},
+}
+
+
+def gerar_pedido(sorteio):
+    tipo = sorteio.choice(list(GEOMETRIAS))
+    return {'tipo': tipo, 'resistividade': round(sorteio.uniform(20, 2000), 1), **GEOMETRIAS[tipo]}
+
+
+async def requisitar(leitor, escritor, host, metodo, caminho, dados=None):
+    """Um pedido HTTP/1.1 numa conexão keep-alive; retorna (status, corpo decodificado)"""
+    corpo = b'' if dados is None else json.dumps(dados).encode('utf-8')
+    escritor.write(f"{metodo} {caminho} HTTP/1.1\r\nHost: {host}\r\n"
+                   f"Content-Type: application/json\r\nContent-Length: {len(corpo)}\r\n\r\n"
+                   .encode('latin-1') + corpo)
+    await escritor.drain()
+
+    cabecalho = (await leitor.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    status = int(cabecalho[0].split(' ', 2)[1])
+    tamanho = 0
+    for linha in cabecalho[1:]:
+        nome, _, valor = linha.partition(':')
+        if nome.strip().lower() == 'content-length':
+            tamanho = int(valor)
+    return status, json.loads(await leitor.readexactly(tamanho)) if tamanho else None
+
+
+async def cliente(host, porta, fim, limite, latencias, erros, semente):
+    """Uma conexão enviando pedidos /calcular em sequência até o fim do teste"""
+    sorteio = random.Random(semente)
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        while time.perf_counter() < fim and (limite is None or len(latencias) + len(erros) < limite):
+            inicio = time.perf_counter()
+            try:
+                status, _ = await requisitar(leitor, escritor, host, 'POST', '/calcular',
+                                             gerar_pedido(sorteio))
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                erros.append(type(e).__name__)
+                break
+            if status == 200:
+                latencias.append(time.perf_counter() - inicio)
+            else:
+                erros.append(status)
+    finally:
+        escritor.close()
+
+
+async def executar_carga(host, porta, conexoes=50, duracao=10.0, requisicoes=None):
+    latencias, erros = [], []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(host, porta, inicio + duracao, requisicoes, latencias, erros, semente)
+                           for semente in range(conexoes)))
+    tempo = time.perf_counter() - inicio
+
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    _, saude = await requisitar(leitor, escritor, host, 'GET', '/saude')
+    escritor.close()
+
+    resultado = {'conexoes': conexoes, 'tempo_s': tempo, 'sucesso': len(latencias), 'erros': len(erros),
+                 'requisicoes_por_s': len(latencias) / tempo, 'servidor': saude}
+    if len(latencias) >= 2:
+        quantis = statistics.quantiles(latencias, n=100)
+        resultado['latencia_ms'] = {'media': 1000 * statistics.fmean(latencias),
+                                    'p50': 1000 * quantis[49], 'p95': 1000 * quantis[94],
+                                    'p99': 1000 * quantis[98], 'max': 1000 * max(latencias)}
+    return resultado
+
+
+def porta_livre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def iniciar_servidor(porta, argumentos=()):
+    """Sobe Servico_HTTP.py num processo separado e espera aceitar conexões"""
+    processo = subprocess.Popen([sys.executable, os.path.join(DIRETORIO, 'Servico_HTTP.py'),
+                                 '--porta', str(porta), *argumentos],
+                                stdout=subprocess.DEVNULL, cwd=DIRETORIO)
+    limite = time.monotonic() + 10
+    while time.monotonic() < limite:
+        if processo.poll() is not None:
+            raise RuntimeError("O serviço terminou durante a inicialização")
+        try:
+            socket.create_connection(('127.0.0.1', porta), timeout=0.2).close()
+            return processo
+        except OSError:
+            time.sleep(0.05)
+    processo.terminate()
+    raise RuntimeError("O serviço não respondeu em 10 s")
+
+
+def imprimir_relatorio(r):
+    print("=" * 60)
+    print("TESTE DE CARGA - POST /calcular")
+    print("=" * 60)
+    print(f"Conexões simultâneas: {r['conexoes']}")
+    print(f"Duração: {r['tempo_s']:.2f} s")
+    print(f"Pedidos atendidos: {r['sucesso']}  (erros: {r['erros']})")
+    print(f"Vazão: {r['requisicoes_por_s']:.0f} pedidos/s")
+    if 'latencia_ms' in r:
+        lat = r['latencia_ms']
+        print(f"Latência (ms): média {lat['media']:.2f} | p50 {lat['p50']:.2f} | p95 {lat['p95']:.2f} | "
+              f"p99 {lat['p99']:.2f} | máx {lat['max']:.2f}")
+    s = r['servidor']
+    print(f"Agrupamento no servidor: {s['lotes']} lotes, média {s['media_lote']:.1f} "
+          f"pedidos/lote, maior {s['maior_lote']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Gerador de carga para Servico_HTTP.py (conexões keep-alive concorrentes).")
+    parser.add_argument('--endereco', help="host:porta de um serviço já em execução "
+                                           "(padrão: sobe um serviço local temporário)")
+    parser.add_argument('--conexoes', type=int, default=50, help="conexões simultâneas (padrão: 50)")
+    parser.add_argument('--duracao', type=float, default=10.0, help="duração do teste em s (padrão: 10)")
+    parser.add_argument('--requisicoes', type=int, help="para após este total de pedidos")
+    parser.add_argument('--espera-ms', type=float, default=0.0,
+                        help="--espera-ms repassado ao serviço local temporário")
+    parser.add_argument('--json', help="grava os resultados também neste arquivo JSON")
+    args = parser.parse_args()
+
+    servidor = None
+    if args.endereco:
+        host, _, porta = args.endereco.rpartition(':')
+        porta = int(porta)
+    else:
+        host, porta = '127.0.0.1', porta_livre()
+        servidor = iniciar_servidor(porta, ['--espera-ms', str(args.espera_ms)])
+
+    try:
+        resultado = asyncio.run(executar_carga(host, porta, args.conexoes, args.duracao, args.requisicoes))
+    finally:
+        if servidor is not None:
+            servidor.terminate()
+            servidor.wait()
+
+    imprimir_relatorio(resultado)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
@@ -0,0 +1,108 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TarefaCancelada(Exception):
+    """Levantada por Tarefa.verificar() quando o usuário cancela o cálculo"""
+
+
+class Tarefa:
+    """Ficha de um cálculo em segundo plano: cancelamento cooperativo e progresso"""
+
+    def __init__(self, fila_progresso):
+        self._cancelada = threading.Event()
+        self._fila_progresso = fila_progresso
+        self.futuro = None
+
+    @property
+    def cancelada(self):
+        return self._cancelada.is_set()
+
+    def cancelar(self):
+        self._cancelada.set()
+        if self.futuro is not None:
+            self.futuro.cancel()
+
+    def verificar(self):
+        """Chamada periodicamente pela função de cálculo; interrompe se cancelada"""
+        if self._cancelada.is_set():
+            raise TarefaCancelada()
+
+    def informar_progresso(self, fracao, mensagem=""):
+        """Progresso de 0 a 1; entregue à interface na próxima verificação do after()"""
+        self._fila_progresso.put((self, fracao, mensagem))
+        self.verificar()
+
+
+class ExecutorTarefas:
+    """
+    Executa cálculos fora do loop principal do Tk.
+
+    As funções rodam num pool de threads (as pesadas, como Varredura.varrer, distribuem
+    o trabalho em processos por conta própria). Resultados, erros e progresso voltam à
+    interface por root.after, sempre na thread principal, então os callbacks podem
+    mexer nos widgets livremente.
+    """
+
+    def __init__(self, root, max_workers=2, intervalo_ms=50):
+        self.root = root
+        self.intervalo_ms = intervalo_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='calculo')
+        self._progresso = queue.Queue()
+        self._pendentes = []
+        self._agendado = None
+
+    def executar(self, funcao, *args, ao_concluir=None, ao_erro=None, ao_progresso=None, **kwargs):
+        """Agenda funcao(tarefa, *args, **kwargs) e retorna a Tarefa (para cancelar)"""
+        tarefa = Tarefa(self._progresso)
+        tarefa.futuro = self._pool.submit(funcao, tarefa, *args, **kwargs)
+        self._pendentes.append((tarefa, ao_concluir, ao_erro, ao_progresso))
+        if self._agendado is None:
+            self._agendado = self.root.after(self.intervalo_ms, self._verificar)
+        return tarefa
+
+    def _verificar(self):
+        self._agendado = None
+
+        callbacks = {id(t): p for t, _, _, p in self._pendentes}
+        while True:
+            try:
+                tarefa, fracao, mensagem = self._progresso.get_nowait()
+            except queue.Empty:
+                break
+            ao_progresso = callbacks.get(id(tarefa))
+            if ao_progresso is not None and not tarefa.cancelada:
+                ao_progresso(fracao, mensagem)
+
+        ainda_pendentes = []
+        for tarefa, ao_concluir, ao_erro, ao_progresso in self._pendentes:
+            futuro = tarefa.futuro
+            if not futuro.done():
+                ainda_pendentes.append((tarefa, ao_concluir, ao_erro, ao_progresso))
+                continue
+            if tarefa.cancelada or futuro.cancelled():
+                continue
+            erro = futuro.exception()
+            if erro is None:
+                if ao_concluir is not None:
+                    ao_concluir(futuro.result())
+            elif not isinstance(erro, TarefaCancelada) and ao_erro is not None:
+                ao_erro(erro)
+        self._pendentes = ainda_pendentes
+
+        if self._pendentes:
+            self._agendado = self.root.after(self.intervalo_ms, self._verificar)
+
+    @property
+    def ocupado(self):
+        return bool(self._pendentes)
+
+    def encerrar(self):
+        for tarefa, *_ in self._pendentes:
+            tarefa.cancelar()
+        if self._agendado is not None:
+            self.root.after_cancel(self._agendado)
+            self._agendado = None
+        # Os futuros pendentes já foram cancelados por tarefa.cancelar() (cancel_futures exige 3.9)
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,206 @@
+import argparse
+import math
+
+import numpy as np
+
+from Arranjo_Hastes import arranjo_linha, resistencia_arranjo, resistencia_mutua
+from Motor_Calculo import resistencia_haste_unica
+
+# Grade da tabela: n = 1..N_MAXIMO hastes em linha, relação espaçamento/comprimento s/L
+# e esbeltez L/d, as duas em pontos logaritmicamente espaçados. A esbeltez só entra pela
+# resistência própria R0 ∝ ln(4L/d) - 1 (as mútuas não dependem de d), e 1/η é quase
+# linear em 1/R0; a interpolação nesse eixo é feita nessa variável.
+N_MAXIMO = 100
+RELACAO_MINIMA = 0.25
+RELACAO_MAXIMA = 20.0
+PONTOS_RELACAO = 64
+ESBELTEZ_MINIMA = 10.0
+ESBELTEZ_MAXIMA = 2000.0
+PONTOS_ESBELTEZ = 8
+# Haste de referência (2,4 m × 16 mm) quando o diâmetro não é informado
+RELACAO_COMPRIMENTO_DIAMETRO = 150.0
+
+# Consultas com até este número de pontos resolvem o modelo direto (alguns µs a ms por
+# ponto) em vez de montar a tabela (décimos de segundo no primeiro uso)
+PONTOS_DIRETOS = 128
+
+_tabela = None
+
+
+def _proprio(esbeltez):
+    """Resistência própria (ρ = 1) da haste de comprimento 1 com L/d = esbeltez"""
+    return resistencia_haste_unica(1.0, 1.0, 1.0 / np.asarray(esbeltez, dtype=float))
+
+
+def _fatores_linha(n, mutuas, proprio):
+    """
+    η de n hastes em linha. mutuas (..., n): linha da matriz de Toeplitz com mutuas[..., 0] = 0;
+    proprio (...): resistência própria. Hastes espelhadas têm a mesma corrente, então o
+    sistema n × n se reduz a ⌈n/2⌉ incógnitas.
+    """
+    metade, pares = (n + 1) // 2, n // 2
+    indices = np.arange(n)
+    M = mutuas[..., np.abs(indices[:metade, None] - indices[None, :])]
+    A = M[..., :metade] + np.asarray(proprio, dtype=float)[..., None, None] * np.eye(metade)
+    A[..., :pares] += M[..., ::-1][..., :pares]
+    correntes = np.linalg.solve(A, np.ones(A.shape[:-1] + (1,)))[..., 0]
+    peso = np.where(np.arange(metade) < pares, 2.0, 1.0)
+    return (correntes * peso).sum(axis=-1) * proprio / n
+
+
+def _linha_mutuas(relacoes, n):
+    """Linha de Toeplitz das mútuas (ρ = 1, L = 1) para hastes espaçadas de relacoes"""
+    distancias = np.asarray(relacoes, dtype=float)[..., None] * np.arange(1, n)
+    return np.concatenate([np.zeros(distancias.shape[:-1] + (1,)), resistencia_mutua(distancias, 1.0, 1.0)],
+                          axis=-1)
+
+
+def calcular_tabela(n_maximo=N_MAXIMO, relacoes=None, esbeltezes=None):
+    """
+    η(n, s/L, L/d) de hastes em linha pelo modelo de resistências mútuas de Arranjo_Hastes.
+
+    Cada tamanho n é resolvido para todas as relações s/L e esbeltezes de uma vez.
+    Retorna (relacoes, esbeltezes, tabela float32 de forma (n_maximo, len(relacoes), len(esbeltezes))).
+    """
+    if relacoes is None:
+        relacoes = np.geomspace(RELACAO_MINIMA, RELACAO_MAXIMA, PONTOS_RELACAO)
+    if esbeltezes is None:
+        esbeltezes = np.geomspace(ESBELTEZ_MINIMA, ESBELTEZ_MAXIMA, PONTOS_ESBELTEZ)
+    relacoes = np.asarray(relacoes, dtype=float)
+    esbeltezes = np.asarray(esbeltezes, dtype=float)
+
+    linha = _linha_mutuas(relacoes, n_maximo)[:, None, :]
+    proprio = _proprio(esbeltezes)[None, :]
+    tabela = np.empty((n_maximo, len(relacoes), len(esbeltezes)), dtype=np.float32)
+    for n in range(1, n_maximo + 1):
+        tabela[n - 1] = _fatores_linha(n, linha[..., :n], proprio)
+    return relacoes, esbeltezes, tabela
+
+
+def tabela():
+    """Tabela padrão, calculada no primeiro uso (alguns décimos de segundo)"""
+    global _tabela
+    if _tabela is None:
+        _tabela = calcular_tabela()
+    return _tabela
+
+
+def fator_utilizacao(n_hastes, relacao_espacamento=1.0, relacao_comprimento_diametro=RELACAO_COMPRIMENTO_DIAMETRO):
+    """
+    Fator de utilização η de n hastes em linha com espaçamento s = relacao_espacamento × L
+    e L/d = relacao_comprimento_diametro. Aceita arrays (broadcast).
+
+    Até PONTOS_DIRETOS pontos η vem do modelo direto (n arredondado); acima, de
+    interpolar_tabela.
+    """
+    n, relacao, esbeltez = np.broadcast_arrays(np.asarray(n_hastes, dtype=float),
+                                               np.asarray(relacao_espacamento, dtype=float),
+                                               np.asarray(relacao_comprimento_diametro, dtype=float))
+    if n.size > PONTOS_DIRETOS:
+        return interpolar_tabela(n, relacao, esbeltez)
+
+    validos = (n >= 1) & (relacao > 0) & (esbeltez > 1)
+    eta = np.full(n.shape, np.nan)
+    eta[validos] = _fatores_exatos(n[validos], relacao[validos], esbeltez[validos])
+    return float(eta) if eta.ndim == 0 else eta
+
+
+def interpolar_tabela(n_hastes, relacao_espacamento=1.0, relacao_comprimento_diametro=RELACAO_COMPRIMENTO_DIAMETRO):
+    """
+    η por interpolação na tabela: n linear, s/L logarítmica e, na esbeltez, 1/η linear em
+    1/R0. Fora da tabela η vem do modelo completo, com n arredondado.
+    """
+    n, relacao, esbeltez = np.broadcast_arrays(np.asarray(n_hastes, dtype=float),
+                                               np.asarray(relacao_espacamento, dtype=float),
+                                               np.asarray(relacao_comprimento_diametro, dtype=float))
+    validos = (n >= 1) & (relacao > 0) & (esbeltez > 1)
+    relacoes, esbeltezes, valores = tabela()
+    inversos = 1 / _proprio(esbeltezes)
+
+    # Posição fracionária em cada eixo
+    pos_n = n - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pos_r = np.interp(np.log(relacao), np.log(relacoes), np.arange(len(relacoes)))
+        pos_e = np.interp(1 / _proprio(esbeltez), inversos[::-1], np.arange(len(esbeltezes))[::-1])
+    i = np.clip(np.floor(pos_n).astype(np.int64), 0, len(valores) - 2)
+    j = np.clip(np.floor(pos_r).astype(np.int64), 0, len(relacoes) - 2)
+    k = np.clip(np.floor(pos_e).astype(np.int64), 0, len(esbeltezes) - 2)
+    tn, tr, te = pos_n - i, pos_r - j, pos_e - k
+
+    inverso = 0.0
+    for di, pn in ((0, 1 - tn), (1, tn)):
+        for dj, pr in ((0, 1 - tr), (1, tr)):
+            for dk, pe in ((0, 1 - te), (1, te)):
+                inverso = inverso + pn * pr * pe / valores[i + di, j + dj, k + dk]
+    eta = np.array(1 / inverso)
+
+    fora = validos & ((n > len(valores)) | (relacao < relacoes[0]) | (relacao > relacoes[-1]) |
+                      (esbeltez < esbeltezes[0]) | (esbeltez > esbeltezes[-1]))
+    if np.any(fora):
+        eta[fora] = _fatores_exatos(n[fora], relacao[fora], esbeltez[fora])
+    eta = np.where(validos, eta, np.nan)
+
+    return float(eta) if eta.ndim == 0 else eta
+
+
+def _fatores_exatos(n_hastes, relacao_espacamento, relacao_comprimento_diametro):
+    """η do modelo completo ponto a ponto (n arredondado), agrupando os pontos de mesmo n"""
+    n = np.round(n_hastes).astype(np.int64)
+    eta = np.empty(n.shape)
+    for tamanho in np.unique(n):
+        selecao = n == tamanho
+        if tamanho > N_MAXIMO:
+            eta[selecao] = [_fator_exato(int(tamanho), r, e)
+                            for r, e in zip(relacao_espacamento[selecao], relacao_comprimento_diametro[selecao])]
+        else:
+            eta[selecao] = _fatores_linha(int(tamanho), _linha_mutuas(relacao_espacamento[selecao], tamanho),
+                                          _proprio(relacao_comprimento_diametro[selecao]))
+    return eta
+
+
+def _fator_exato(n_hastes, relacao_espacamento, relacao_comprimento_diametro=RELACAO_COMPRIMENTO_DIAMETRO):
+    comprimento = 1.0
+    resultado = resistencia_arranjo(1.0, arranjo_linha(n_hastes, relacao_espacamento * comprimento),
+                                    comprimento, comprimento / relacao_comprimento_diametro)
+    return resultado['fator_utilizacao']
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Tabela de fatores de utilização η(n, s/L, L/d) de hastes em linha e erro da interpolação.")
+    parser.add_argument('--amostras', type=int, default=200,
+                        help="pontos aleatórios comparados com o modelo completo (padrão: 200)")
+    args = parser.parse_args()
+
+    import time
+
+    inicio = time.perf_counter()
+    relacoes, esbeltezes, valores = tabela()
+    duracao = time.perf_counter() - inicio
+
+    print("=" * 60)
+    print("FATOR DE UTILIZAÇÃO - HASTES EM LINHA")
+    print("=" * 60)
+    print(f"Tabela {' × '.join(map(str, valores.shape))} (n × s/L × L/d), {valores.nbytes / 1024:.1f} KiB, "
+          f"calculada em {1000 * duracao:.0f} ms")
+    for esbeltez in (50, RELACAO_COMPRIMENTO_DIAMETRO, 500):
+        print(f"\nL/d = {esbeltez:g}")
+        print(f"{'n':>4}" + "".join(f"{f's/L={r:g}':>10}" for r in (0.5, 1, 2, 4)))
+        for n in (2, 3, 4, 5, 6, 8, 10, 20, 50):
+            print(f"{n:>4}" + "".join(f"{fator_utilizacao(n, r, esbeltez):>10.3f}" for r in (0.5, 1, 2, 4)))
+
+    gerador = np.random.default_rng(0)
+    n = gerador.integers(2, N_MAXIMO + 1, args.amostras)
+    relacao = np.exp(gerador.uniform(math.log(RELACAO_MINIMA), math.log(RELACAO_MAXIMA), args.amostras))
+    esbeltez = np.exp(gerador.uniform(math.log(ESBELTEZ_MINIMA), math.log(ESBELTEZ_MAXIMA), args.amostras))
+    exatos = np.array([_fator_exato(int(k), r, e) for k, r, e in zip(n, relacao, esbeltez)])
+    erro = np.abs(interpolar_tabela(n, relacao, esbeltez) / exatos - 1)
+    print(f"\nErro relativo da interpolação em {args.amostras} pontos: "
+          f"médio {erro.mean():.2e}, máximo {erro.max():.2e}")
+
+    n = gerador.uniform(1, N_MAXIMO, 1_000_000)
+    relacao = np.exp(gerador.uniform(math.log(RELACAO_MINIMA), math.log(RELACAO_MAXIMA), 1_000_000))
+    esbeltez = np.exp(gerador.uniform(math.log(ESBELTEZ_MINIMA), math.log(ESBELTEZ_MAXIMA), 1_000_000))
+    inicio = time.perf_counter()
+    fator_utilizacao(n, relacao, esbeltez)
+    print(f"Consulta vetorizada: {1e9 * (time.perf_counter() - inicio) / 1_000_000:.0f} ns por ponto")
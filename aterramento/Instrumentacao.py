@@ -0,0 +1,155 @@
+import atexit
+import functools
+import os
+import threading
+import time
+import warnings
+
+# Desligada por padrão. ATERRAMENTO_PERFIL=1 (ou true/yes/on/sim) liga a coleta e imprime o
+# resumo ao sair; ATERRAMENTO_PERFIL_TRACE=caminho também liga e grava o trace nesse arquivo
+VALORES_LIGADO = ('1', 'true', 'yes', 'on', 'sim')
+VALORES_DESLIGADO = ('', '0', 'false', 'no', 'off', 'nao', 'não')
+
+
+def _ler_ambiente(ambiente=os.environ):
+    """(ligada, caminho do trace ou None) a partir das variáveis de ambiente"""
+    valor = ambiente.get('ATERRAMENTO_PERFIL', '').strip().lower()
+    caminho = ambiente.get('ATERRAMENTO_PERFIL_TRACE', '').strip() or None
+    if valor not in VALORES_LIGADO + VALORES_DESLIGADO:
+        warnings.warn(f"ATERRAMENTO_PERFIL={valor!r} não reconhecido; use 1 para ligar "
+                      f"(o trace vai em ATERRAMENTO_PERFIL_TRACE)", RuntimeWarning, stacklevel=2)
+    return valor in VALORES_LIGADO or caminho is not None, caminho
+
+
+_ativo, _CAMINHO_TRACE = _ler_ambiente()
+_eventos = []
+_trava = threading.Lock()
+_origem = time.perf_counter()
+_saida_registrada = False
+
+
+def ativar():
+    global _ativo
+    _ativo = True
+    _registrar_saida()
+
+
+def desativar():
+    global _ativo
+    _ativo = False
+
+
+def ativo():
+    return _ativo
+
+
+def limpar():
+    with _trava:
+        _eventos.clear()
+
+
+class etapa:
+    """
+    Mede o tempo de parede de uma etapa, como bloco with ou decorador:
+
+        with etapa('formula', tipo='malha'):
+            ...
+
+        @etapa('renderizacao')
+        def mostrar_resultado(...):
+
+    Com a instrumentação desligada o custo é só o teste de uma variável global.
+    """
+
+    __slots__ = ('nome', 'argumentos', '_inicio')
+
+    def __init__(self, nome, **argumentos):
+        self.nome = nome
+        self.argumentos = argumentos
+        self._inicio = None
+
+    def __enter__(self):
+        if _ativo:
+            self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao):
+        if self._inicio is not None:
+            fim = time.perf_counter()
+            with _trava:
+                _eventos.append((self.nome, self._inicio, fim - self._inicio,
+                                 threading.get_ident(), self.argumentos))
+            self._inicio = None
+        return False
+
+    def __call__(self, funcao):
+        nome, argumentos = self.nome, self.argumentos
+
+        @functools.wraps(funcao)
+        def instrumentada(*args, **kwargs):
+            if not _ativo:
+                return funcao(*args, **kwargs)
+            with etapa(nome, **argumentos):
+                return funcao(*args, **kwargs)
+        return instrumentada
+
+
+def resumo():
+    """{etapa: {'chamadas', 'total_ms', 'media_ms', 'maximo_ms'}}, da maior para a menor soma de tempo"""
+    with _trava:
+        eventos = list(_eventos)
+    acumulado = {}
+    for nome, _, duracao, _, _ in eventos:
+        chamadas, total, maximo = acumulado.get(nome, (0, 0.0, 0.0))
+        acumulado[nome] = (chamadas + 1, total + duracao, max(maximo, duracao))
+    ordenado = sorted(acumulado.items(), key=lambda item: -item[1][1])
+    return {nome: {'chamadas': chamadas, 'total_ms': 1000 * total, 'media_ms': 1000 * total / chamadas,
+                   'maximo_ms': 1000 * maximo}
+            for nome, (chamadas, total, maximo) in ordenado}
+
+
+def imprimir_resumo():
+    print("=" * 72)
+    print("TEMPO POR ETAPA")
+    print("=" * 72)
+    print(f"{'Etapa':<30}{'Chamadas':>10}{'Total (ms)':>12}{'Média (ms)':>11}{'Máx (ms)':>9}")
+    print("-" * 72)
+    for nome, r in resumo().items():
+        print(f"{nome:<30}{r['chamadas']:>10}{r['total_ms']:>12.2f}{r['media_ms']:>11.3f}{r['maximo_ms']:>9.2f}")
+
+
+def exportar_chrome(caminho):
+    """Grava os eventos no formato Trace Event do Chrome (chrome://tracing, Perfetto)"""
+    import json
+
+    with _trava:
+        eventos = list(_eventos)
+    pid = os.getpid()
+    dados = {
+        'traceEvents': [{'name': nome, 'cat': 'aterramento', 'ph': 'X',
+                         'ts': 1e6 * (inicio - _origem), 'dur': 1e6 * duracao,
+                         'pid': pid, 'tid': thread, 'args': argumentos}
+                        for nome, inicio, duracao, thread, argumentos in eventos],
+        'displayTimeUnit': 'ms',
+    }
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(dados, arquivo, ensure_ascii=False)
+
+
+def _ao_sair():
+    if _eventos:
+        if _CAMINHO_TRACE:
+            exportar_chrome(_CAMINHO_TRACE)
+        imprimir_resumo()
+
+
+def _registrar_saida():
+    """Registra _ao_sair no atexit uma única vez, ligada pelo ambiente ou por ativar()"""
+    global _saida_registrada
+    if not _saida_registrada:
+        atexit.register(_ao_sair)
+        _saida_registrada = True
+
+
+if _ativo:
+    _registrar_saida()
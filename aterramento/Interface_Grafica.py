@@ -1,9 +1,117 @@
 import math
+from collections import OrderedDict
+
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Rectangle
 from matplotlib.widgets import Slider, Button, RadioButtons
 
+from Cache_Calculo import cache_global
+from Instrumentacao import etapa
+
+# Intervalo mínimo entre redesenhos durante o arraste dos sliders (~60 quadros/s)
+INTERVALO_QUADRO_MS = 16
+# Janelas de gráfico mantidas abertas ao mesmo tempo; a mais antiga é fechada além disso
+MAXIMO_FIGURAS = 8
+
+# Eixos das curvas R = f(L) e R = f(d), iguais em todos os cliques
+COMPRIMENTOS_GRAFICO = np.linspace(0.5, 10, 100)
+DIAMETROS_GRAFICO = np.linspace(0.005, 0.05, 100)
+
+
+class AtualizacaoBlit:
+    """
+    Redesenha só os artistas que mudam (blitting): o resto da figura é guardado como
+    fundo a cada desenho completo e restaurado antes de desenhar os artistas por cima.
+    """
+    
+    def __init__(self, figura):
+        self.figura = figura
+        self.canvas = figura.canvas
+        self.artistas = []
+        self.alterados = []
+        self.fundo = None
+        self.canvas.mpl_connect('draw_event', self.ao_desenhar)
+    
+    def adicionar(self, artista):
+        artista.set_animated(True)
+        self.artistas.append(artista)
+        return artista
+    
+    def marcar_alterado(self, artista):
+        """Artista opaco comum (ex.: eixos de um slider) que mudou desde o último desenho completo"""
+        if artista not in self.alterados:
+            self.alterados.append(artista)
+    
+    def ao_desenhar(self, event):
+        self.alterados = []
+        if self.canvas.supports_blit:
+            self.fundo = self.canvas.copy_from_bbox(self.figura.bbox)
+        self.desenhar_artistas()
+    
+    def desenhar_artistas(self):
+        for artista in self.alterados + self.artistas:
+            self.figura.draw_artist(artista)
+    
+    @etapa('redesenho.blit')
+    def atualizar(self):
+        if self.fundo is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.fundo)
+        self.desenhar_artistas()
+        self.canvas.blit(self.figura.bbox)
+        self.canvas.flush_events()
+
+
+class GerenciadorGraficos:
+    """
+    Mantém as janelas de gráfico vivas entre cliques: cada gráfico tem nome, é criado
+    uma vez e depois só tem seus dados atualizados. Janelas fechadas pelo usuário são
+    esquecidas (e recriadas no próximo pedido); acima de maximo_figuras a mais antiga é fechada.
+    """
+    
+    def __init__(self, maximo_figuras=MAXIMO_FIGURAS):
+        self.maximo_figuras = maximo_figuras
+        self.figuras = OrderedDict()
+    
+    def mostrar(self, nome, criar, atualizar):
+        """criar() -> (figura, artistas); atualizar(artistas) muda os dados no lugar"""
+        with etapa('redesenho.grafico', grafico=nome):
+            return self._mostrar(nome, criar, atualizar)
+    
+    def _mostrar(self, nome, criar, atualizar):
+        if nome in self.figuras and not plt.fignum_exists(self.figuras[nome][0].number):
+            del self.figuras[nome]
+        
+        if nome in self.figuras:
+            self.figuras.move_to_end(nome)
+            figura, artistas = self.figuras[nome]
+        else:
+            figura, artistas = criar()
+            figura.canvas.mpl_connect('close_event', lambda event, nome=nome: self.esquecer(nome, figura))
+            self.figuras[nome] = (figura, artistas)
+            while len(self.figuras) > self.maximo_figuras:
+                self.fechar(next(iter(self.figuras)))
+        
+        atualizar(artistas)
+        figura.canvas.draw_idle()
+        plt.show(block=False)
+        return figura
+    
+    def esquecer(self, nome, figura):
+        if nome in self.figuras and self.figuras[nome][0] is figura:
+            del self.figuras[nome]
+    
+    def fechar(self, nome):
+        figura, _ = self.figuras.pop(nome)
+        plt.close(figura)
+    
+    def fechar_todos(self):
+        for nome in list(self.figuras):
+            self.fechar(nome)
+
+
 class DemonstracaoAterramentoSeparada:
     def __init__(self):
         # Valores iniciais
@@ -24,9 +132,20 @@ class DemonstracaoAterramentoSeparada:
         self.fig_controles.suptitle('🎮 CONTROLES - SISTEMA DE ATERRAMENTO', 
                                   fontsize=16, fontweight='bold')
         
+        self.graficos = GerenciadorGraficos()
+        self.blit_controles = AtualizacaoBlit(self.fig_controles)
+        self.atualizacao_pendente = False
+        self.temporizador = self.fig_controles.canvas.new_timer(interval=INTERVALO_QUADRO_MS)
+        self.temporizador.single_shot = True
+        # Só canvas de backends interativos têm laço de eventos para disparar o temporizador;
+        # nos demais (ex.: Agg) cada mudança é aplicada na hora
+        self.agrupar_atualizacoes = self.fig_controles.canvas.required_interactive_framework is not None
+        self.temporizador.add_callback(self.aplicar_atualizacao)
+        
         self.setup_ui()
         self.criar_visualizacao_principal()
         
+    @etapa('formula', tipo='dwight_demo')
     def formula_dwight(self, rho, L, d):
         """Fórmula de Dwight para hastes verticais"""
         if L <= 0 or d <= 0:
@@ -42,6 +161,7 @@ class DemonstracaoAterramentoSeparada:
         ax_info.axis('off')
         self.texto_info = ax_info.text(0.02, 0.8, '', transform=ax_info.transAxes, 
                                       fontsize=11, verticalalignment='top', fontfamily='monospace')
+        self.blit_controles.adicionar(self.texto_info)
         
         # Slider para resistividade
         ax_rho = plt.axes([0.25, 0.6, 0.6, 0.03])
@@ -97,6 +217,14 @@ class DemonstracaoAterramentoSeparada:
         ax_visualizar = plt.axes([0.7, 0.15, 0.2, 0.05])
         self.button_visualizar = Button(ax_visualizar, '📈 Ver Gráficos', color='#90EE90')
         
+        ax_fechar = plt.axes([0.7, 0.05, 0.2, 0.05])
+        self.button_fechar = Button(ax_fechar, '✖ Fechar Gráficos', color='#F0F0F0')
+        
+        # Sliders não redesenham a figura inteira: só os eixos do slider movido entram no blit
+        for slider in (self.slider_rho, self.slider_L, self.slider_d):
+            slider.drawon = False
+            slider.on_changed(lambda val, ax=slider.ax: self.blit_controles.marcar_alterado(ax))
+        
         # Conectar eventos
         self.slider_rho.on_changed(self.atualizar_valores)
         self.slider_L.on_changed(self.atualizar_valores)
@@ -104,6 +232,7 @@ class DemonstracaoAterramentoSeparada:
         self.radio_tipos.on_clicked(self.selecionar_tipo_solo)
         self.button_reset.on_clicked(self.resetar)
         self.button_visualizar.on_clicked(self.mostrar_graficos)
+        self.button_fechar.on_clicked(lambda event: self.fechar_graficos())
         
         self.atualizar_informacoes()
     
@@ -111,14 +240,25 @@ class DemonstracaoAterramentoSeparada:
         """Atualiza para um tipo de solo pré-definido"""
         self.rho = self.tipos_solo[label]
         self.slider_rho.set_val(self.rho)
-        self.atualizar_informacoes()
     
     def atualizar_valores(self, val):
-        """Atualiza os valores quando os sliders mudam"""
+        """Atualiza os valores quando os sliders mudam; rajadas de eventos viram um só redesenho"""
         self.rho = self.slider_rho.val
         self.L = self.slider_L.val
         self.d = self.slider_d.val / 1000
+        if self.atualizacao_pendente:
+            return
+        if not self.agrupar_atualizacoes:
+            self.aplicar_atualizacao()
+            return
+        self.atualizacao_pendente = True
+        self.temporizador.start()
+    
+    @etapa('slider')
+    def aplicar_atualizacao(self):
+        self.atualizacao_pendente = False
         self.atualizar_informacoes()
+        self.atualizar_visualizacao_principal()
     
     def resetar(self, event):
         """Reseta para valores padrão"""
@@ -128,8 +268,8 @@ class DemonstracaoAterramentoSeparada:
         self.slider_rho.set_val(self.rho)
         self.slider_L.set_val(self.L)
         self.slider_d.set_val(self.d * 1000)
-        self.atualizar_informacoes()
     
+    @etapa('redesenho.controles')
     def atualizar_informacoes(self):
         """Atualiza o painel de informações"""
         R = self.formula_dwight(self.rho, self.L, self.d)
@@ -146,7 +286,7 @@ class DemonstracaoAterramentoSeparada:
 🎯 CLASSIFICAÇÃO: {self.classificar_resistencia(R)}"""
         
         self.texto_info.set_text(info_text)
-        plt.draw()
+        self.blit_controles.atualizar()
     
     def obter_tipo_solo(self, rho):
         """Classifica o tipo de solo baseado na resistividade"""
@@ -163,55 +303,71 @@ class DemonstracaoAterramentoSeparada:
         else: return "❌ PRECISA MELHORAR"
     
     def criar_visualizacao_principal(self):
-        """Cria a visualização principal do sistema"""
+        """Cria a visualização principal do sistema (artistas persistentes)"""
         self.fig_principal = plt.figure(figsize=(8, 8))
         self.fig_principal.suptitle('🏗️ VISUALIZAÇÃO DO SISTEMA DE ATERRAMENTO', 
                                   fontsize=16, fontweight='bold')
         
         self.ax_principal = plt.axes([0.1, 0.1, 0.8, 0.8])
-        self.atualizar_visualizacao_principal()
-    
-    def atualizar_visualizacao_principal(self):
-        """Atualiza a visualização principal"""
-        self.ax_principal.clear()
-        
-        R = self.formula_dwight(self.rho, self.L, self.d)
-        tipo_solo = self.obter_tipo_solo(self.rho)
-        cor_solo = self.obter_cor_solo(self.rho)
+        self.blit_principal = AtualizacaoBlit(self.fig_principal)
+        ax = self.ax_principal
         
         # Desenhar solo
-        solo_depth = self.L + 2
-        self.ax_principal.add_patch(Rectangle((-1, 0), 2, solo_depth, 
-                                            facecolor=cor_solo, alpha=0.8))
+        self.patch_solo = self.blit_principal.adicionar(ax.add_patch(Rectangle((-1, 0), 2, 1, alpha=0.8)))
         
         # Desenhar haste
-        self.ax_principal.add_patch(Rectangle((-self.d/2, 0), self.d, self.L, 
-                                            facecolor='#696969', edgecolor='black', linewidth=2))
+        self.patch_haste = self.blit_principal.adicionar(ax.add_patch(Rectangle((0, 0), 0, 0, 
+                                            facecolor='#696969', edgecolor='black', linewidth=2)))
         
         # Superfície
-        self.ax_principal.axhline(y=0, color='#8B4513', linewidth=4)
+        self.blit_principal.adicionar(ax.axhline(y=0, color='#8B4513', linewidth=4))
         
         # Textos
-        self.ax_principal.text(0, solo_depth - 0.5, f'TIPO: {tipo_solo.upper()}', 
+        self.texto_tipo = self.blit_principal.adicionar(ax.text(0, 0, '', 
                               ha='center', va='center', fontweight='bold', fontsize=12,
-                              bbox=dict(boxstyle="round,pad=0.5", facecolor="white"))
+                              bbox=dict(boxstyle="round,pad=0.5", facecolor="white")))
         
-        self.ax_principal.text(0, self.L/2, f'HASTE\n{self.L:.1f}m\n⌀{self.d*1000:.0f}mm', 
+        self.texto_haste = self.blit_principal.adicionar(ax.text(0, 0, '', 
                               ha='center', va='center', color='white', fontweight='bold',
-                              bbox=dict(boxstyle="round,pad=0.3", facecolor="black", alpha=0.7))
+                              bbox=dict(boxstyle="round,pad=0.3", facecolor="black", alpha=0.7)))
         
-        self.ax_principal.text(0, -0.8, f'RESISTÊNCIA DE ATERRAMENTO: {R:.1f} Ω', 
+        self.texto_resistencia = self.blit_principal.adicionar(ax.text(0, -0.8, '', 
                               ha='center', va='top', fontsize=14, fontweight='bold',
-                              bbox=dict(boxstyle="round,pad=0.8", facecolor="yellow"))
+                              bbox=dict(boxstyle="round,pad=0.8", facecolor="yellow")))
+        
+        # Limites fixos pelo maior comprimento do slider: mudar L não exige redesenhar os eixos
+        ax.set_xlim(-1, 1)
+        ax.set_ylim(-1, self.slider_L.valmax + 2)
+        ax.set_aspect('equal')
+        ax.set_xlabel('Largura (m)', fontweight='bold')
+        ax.set_ylabel('Profundidade (m)', fontweight='bold')
+        ax.grid(True, alpha=0.3)
         
-        self.ax_principal.set_xlim(-1, 1)
-        self.ax_principal.set_ylim(-1, solo_depth)
-        self.ax_principal.set_aspect('equal')
-        self.ax_principal.set_xlabel('Largura (m)', fontweight='bold')
-        self.ax_principal.set_ylabel('Profundidade (m)', fontweight='bold')
-        self.ax_principal.grid(True, alpha=0.3)
+        self.atualizar_visualizacao_principal()
+    
+    @etapa('redesenho.visualizacao')
+    def atualizar_visualizacao_principal(self):
+        """Atualiza a visualização principal"""
+        R = self.formula_dwight(self.rho, self.L, self.d)
+        tipo_solo = self.obter_tipo_solo(self.rho)
+        
+        solo_depth = self.L + 2
+        self.patch_solo.set_height(solo_depth)
+        self.patch_solo.set_facecolor(self.obter_cor_solo(self.rho))
+        
+        self.patch_haste.set_x(-self.d/2)
+        self.patch_haste.set_width(self.d)
+        self.patch_haste.set_height(self.L)
+        
+        self.texto_tipo.set_y(solo_depth - 0.5)
+        self.texto_tipo.set_text(f'TIPO: {tipo_solo.upper()}')
+        
+        self.texto_haste.set_y(self.L/2)
+        self.texto_haste.set_text(f'HASTE\n{self.L:.1f}m\n⌀{self.d*1000:.0f}mm')
+        
+        self.texto_resistencia.set_text(f'RESISTÊNCIA DE ATERRAMENTO: {R:.1f} Ω')
         
-        plt.draw()
+        self.blit_principal.atualizar()
     
     def obter_cor_solo(self, rho):
         """Retorna cor baseada na resistividade"""
@@ -221,92 +377,110 @@ class DemonstracaoAterramentoSeparada:
         else: return '#FF8C00'
     
     def mostrar_graficos(self, event):
-        """Mostra gráficos separados em janelas individuais"""
-        self.criar_grafico_comprimento()
-        self.criar_grafico_diametro()
-        self.criar_grafico_comparacao()
+        """Mostra gráficos separados em janelas individuais (reaproveitadas entre cliques)"""
+        self.graficos.mostrar('comprimento', self.criar_grafico_comprimento, self.atualizar_grafico_comprimento)
+        self.graficos.mostrar('diametro', self.criar_grafico_diametro, self.atualizar_grafico_diametro)
+        self.graficos.mostrar('comparacao', self.criar_grafico_comparacao, self.atualizar_grafico_comparacao)
         self.atualizar_visualizacao_principal()
     
+    def varredura_dwight(self, rho, L=None, d=None):
+        """
+        Curva de Dwight vetorizada em L (d fixo) ou em d (L fixo), guardada no cache
+        global: voltar a uma combinação já vista não recalcula a curva.
+        """
+        if L is None:
+            nome, fixos, L = 'dwight_varredura_L', {'rho': rho, 'd': d}, COMPRIMENTOS_GRAFICO
+        else:
+            nome, fixos, d = 'dwight_varredura_d', {'rho': rho, 'L': L}, DIAMETROS_GRAFICO
+        
+        def calcular():
+            curva = rho / (2 * math.pi * L) * np.log(4 * L / d)
+            curva.flags.writeable = False
+            return curva
+        return cache_global.obter(nome, fixos, calcular)
+    
     def criar_grafico_comprimento(self):
         """Cria gráfico do efeito do comprimento"""
         fig, ax = plt.subplots(figsize=(10, 6))
         
-        comprimentos = np.linspace(0.5, 10, 100)
-        resistencias = [self.formula_dwight(self.rho, L, self.d) for L in comprimentos]
-        
-        ax.plot(comprimentos, resistencias, 'b-', linewidth=3, label='R = f(L)')
-        
-        R_atual = self.formula_dwight(self.rho, self.L, self.d)
-        ax.plot(self.L, R_atual, 'ro', markersize=10, label=f'Atual: L={self.L:.1f}m, R={R_atual:.1f}Ω')
+        artistas = {'ax': ax}
+        artistas['curva'], = ax.plot(COMPRIMENTOS_GRAFICO, np.zeros_like(COMPRIMENTOS_GRAFICO), 
+                                     'b-', linewidth=3, label='R = f(L)')
+        artistas['ponto'], = ax.plot([], [], 'ro', markersize=10, label=' ')
         
         ax.set_xlabel('Comprimento da Haste (m)', fontweight='bold', fontsize=12)
         ax.set_ylabel('Resistência (Ω)', fontweight='bold', fontsize=12)
         ax.set_title('📏 EFEITO DO COMPRIMENTO DA HASTE NA RESISTÊNCIA', 
                     fontweight='bold', fontsize=14)
-        ax.legend(fontsize=11)
+        artistas['legenda'] = ax.legend(fontsize=11)
         ax.grid(True, alpha=0.3)
-        ax.set_ylim(bottom=0)
         
-        ax.text(0.02, 0.98, f'ρ = {self.rho} Ω·m | d = {self.d*1000:.0f} mm', 
+        artistas['info'] = ax.text(0.02, 0.98, '', 
                 transform=ax.transAxes, fontsize=10, verticalalignment='top',
                 bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue"))
         
         plt.tight_layout()
-        plt.show(block=False)
+        return fig, artistas
+    
+    def atualizar_grafico_comprimento(self, artistas):
+        resistencias = self.varredura_dwight(self.rho, d=self.d)
+        artistas['curva'].set_ydata(resistencias)
+        
+        R_atual = self.formula_dwight(self.rho, self.L, self.d)
+        artistas['ponto'].set_data([self.L], [R_atual])
+        artistas['legenda'].get_texts()[1].set_text(f'Atual: L={self.L:.1f}m, R={R_atual:.1f}Ω')
+        artistas['info'].set_text(f'ρ = {self.rho:.0f} Ω·m | d = {self.d*1000:.0f} mm')
+        
+        artistas['ax'].set_ylim(0, resistencias.max() * 1.05)
     
     def criar_grafico_diametro(self):
         """Cria gráfico do efeito do diâmetro"""
         fig, ax = plt.subplots(figsize=(10, 6))
         
-        diametros = np.linspace(0.005, 0.05, 100)
-        resistencias = [self.formula_dwight(self.rho, self.L, d) for d in diametros]
-        
-        ax.plot([d * 1000 for d in diametros], resistencias, 'g-', linewidth=3, label='R = f(d)')
-        
-        R_atual = self.formula_dwight(self.rho, self.L, self.d)
-        ax.plot(self.d * 1000, R_atual, 'ro', markersize=10, 
-                label=f'Atual: d={self.d*1000:.0f}mm, R={R_atual:.1f}Ω')
+        artistas = {'ax': ax}
+        artistas['curva'], = ax.plot(DIAMETROS_GRAFICO * 1000, np.zeros_like(DIAMETROS_GRAFICO), 
+                                     'g-', linewidth=3, label='R = f(d)')
+        artistas['ponto'], = ax.plot([], [], 'ro', markersize=10, label=' ')
         
         ax.set_xlabel('Diâmetro da Haste (mm)', fontweight='bold', fontsize=12)
         ax.set_ylabel('Resistência (Ω)', fontweight='bold', fontsize=12)
         ax.set_title('📐 EFEITO DO DIÂMETRO DA HASTE NA RESISTÊNCIA', 
                     fontweight='bold', fontsize=14)
-        ax.legend(fontsize=11)
+        artistas['legenda'] = ax.legend(fontsize=11)
         ax.grid(True, alpha=0.3)
-        ax.set_ylim(bottom=0)
         
-        ax.text(0.02, 0.98, f'ρ = {self.rho} Ω·m | L = {self.L:.1f} m', 
+        artistas['info'] = ax.text(0.02, 0.98, '', 
                 transform=ax.transAxes, fontsize=10, verticalalignment='top',
                 bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen"))
         
         plt.tight_layout()
-        plt.show(block=False)
+        return fig, artistas
+    
+    def atualizar_grafico_diametro(self, artistas):
+        resistencias = self.varredura_dwight(self.rho, L=self.L)
+        artistas['curva'].set_ydata(resistencias)
+        
+        R_atual = self.formula_dwight(self.rho, self.L, self.d)
+        artistas['ponto'].set_data([self.d * 1000], [R_atual])
+        artistas['legenda'].get_texts()[1].set_text(f'Atual: d={self.d*1000:.0f}mm, R={R_atual:.1f}Ω')
+        artistas['info'].set_text(f'ρ = {self.rho:.0f} Ω·m | L = {self.L:.1f} m')
+        
+        artistas['ax'].set_ylim(0, resistencias.max() * 1.05)
     
     def criar_grafico_comparacao(self):
         """Cria gráfico de comparação com solos típicos"""
         fig, ax = plt.subplots(figsize=(10, 6))
         
-        solos = list(self.tipos_solo.keys())
-        resistencias = []
-        cores = ['#2E8B57', '#90EE90', '#FFD700', '#FF8C00']
-        
-        for i, solo in enumerate(solos):
-            rho = self.tipos_solo[solo]
-            R = self.formula_dwight(rho, self.L, self.d)
-            resistencias.append(R)
+        solos = list(self.tipos_solo.keys()) + ["SEU CASO"]
+        cores = ['#2E8B57', '#90EE90', '#FFD700', '#FF8C00', '#FF4444']
         
-        # Adicionar caso atual
-        solos.append("SEU CASO")
-        resistencias.append(self.formula_dwight(self.rho, self.L, self.d))
-        cores.append('#FF4444')
-        
-        bars = ax.bar(solos, resistencias, color=cores, alpha=0.8, edgecolor='black')
+        artistas = {'ax': ax}
+        artistas['barras'] = ax.bar(solos, np.zeros(len(solos)), color=cores, alpha=0.8, edgecolor='black')
         
         # Valores nas barras
-        for bar, valor in zip(bars, resistencias):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(resistencias)*0.01,
-                   f'{valor:.1f} Ω', ha='center', va='bottom', fontweight='bold')
+        artistas['valores'] = [ax.text(bar.get_x() + bar.get_width()/2., 0, '', 
+                                       ha='center', va='bottom', fontweight='bold')
+                               for bar in artistas['barras']]
         
         ax.set_ylabel('Resistência de Aterramento (Ω)', fontweight='bold', fontsize=12)
         ax.set_title('🏆 COMPARAÇÃO DA RESISTÊNCIA ENTRE DIFERENTES SOLOS', 
@@ -314,12 +488,30 @@ class DemonstracaoAterramentoSeparada:
         ax.tick_params(axis='x', rotation=45)
         ax.grid(True, alpha=0.3, axis='y')
         
-        ax.text(0.02, 0.98, f'L = {self.L:.1f} m | d = {self.d*1000:.0f} mm', 
+        artistas['info'] = ax.text(0.02, 0.98, '', 
                 transform=ax.transAxes, fontsize=11, verticalalignment='top',
                 bbox=dict(boxstyle="round,pad=0.3", facecolor="lightyellow"))
         
         plt.tight_layout()
-        plt.show(block=False)
+        return fig, artistas
+    
+    def atualizar_grafico_comparacao(self, artistas):
+        resistencias = [self.formula_dwight(rho, self.L, self.d) for rho in self.tipos_solo.values()]
+        
+        # Adicionar caso atual
+        resistencias.append(self.formula_dwight(self.rho, self.L, self.d))
+        
+        for bar, texto, valor in zip(artistas['barras'], artistas['valores'], resistencias):
+            bar.set_height(valor)
+            texto.set_y(valor + max(resistencias)*0.01)
+            texto.set_text(f'{valor:.1f} Ω')
+        
+        artistas['info'].set_text(f'L = {self.L:.1f} m | d = {self.d*1000:.0f} mm')
+        artistas['ax'].set_ylim(0, max(resistencias) * 1.1)
+    
+    def fechar_graficos(self):
+        """Fecha as janelas de gráfico abertas por 'Ver Gráficos'"""
+        self.graficos.fechar_todos()
     
     def mostrar(self):
         """Mostra todas as janelas"""
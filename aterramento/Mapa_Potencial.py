@@ -0,0 +1,170 @@
+import hashlib
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from Cache_Calculo import CacheLRU
+from Metodo_Momentos import resolver
+
+# Pixels por lado de cada tile e limite de elementos (pontos × segmentos) por avaliação
+TAMANHO_TILE = 128
+ELEMENTOS_POR_BLOCO = 2_000_000
+
+# Tiles guardam o potencial para ρ·I = 1; o mesmo tile serve para qualquer corrente de falta
+cache_tiles = CacheLRU(int(os.environ.get('ATERRAMENTO_CACHE_TILES', 512)))
+
+
+def _potencial_superficie(x, y, inicio, fim, comprimentos, correntes):
+    """
+    Σ_j I_j·2·ln((r1 + r2 + ℓ)/(r1 + r2 - ℓ))/ℓ nos pontos (x, y, 0), com
+    ln((s + ℓ)/(s - ℓ)) = 2·atanh(ℓ/s); na superfície fonte e imagem coincidem.
+    """
+    x, y = x[:, None], y[:, None]
+    soma = np.sqrt((x - inicio[:, 0]) ** 2 + (y - inicio[:, 1]) ** 2 + inicio[:, 2] ** 2)
+    soma += np.sqrt((x - fim[:, 0]) ** 2 + (y - fim[:, 1]) ** 2 + fim[:, 2] ** 2)
+    np.divide(comprimentos, soma, out=soma)
+    np.arctanh(soma, out=soma)
+    return soma @ (4 * correntes / comprimentos)
+
+
+def _calcular_tile(inicio, fim, comprimentos, correntes, x0, y0, tamanho, resolucao):
+    """Potencial na superfície (ρ = 1, I = 1) nos centros dos pixels de um tile"""
+    eixo = (np.arange(tamanho) + 0.5) * resolucao
+    X, Y = np.meshgrid(x0 + eixo, y0 + eixo)
+    X, Y = X.ravel(), Y.ravel()
+
+    potencial = np.empty(X.size)
+    passo = max(1, ELEMENTOS_POR_BLOCO // len(comprimentos))
+    for i in range(0, X.size, passo):
+        potencial[i:i + passo] = _potencial_superficie(X[i:i + passo], Y[i:i + passo],
+                                                       inicio, fim, comprimentos, correntes)
+    return (potencial / (4 * math.pi)).reshape(tamanho, tamanho)
+
+
+class MapaPotencial:
+    """
+    Distribuição do potencial na superfície do solo de uma haste, arranjo de hastes ou
+    malha (Geometria de Metodo_Momentos), por superposição das fontes de cada segmento.
+
+    A área pedida é coberta por tiles alinhados a uma grade fixa por nível de zoom
+    (resolução base × 2^k), calculados em paralelo e guardados em cache: deslocar ou
+    voltar a um zoom já visto só calcula os tiles novos. O pool de processos é criado no
+    primeiro uso e reaproveitado até fechar() (ou o fechamento da figura de plotar).
+    """
+
+    def __init__(self, geometria, resistividade, corrente=1.0, correntes=None, processos=1,
+                 resolucao_base=0.05):
+        self.geometria = geometria
+        self.resistividade = resistividade
+        self.corrente = corrente
+        if correntes is None:
+            correntes = resolver(geometria, resistividade)['correntes']
+        self.correntes = np.asarray(correntes, dtype=float)
+        self.processos = processos or os.cpu_count() or 1
+        self.resolucao_base = resolucao_base
+        self._pool = None
+        self._desenhos = {}  # eixo -> [contorno, barra de cores]
+
+        resumo = hashlib.sha1(geometria.chave().encode())
+        resumo.update(np.ascontiguousarray(self.correntes).tobytes())
+        self._chave = 'tile:' + resumo.hexdigest()
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processos)
+        return self._pool
+
+    def fechar(self):
+        """Encerra o pool de processos (recriado se o mapa for usado de novo)"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def nivel_resolucao(self, resolucao):
+        """Resolução do nível de zoom mais próximo (base × 2^k)"""
+        k = round(math.log2(resolucao / self.resolucao_base))
+        return self.resolucao_base * 2.0 ** k
+
+    def _tiles(self, xmin, xmax, ymin, ymax, resolucao):
+        lado = TAMANHO_TILE * resolucao
+        colunas = range(math.floor(xmin / lado), math.ceil(xmax / lado))
+        linhas = range(math.floor(ymin / lado), math.ceil(ymax / lado))
+        return colunas, linhas
+
+    def calcular(self, xmin, xmax, ymin, ymax, resolucao):
+        """
+        Potencial (V) na superfície cobrindo [xmin, xmax] × [ymin, ymax].
+        Retorna (x, y, V): eixos dos centros dos pixels e a matriz V[len(y), len(x)].
+        """
+        resolucao = self.nivel_resolucao(resolucao)
+        colunas, linhas = self._tiles(xmin, xmax, ymin, ymax, resolucao)
+
+        tiles = {}
+        faltando = []
+        for iy in linhas:
+            for ix in colunas:
+                encontrado, tile = cache_tiles.consultar(self._chave, {'resolucao': resolucao, 'ix': ix, 'iy': iy})
+                if encontrado:
+                    tiles[(ix, iy)] = tile
+                else:
+                    faltando.append((ix, iy))
+
+        if faltando:
+            g = self.geometria
+            argumentos = [(g.inicio, g.fim, g.comprimentos, self.correntes,
+                           ix * TAMANHO_TILE * resolucao, iy * TAMANHO_TILE * resolucao,
+                           TAMANHO_TILE, resolucao) for ix, iy in faltando]
+            if self.processos == 1 or len(faltando) == 1:
+                calculados = [_calcular_tile(*a) for a in argumentos]
+            else:
+                calculados = list(self._executor().map(_calcular_tile, *zip(*argumentos)))
+            for (ix, iy), tile in zip(faltando, calculados):
+                cache_tiles.armazenar(self._chave, {'resolucao': resolucao, 'ix': ix, 'iy': iy}, tile)
+                tiles[(ix, iy)] = tile
+
+        V = np.block([[tiles[(ix, iy)] for ix in colunas] for iy in linhas])
+        x = (colunas.start * TAMANHO_TILE + np.arange(V.shape[1]) + 0.5) * resolucao
+        y = (linhas.start * TAMANHO_TILE + np.arange(V.shape[0]) + 0.5) * resolucao
+
+        # Recorta para a janela pedida
+        cx = (x >= xmin - resolucao) & (x <= xmax + resolucao)
+        cy = (y >= ymin - resolucao) & (y <= ymax + resolucao)
+        return x[cx], y[cy], V[np.ix_(cy, cx)] * self.resistividade * self.corrente
+
+    def plotar(self, ax, xmin, xmax, ymin, ymax, resolucao=None, niveis=20):
+        """
+        Curvas de nível do potencial em um eixo do matplotlib. Chamadas seguintes no mesmo
+        eixo (deslocamento, zoom) substituem o contorno e reaproveitam a barra de cores.
+        """
+        if resolucao is None:
+            resolucao = max(xmax - xmin, ymax - ymin) / 1000
+        x, y, V = self.calcular(xmin, xmax, ymin, ymax, resolucao)
+        contorno = ax.contourf(x, y, V, levels=niveis, cmap='viridis')
+
+        if ax in self._desenhos:
+            anterior, barra = self._desenhos[ax]
+            anterior.remove()
+            barra.update_normal(contorno)
+            self._desenhos[ax][0] = contorno
+        else:
+            barra = ax.figure.colorbar(contorno, ax=ax, label='Potencial (V)')
+            self._desenhos[ax] = [contorno, barra]
+            ax.figure.canvas.mpl_connect('close_event', lambda evento: self._figura_fechada(ax.figure))
+            ax.set_xlabel('x (m)', fontweight='bold')
+            ax.set_ylabel('y (m)', fontweight='bold')
+            ax.set_aspect('equal')
+        return contorno
+
+    def _figura_fechada(self, figura):
+        for ax in [ax for ax in self._desenhos if ax.figure is figura]:
+            del self._desenhos[ax]
+        if not self._desenhos:
+            self.fechar()
@@ -0,0 +1,301 @@
+import csv
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from Motor_Calculo import calcular
+from Solo_Duas_Camadas import resistencia_haste_duas_camadas, resistencia_malha_duas_camadas
+
+TOLERANCIA_SERIE = 1e-8
+TERMOS_MAXIMOS = 5000
+TERMOS_POR_BLOCO = 32
+
+# Faixa de contraste do ajuste: |K| <= 0.98, ou seja 1/99 <= ρ2/ρ1 <= 99
+K_MAXIMO = 0.98
+LIMITE_ATANH_K = math.atanh(K_MAXIMO)
+
+
+def resistividade_aparente_wenner(espacamento, resistencia_medida):
+    """Arranjo de Wenner (4 eletrodos igualmente espaçados de a): ρa = 2πaR"""
+    return 2 * math.pi * np.asarray(espacamento, dtype=float) * np.asarray(resistencia_medida, dtype=float)
+
+
+def resistividade_aparente_schlumberger(meia_distancia_corrente, meia_distancia_potencial, resistencia_medida):
+    """Arranjo de Schlumberger (AB/2 = s, MN/2 = b): ρa = π(s² - b²)/(2b)·R"""
+    s = np.asarray(meia_distancia_corrente, dtype=float)
+    b = np.asarray(meia_distancia_potencial, dtype=float)
+    return math.pi * (s ** 2 - b ** 2) / (2 * b) * np.asarray(resistencia_medida, dtype=float)
+
+
+def _serie_duas_camadas(r1, r2, rho1, K, espessura):
+    """
+    ρa de um arranjo simétrico de 4 eletrodos (r1 = AM = BN, r2 = AN = BM) sobre duas camadas:
+    ρa = ρ1 [1 + 2/(1 - r1/r2) Σ K^n (1/√(1 + (2nH/r1)²) - 1/√((r2/r1)² + (2nH/r1)²))]
+    A série é somada em blocos de termos; cada ponto sai da soma quando seu termo fica
+    abaixo de TOLERANCIA_SERIE, de modo que pontos lentos não atrasam os demais.
+    """
+    r1, r2, rho1, K, H = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (r1, r2, rho1, K, espessura)))
+    razao = (2 * H / r1).ravel()
+    q2 = ((r2 / r1) ** 2).ravel()
+    fator = (2 / (1 - r1 / r2)).ravel()
+    K_plano = K.ravel()
+    soma = np.zeros(razao.shape)
+    ativos = np.arange(razao.size)
+    potencia = np.ones(razao.size)  # K^(n-1) no início de cada bloco
+    for inicio in range(1, TERMOS_MAXIMOS + 1, TERMOS_POR_BLOCO):
+        n = np.arange(inicio, inicio + TERMOS_POR_BLOCO, dtype=float)
+        x2 = (n * razao[ativos, None]) ** 2
+        potencias = potencia[:, None] * np.cumprod(np.repeat(K_plano[ativos, None], TERMOS_POR_BLOCO, axis=1), axis=1)
+        termos = fator[ativos, None] * potencias * (1 / np.sqrt(1 + x2) - 1 / np.sqrt(q2[ativos, None] + x2))
+        soma[ativos] += termos.sum(axis=1)
+
+        continuam = np.abs(termos[:, -1]) >= TOLERANCIA_SERIE
+        ativos, potencia = ativos[continuam], potencias[continuam, -1]
+        if len(ativos) == 0:
+            break
+    return rho1 * (1 + soma.reshape(r1.shape))
+
+
+def wenner_duas_camadas(espacamento, rho1, K, espessura):
+    """
+    ρa de Wenner esperada sobre solo de duas camadas (r1 = a, r2 = 2a):
+    ρa = ρ1 [1 + 4 Σ K^n (1/√(1 + (2nH/a)²) - 1/√(4 + (2nH/a)²))]
+    """
+    a = np.asarray(espacamento, dtype=float)
+    return _serie_duas_camadas(a, 2 * a, rho1, K, espessura)
+
+
+def schlumberger_duas_camadas(meia_distancia_corrente, meia_distancia_potencial, rho1, K, espessura):
+    """ρa de Schlumberger (AB/2 = s, MN/2 = b) esperada sobre solo de duas camadas (r1 = s - b, r2 = s + b)"""
+    s = np.asarray(meia_distancia_corrente, dtype=float)
+    b = np.asarray(meia_distancia_potencial, dtype=float)
+    return _serie_duas_camadas(s - b, s + b, rho1, K, espessura)
+
+
+def _geometria(arranjo, espacamentos, meia_distancia_potencial):
+    """Distâncias (r1, r2) entre eletrodos de corrente e de potencial para cada leitura"""
+    espacamentos = np.asarray(espacamentos, dtype=float)
+    if arranjo == 'wenner':
+        return espacamentos, 2 * espacamentos
+    if arranjo == 'schlumberger':
+        if meia_distancia_potencial is None:
+            raise ValueError("O arranjo de Schlumberger requer meia_distancia_potencial (MN/2)")
+        b = np.asarray(meia_distancia_potencial, dtype=float)
+        with np.errstate(invalid='ignore'):
+            if np.any(b >= espacamentos):
+                raise ValueError("MN/2 deve ser menor que AB/2 em todas as leituras")
+        return espacamentos - b, espacamentos + b
+    raise ValueError(f"Arranjo desconhecido: {arranjo}")
+
+
+def inverter_uniforme(rho_aparente):
+    """Solo uniforme que melhor ajusta cada sondagem (mínimos quadrados em log; NaN = leitura ausente)"""
+    log_rho = np.log(np.asarray(rho_aparente, dtype=float))
+    rho = np.exp(np.nanmean(log_rho, axis=-1))
+    erro = np.sqrt(np.nanmean((log_rho - np.log(rho)[..., None]) ** 2, axis=-1))
+    return {'resistividade': rho, 'erro_rms': erro}
+
+
+def _ajuste_grade(y, pesos, tabela_log):
+    """
+    Para cada sondagem e cada (K, H) da tabela, ρ1 ótimo tem forma fechada em log
+    (média ponderada de y - log f); o erro quadrático sai de produtos matriciais.
+    """
+    n = pesos.sum(axis=1, keepdims=True)
+    wy = pesos * y
+    soma_y2 = (wy * y).sum(axis=1, keepdims=True)
+    soma_yf = wy @ tabela_log.T
+    soma_f = pesos @ tabela_log.T
+    soma_f2 = pesos @ (tabela_log ** 2).T
+    soma_y = wy.sum(axis=1, keepdims=True)
+    residuo = soma_y - soma_f
+    erro = soma_y2 - 2 * soma_yf + soma_f2 - residuo ** 2 / n
+    melhor = np.argmin(erro, axis=1)
+    log_rho1 = (residuo[np.arange(len(y)), melhor]) / n[:, 0]
+    return melhor, log_rho1
+
+
+def _inverter_bloco(r1, r2, rho_aparente, iteracoes):
+    y = np.log(rho_aparente)
+    validos = np.isfinite(y) & np.isfinite(r1) & np.isfinite(r2)
+    pesos = validos.astype(float)
+    y = np.where(validos, y, 0.0)
+    # Leituras ausentes recebem uma geometria qualquer (peso zero) para o modelo não gerar NaN
+    r1 = np.where(validos, r1, 1.0)
+    r2 = np.where(validos, r2, 2.0)
+
+    # 1) Grade grossa em (K, H) com ρ1 = 1: a série é avaliada uma vez por geometria (r1, r2)
+    # distinta do bloco e cada sondagem usa as colunas das suas leituras
+    valores_K = np.linspace(-K_MAXIMO, K_MAXIMO, 99)
+    valores_H = np.geomspace(r1[validos].min() / 10, r2[validos].max() * 5, 80)
+    KK, HH = np.meshgrid(valores_K, valores_H, indexing='ij')
+    pares, indice = np.unique(np.stack([r1[validos], r2[validos]], axis=1), axis=0, return_inverse=True)
+    tabela = np.log(_serie_duas_camadas(pares[None, :, 0], pares[None, :, 1], 1.0,
+                                        KK.reshape(-1, 1), HH.reshape(-1, 1)))
+    colunas = np.zeros(r1.shape, dtype=int)
+    colunas[validos] = indice.ravel()
+    padroes, grupo = np.unique(colunas, axis=0, return_inverse=True)
+    grupo = grupo.ravel()
+    melhor = np.empty(len(y), dtype=int)
+    log_rho1 = np.empty(len(y))
+    for g, padrao in enumerate(padroes):
+        selecao = grupo == g
+        melhor[selecao], log_rho1[selecao] = _ajuste_grade(y[selecao], pesos[selecao], tabela[:, padrao])
+
+    # 2) Refinamento por Levenberg-Marquardt em (ln ρ1, atanh K, ln H), vetorizado por sondagem
+    p = np.stack([log_rho1, np.arctanh(KK.ravel()[melhor]), np.log(HH.ravel()[melhor])], axis=1)
+    amortecimento = np.full(len(y), 1e-2)
+
+    def residuos(parametros):
+        modelo = _serie_duas_camadas(r1, r2, np.exp(parametros[:, :1]),
+                                     np.tanh(parametros[:, 1:2]), np.exp(parametros[:, 2:3]))
+        return pesos * (y - np.log(modelo))
+
+    r = residuos(p)
+    custo = (r ** 2).sum(axis=1)
+    for _ in range(iteracoes):
+        passo_numerico = 1e-6
+        J = np.empty(r.shape + (3,))
+        for j in range(3):
+            deslocado = p.copy()
+            deslocado[:, j] += passo_numerico
+            J[:, :, j] = -(residuos(deslocado) - r) / passo_numerico
+
+        JtJ = np.einsum('bmi,bmj->bij', J, J)
+        Jtr = np.einsum('bmi,bm->bi', J, r)
+        diagonal = np.einsum('bii->bi', JtJ)
+        sistema = JtJ + amortecimento[:, None, None] * (np.eye(3) * diagonal[:, None, :] + 1e-12 * np.eye(3))
+        delta = np.linalg.solve(sistema, Jtr[..., None])[..., 0]
+
+        candidato = p + delta
+        candidato[:, 1] = np.clip(candidato[:, 1], -LIMITE_ATANH_K, LIMITE_ATANH_K)
+        r_candidato = residuos(candidato)
+        custo_candidato = (r_candidato ** 2).sum(axis=1)
+
+        melhora = custo_candidato < custo
+        p = np.where(melhora[:, None], candidato, p)
+        r = np.where(melhora[:, None], r_candidato, r)
+        custo = np.where(melhora, custo_candidato, custo)
+        amortecimento = np.where(melhora, amortecimento / 3, amortecimento * 4)
+
+    rho1 = np.exp(p[:, 0])
+    K = np.tanh(p[:, 1])
+    return {
+        'rho1': rho1,
+        'rho2': rho1 * (1 + K) / (1 - K),
+        'espessura': np.exp(p[:, 2]),
+        'erro_rms': np.sqrt(custo / pesos.sum(axis=1)),
+    }
+
+
+def inverter_duas_camadas(espacamentos, rho_aparente, processos=None, tamanho_bloco=2000, iteracoes=20,
+                          arranjo='wenner', meia_distancia_potencial=None):
+    """
+    Ajusta um solo de duas camadas (ρ1, ρ2, H) a sondagens de Wenner ou Schlumberger.
+
+    espacamentos: a (Wenner) ou AB/2 (Schlumberger) em m; (M,) comuns a todas as sondagens
+    ou (B, M) um conjunto por sondagem (NaN completa sondagens com menos leituras).
+    rho_aparente: (M,) ou (B, M) ρa medidas (NaN para leitura ausente).
+    meia_distancia_potencial: MN/2 (m) do arranjo de Schlumberger, escalar, (M,) ou (B, M).
+    Cada bloco de sondagens é ajustado por busca em grade (K, H) com ρ1 em forma fechada,
+    seguida de Levenberg-Marquardt; blocos são distribuídos em processos (padrão: um por núcleo).
+    erro_rms é o desvio rms em log (0.05 ≈ 5%).
+    """
+    rho_aparente = np.asarray(rho_aparente, dtype=float)
+    unica = rho_aparente.ndim == 1
+    rho_aparente = np.atleast_2d(rho_aparente)
+    r1, r2 = _geometria(arranjo, espacamentos, meia_distancia_potencial)
+    try:
+        r1, r2 = (np.broadcast_to(r, rho_aparente.shape) for r in (r1, r2))
+    except ValueError:
+        raise ValueError("rho_aparente deve ter uma coluna por espaçamento") from None
+    with np.errstate(invalid='ignore'):
+        if np.any(r1 <= 0):
+            raise ValueError("Os espaçamentos devem ser positivos")
+    leituras = np.isfinite(rho_aparente) & np.isfinite(r1) & np.isfinite(r2)
+    if np.any(leituras.sum(axis=1) < 3):
+        raise ValueError("O modelo de duas camadas requer ao menos 3 leituras por sondagem")
+
+    fatias = [slice(i, i + tamanho_bloco) for i in range(0, len(rho_aparente), tamanho_bloco)]
+    blocos = [(r1[f], r2[f], rho_aparente[f]) for f in fatias]
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or len(blocos) == 1:
+        parciais = [_inverter_bloco(*bloco, iteracoes) for bloco in blocos]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            parciais = list(pool.map(_inverter_bloco, *zip(*blocos), [iteracoes] * len(blocos)))
+
+    modelo = {chave: np.concatenate([parcial[chave] for parcial in parciais]) for chave in parciais[0]}
+    if unica:
+        modelo = {chave: float(valor[0]) for chave, valor in modelo.items()}
+    return modelo
+
+
+def ler_sondagens(caminho):
+    """
+    CSV de campo em formato longo, uma leitura por linha: sondagem, espacamento (a ou AB/2),
+    resistencia (Ω, ΔV/I) ou rho_aparente (Ω·m) e, no arranjo de Schlumberger,
+    meia_distancia_potencial (MN/2). A coluna opcional arranjo (wenner ou schlumberger)
+    vale para o arquivo inteiro.
+    Retorna sondagens, arranjo e matrizes (B, M) completadas com NaN, prontas para
+    inverter_uniforme / inverter_duas_camadas.
+    """
+    with open(caminho, newline='', encoding='utf-8') as arquivo:
+        linhas = list(csv.DictReader(arquivo))
+    if not linhas:
+        raise ValueError(f"Nenhuma leitura em {caminho}")
+
+    arranjos = {(linha.get('arranjo') or 'wenner').strip().lower() for linha in linhas}
+    if len(arranjos) > 1:
+        raise ValueError(f"{caminho}: um único arranjo por arquivo ({', '.join(sorted(arranjos))})")
+    arranjo = arranjos.pop()
+    if arranjo not in ('wenner', 'schlumberger'):
+        raise ValueError(f"Arranjo desconhecido: {arranjo}")
+
+    leituras = {}
+    for i, linha in enumerate(linhas):
+        sondagem = (linha.get('sondagem') or '1').strip()
+        try:
+            s = float(linha['espacamento'])
+            b = float(linha['meia_distancia_potencial']) if arranjo == 'schlumberger' else math.nan
+            if linha.get('rho_aparente') not in (None, ''):
+                rho = float(linha['rho_aparente'])
+            elif arranjo == 'schlumberger':
+                rho = float(resistividade_aparente_schlumberger(s, b, float(linha['resistencia'])))
+            else:
+                rho = float(resistividade_aparente_wenner(s, float(linha['resistencia'])))
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"{caminho}: leitura inválida na linha {i + 2}") from None
+        leituras.setdefault(sondagem, []).append((s, b, rho))
+
+    sondagens = list(leituras)
+    m = max(len(valores) for valores in leituras.values())
+    tabela = np.full((3, len(sondagens), m), np.nan)
+    for i, sondagem in enumerate(sondagens):
+        valores = sorted(leituras[sondagem])
+        tabela[:, i, :len(valores)] = np.array(valores).T
+    return {
+        'sondagens': sondagens,
+        'arranjo': arranjo,
+        'espacamentos': tabela[0],
+        'meia_distancia_potencial': tabela[1] if arranjo == 'schlumberger' else None,
+        'rho_aparente': tabela[2],
+    }
+
+
+def resistencia_com_modelo(modelo, tipo, **geometria):
+    """
+    Resistência do eletrodo usando o modelo de solo ajustado.
+    Modelo uniforme: qualquer tipo do Motor_Calculo. Duas camadas: 'haste_unica' ou 'malha'.
+    """
+    if 'resistividade' in modelo:
+        return calcular(tipo, modelo['resistividade'], **geometria)
+
+    camadas = {'rho1': modelo['rho1'], 'rho2': modelo['rho2'], 'espessura': modelo['espessura']}
+    if tipo == 'haste_unica':
+        return resistencia_haste_duas_camadas(**camadas, **geometria)
+    if tipo == 'malha':
+        return resistencia_malha_duas_camadas(**camadas, **geometria)
+    raise ValueError(f"Modelo de duas camadas não disponível para {tipo}")
@@ -0,0 +1,222 @@
+import hashlib
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+# Acima deste número de segmentos o sistema é resolvido por gradiente conjugado
+LIMITE_SOLUCAO_DIRETA = 2000
+# Linhas da matriz montadas por vez (limita a memória dos temporários)
+LINHAS_POR_BLOCO = 256
+# Matrizes de resistência mútua guardadas (normalizadas para ρ = 1)
+TAMANHO_CACHE_MATRIZES = 4
+
+
+def _raio_equivalente(diametro):
+    """
+    Raio do condutor no auto-termo. As fórmulas de Dwight do Motor_Calculo usam o diâmetro
+    onde a forma original tem o raio (ln(4L/d) - 1); o mesmo vale aqui, para que uma haste
+    isolada concorde com Motor_Calculo, Arranjo_Hastes e Solo_Duas_Camadas.
+    """
+    return diametro
+
+
+class Geometria:
+    """
+    Conjunto de segmentos retilíneos de condutor enterrado.
+    Coordenadas em metros, z = profundidade (positiva para baixo, superfície em z = 0).
+    """
+
+    def __init__(self, inicio, fim, raio):
+        self.inicio = np.atleast_2d(np.asarray(inicio, dtype=float))
+        self.fim = np.atleast_2d(np.asarray(fim, dtype=float))
+        self.raio = np.broadcast_to(np.asarray(raio, dtype=float), (len(self.inicio),)).copy()
+        if self.inicio.shape != self.fim.shape or self.inicio.shape[1] != 3:
+            raise ValueError("inicio e fim devem ter forma (N, 3)")
+        if np.any(self.inicio[:, 2] < 0) or np.any(self.fim[:, 2] < 0):
+            raise ValueError("Os segmentos devem estar abaixo da superfície (z >= 0)")
+
+    def __len__(self):
+        return len(self.inicio)
+
+    def __add__(self, outra):
+        return Geometria(np.vstack([self.inicio, outra.inicio]), np.vstack([self.fim, outra.fim]),
+                         np.concatenate([self.raio, outra.raio]))
+
+    @property
+    def comprimentos(self):
+        return np.linalg.norm(self.fim - self.inicio, axis=1)
+
+    @property
+    def pontos_medios(self):
+        return (self.inicio + self.fim) / 2
+
+    def chave(self):
+        """Identificador da geometria para o cache de matrizes"""
+        resumo = hashlib.sha1()
+        for arranjo in (self.inicio, self.fim, self.raio):
+            resumo.update(np.ascontiguousarray(arranjo).tobytes())
+        return resumo.hexdigest()
+
+
+def _dividir(a, b, raio, tamanho_segmento):
+    """Divide o condutor a-b em segmentos de no máximo tamanho_segmento"""
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    partes = max(1, math.ceil(np.linalg.norm(b - a) / tamanho_segmento))
+    t = np.linspace(0, 1, partes + 1)[:, None]
+    pontos = a + t * (b - a)
+    return Geometria(pontos[:-1], pontos[1:], raio)
+
+
+def discretizar_haste(x, y, comprimento, diametro, tamanho_segmento=0.25, profundidade_topo=0.0):
+    """Haste vertical com topo em (x, y, profundidade_topo)"""
+    return _dividir((x, y, profundidade_topo), (x, y, profundidade_topo + comprimento),
+                    _raio_equivalente(diametro), tamanho_segmento)
+
+
+def discretizar_condutor(inicio, fim, diametro, tamanho_segmento=1.0):
+    """Condutor retilíneo qualquer entre os pontos (x, y, z) informados"""
+    return _dividir(inicio, fim, _raio_equivalente(diametro), tamanho_segmento)
+
+
+def discretizar_malha(largura, comprimento, condutores_x, condutores_y, profundidade, diametro,
+                      tamanho_segmento=1.0, hastes=None, comprimento_haste=3.0, diametro_haste=0.016):
+    """
+    Malha retangular largura × comprimento com condutores_x condutores paralelos ao eixo x
+    e condutores_y paralelos ao eixo y, à profundidade informada. hastes: lista de (x, y)
+    ou 'cantos' para hastes verticais partindo da malha.
+    Os condutores são divididos nos cruzamentos, de modo que os nós coincidem.
+    """
+    xs = np.linspace(0, largura, condutores_y)
+    ys = np.linspace(0, comprimento, condutores_x)
+    raio = _raio_equivalente(diametro)
+    partes = []
+    for y in ys:
+        for x0, x1 in zip(xs[:-1], xs[1:]):
+            partes.append(_dividir((x0, y, profundidade), (x1, y, profundidade), raio, tamanho_segmento))
+    for x in xs:
+        for y0, y1 in zip(ys[:-1], ys[1:]):
+            partes.append(_dividir((x, y0, profundidade), (x, y1, profundidade), raio, tamanho_segmento))
+
+    if hastes == 'cantos':
+        hastes = [(0, 0), (largura, 0), (0, comprimento), (largura, comprimento)]
+    for x, y in hastes or []:
+        partes.append(discretizar_haste(x, y, comprimento_haste, diametro_haste,
+                                        min(tamanho_segmento, comprimento_haste / 4), profundidade))
+
+    geometria = partes[0]
+    for parte in partes[1:]:
+        geometria = geometria + parte
+    return geometria
+
+
+def _potencial_segmentos(pontos, inicio, fim, comprimentos, raio_ponto):
+    """
+    Potencial (×4π/ρ) nos pontos devido a corrente unitária uniforme em cada segmento:
+    ln((r1 + r2 + ℓ)/(r1 + r2 - ℓ))/ℓ. raio_ponto afasta o ponto do eixo (auto-termo).
+    """
+    r1 = np.sqrt(((pontos[:, None, :] - inicio[None, :, :]) ** 2).sum(axis=2) + raio_ponto ** 2)
+    r2 = np.sqrt(((pontos[:, None, :] - fim[None, :, :]) ** 2).sum(axis=2) + raio_ponto ** 2)
+    soma = r1 + r2
+    return np.log((soma + comprimentos) / (soma - comprimentos)) / comprimentos
+
+
+def montar_matriz(geometria):
+    """
+    Matriz de resistências mútuas (ρ = 1) pelo casamento no ponto médio de cada segmento,
+    incluindo a imagem na superfície. É simetrizada ((M + Mᵀ)/2), como no método de Galerkin.
+    """
+    n = len(geometria)
+    comprimentos = geometria.comprimentos
+    medios = geometria.pontos_medios
+    imagem_inicio = geometria.inicio * np.array([1, 1, -1])
+    imagem_fim = geometria.fim * np.array([1, 1, -1])
+    matriz = np.empty((n, n))
+
+    for i0 in range(0, n, LINHAS_POR_BLOCO):
+        i1 = min(i0 + LINHAS_POR_BLOCO, n)
+        pontos = medios[i0:i1]
+        # Só o próprio segmento é avaliado no raio do condutor; os demais, no eixo
+        raio_ponto = np.zeros((i1 - i0, n))
+        raio_ponto[np.arange(i1 - i0), np.arange(i0, i1)] = geometria.raio[i0:i1]
+        matriz[i0:i1] = (_potencial_segmentos(pontos, geometria.inicio, geometria.fim, comprimentos, raio_ponto) +
+                         _potencial_segmentos(pontos, imagem_inicio, imagem_fim, comprimentos, 0.0))
+
+    matriz /= 4 * math.pi
+    matriz += matriz.T
+    matriz /= 2
+    return matriz
+
+
+_cache_matrizes = OrderedDict()
+
+
+def _matriz_em_cache(geometria):
+    chave = geometria.chave()
+    if chave in _cache_matrizes:
+        _cache_matrizes.move_to_end(chave)
+        return _cache_matrizes[chave]
+    matriz = montar_matriz(geometria)
+    _cache_matrizes[chave] = matriz
+    while len(_cache_matrizes) > TAMANHO_CACHE_MATRIZES:
+        _cache_matrizes.popitem(last=False)
+    return matriz
+
+
+def gradiente_conjugado(matriz, b, tolerancia=1e-8, iteracoes_maximas=1000, diagonal=None):
+    """
+    Gradiente conjugado com pré-condicionador de Jacobi (matriz simétrica positiva definida).
+    matriz pode ser qualquer objeto com @; nesse caso informe a diagonal.
+    """
+    inverso_diagonal = 1 / (np.diag(matriz) if diagonal is None else diagonal)
+    x = b * inverso_diagonal
+    r = b - matriz @ x
+    z = r * inverso_diagonal
+    p = z.copy()
+    rz = r @ z
+    norma_b = np.linalg.norm(b)
+    for iteracao in range(1, iteracoes_maximas + 1):
+        Ap = matriz @ p
+        alfa = rz / (p @ Ap)
+        x += alfa * p
+        r -= alfa * Ap
+        if np.linalg.norm(r) <= tolerancia * norma_b:
+            return x, iteracao
+        z = r * inverso_diagonal
+        rz_novo = r @ z
+        p = z + (rz_novo / rz) * p
+        rz = rz_novo
+    return x, iteracoes_maximas
+
+
+def resolver(geometria, resistividade, metodo='auto', tolerancia=1e-8):
+    """
+    Resistência de aterramento e distribuição de corrente de uma geometria qualquer.
+
+    Todos os segmentos são equipotenciais (condutor ideal): resolve M·i = 1 e
+    R = 1 / Σi. As correntes retornadas são frações da corrente injetada (somam 1).
+    metodo: 'direto', 'gradiente_conjugado' ou 'auto' (pelo número de segmentos).
+    """
+    matriz = _matriz_em_cache(geometria)
+    uns = np.ones(len(geometria))
+
+    if metodo == 'auto':
+        metodo = 'direto' if len(geometria) <= LIMITE_SOLUCAO_DIRETA else 'gradiente_conjugado'
+
+    iteracoes = None
+    if metodo == 'direto':
+        correntes = np.linalg.solve(matriz, uns)
+    elif metodo == 'gradiente_conjugado':
+        correntes, iteracoes = gradiente_conjugado(matriz, uns, tolerancia)
+    else:
+        raise ValueError(f"Método desconhecido: {metodo}")
+
+    total = correntes.sum()
+    return {
+        'resistencia': resistividade / total,
+        'correntes': correntes / total,
+        'densidade_corrente': correntes / total / geometria.comprimentos,
+        'metodo': metodo,
+        'iteracoes': iteracoes,
+        'segmentos': len(geometria),
+    }
@@ -0,0 +1,119 @@
+import numpy as np
+
+from Motor_Calculo import FORMULAS, LIMITES_NORMA
+
+
+def amostrar(distribuicao, n, gerador):
+    """
+    Sorteia n valores de uma distribuição:
+        ('lognormal', mediana, sigma_ln)   - típica da resistividade medida em campo
+        ('uniforme', minimo, maximo)
+        ('normal', media, desvio)
+        ('tolerancia', nominal, fracao)   - uniforme em nominal × (1 ± fracao)
+    Um número é tratado como valor fixo.
+    """
+    if np.ndim(distribuicao) == 0:
+        return np.full(n, float(distribuicao))
+
+    nome, a, b = distribuicao
+    if nome == 'lognormal':
+        return gerador.lognormal(np.log(a), b, n)
+    if nome == 'uniforme':
+        return gerador.uniform(a, b, n)
+    if nome == 'normal':
+        return gerador.normal(a, b, n)
+    if nome == 'tolerancia':
+        return gerador.uniform(a * (1 - b), a * (1 + b), n)
+    raise ValueError(f"Distribuição desconhecida: {nome}")
+
+
+class HistogramaLog:
+    """
+    Estimador de percentis em memória constante: histograma de log10(R) com faixas fixas.
+    Com o padrão (1e-3 a 1e6 Ω, 8192 faixas) o erro relativo dos percentis fica abaixo de 0,3%.
+    """
+
+    def __init__(self, minimo=1e-3, maximo=1e6, faixas=8192):
+        self.bordas = np.linspace(np.log10(minimo), np.log10(maximo), faixas + 1)
+        self.contagens = np.zeros(faixas + 2, dtype=np.int64)  # + abaixo e acima da faixa
+        self.total = 0
+
+    def adicionar(self, valores):
+        indices = np.searchsorted(self.bordas, np.log10(valores), side='right')
+        self.contagens += np.bincount(indices, minlength=len(self.contagens))
+        self.total += len(valores)
+
+    def percentil(self, p):
+        alvo = p / 100 * self.total
+        acumulado = np.cumsum(self.contagens)
+        i = int(np.searchsorted(acumulado, alvo, side='left'))
+        i = min(max(i, 1), len(self.bordas) - 1)
+        anterior = acumulado[i - 1]
+        fracao = (alvo - anterior) / self.contagens[i] if self.contagens[i] else 0.0
+        log_valor = self.bordas[i - 1] + min(max(fracao, 0.0), 1.0) * (self.bordas[i] - self.bordas[i - 1])
+        return float(10 ** log_valor)
+
+
+def simular(tipo, parametros, n_amostras=1_000_000, tamanho_lote=250_000, limite=LIMITES_NORMA[-1],
+            percentis=(5, 50, 95, 99), semente=None):
+    """
+    Propaga a incerteza de ρ e das tolerâncias geométricas até R por Monte Carlo.
+
+    parametros: dicionário com 'resistividade' e a geometria do tipo, cada um valor fixo
+    ou distribuição (ver amostrar). Ex.:
+        simular('haste_unica', {'resistividade': ('lognormal', 100, 0.5),
+                                'comprimento': ('tolerancia', 2.4, 0.02), 'diametro': 0.016})
+
+    As amostras são avaliadas em lotes vetorizados; só o histograma e acumuladores
+    ficam na memória, então n_amostras não é limitado pela RAM.
+    """
+    if tipo not in FORMULAS:
+        raise ValueError(f"Tipo de eletrodo desconhecido: {tipo}")
+    formula, nomes = FORMULAS[tipo]
+    faltando = [nome for nome in ('resistividade',) + nomes if nome not in parametros]
+    if faltando:
+        raise ValueError(f"Parâmetros ausentes para {tipo}: {', '.join(faltando)}")
+
+    gerador = np.random.default_rng(semente)
+    histograma = HistogramaLog()
+    soma = soma_quadrados = 0.0
+    minimo, maximo = np.inf, -np.inf
+    acima_limite = invalidas = 0
+
+    restantes = n_amostras
+    while restantes > 0:
+        n = min(tamanho_lote, restantes)
+        restantes -= n
+
+        valores = [amostrar(parametros[nome], n, gerador) for nome in ('resistividade',) + nomes]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            R = formula(*valores)
+
+        validos = np.isfinite(R) & (R > 0)
+        invalidas += n - int(np.count_nonzero(validos))
+        R = R[validos]
+        if len(R) == 0:
+            continue
+
+        histograma.adicionar(R)
+        soma += float(R.sum())
+        soma_quadrados += float(np.dot(R, R))
+        minimo, maximo = min(minimo, float(R.min())), max(maximo, float(R.max()))
+        acima_limite += int(np.count_nonzero(R > limite))
+
+    total = histograma.total
+    if total == 0:
+        raise ValueError("Nenhuma amostra válida: verifique as distribuições da geometria")
+    media = soma / total
+
+    return {
+        'amostras': total,
+        'amostras_invalidas': invalidas,
+        'media': media,
+        'desvio': float(np.sqrt(max(soma_quadrados / total - media ** 2, 0.0))),
+        'minimo': minimo,
+        'maximo': maximo,
+        'percentis': {p: histograma.percentil(p) for p in percentis},
+        'limite': limite,
+        'probabilidade_acima_limite': acima_limite / total,
+    }
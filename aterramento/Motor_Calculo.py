@@ -0,0 +1,256 @@
+import bisect
+import math
+
+# NumPy só é importado quando alguma fórmula recebe arrays: cálculos escalares (interface
+# Tk, cache, scripts curtos) não pagam o custo de importação
+_numpy = None
+
+
+def _np():
+    global _numpy
+    if _numpy is None:
+        import numpy
+        _numpy = numpy
+    return _numpy
+
+
+def _escalares(*valores):
+    return all(isinstance(valor, (int, float)) for valor in valores)
+
+
+def _avaliar_escalar(expressao):
+    """Caminho com math; domínio inválido vira NaN, como no NumPy"""
+    try:
+        return expressao()
+    except (ValueError, ZeroDivisionError):
+        return math.nan
+
+
+def resistencia_haste_unica(resistividade, comprimento, diametro):
+    """Haste vertical única - fórmula de Dwight modificada"""
+    if _escalares(resistividade, comprimento, diametro):
+        return _avaliar_escalar(lambda: (resistividade / (2 * math.pi * comprimento)) *
+                                        (math.log((4 * comprimento) / diametro) - 1))
+
+    np = _np()
+    resistividade = np.asarray(resistividade, dtype=float)
+    comprimento = np.asarray(comprimento, dtype=float)
+    diametro = np.asarray(diametro, dtype=float)
+
+    return (resistividade / (2 * math.pi * comprimento)) * (np.log((4 * comprimento) / diametro) - 1)
+
+
+def resistencia_multiplas_hastes(resistividade, n_hastes, comprimento, diametro, espacamento):
+    """Múltiplas hastes em linha - fórmula de Schwarz"""
+    if _escalares(resistividade, n_hastes, comprimento, diametro, espacamento):
+        return _avaliar_escalar(lambda: resistividade / (2 * math.pi * n_hastes * comprimento) * (
+            math.log(4 * comprimento / diametro) - 1 +
+            2 * (comprimento / espacamento) * math.log(2 * n_hastes / math.pi)
+        ))
+
+    np = _np()
+    resistividade = np.asarray(resistividade, dtype=float)
+    n_hastes = np.asarray(n_hastes, dtype=float)
+    comprimento = np.asarray(comprimento, dtype=float)
+    diametro = np.asarray(diametro, dtype=float)
+    espacamento = np.asarray(espacamento, dtype=float)
+
+    return resistividade / (2 * math.pi * n_hastes * comprimento) * (
+        np.log(4 * comprimento / diametro) - 1 +
+        2 * (comprimento / espacamento) * np.log(2 * n_hastes / math.pi)
+    )
+
+
+def resistencia_condutor_horizontal(resistividade, comprimento, diametro, profundidade):
+    """Condutor horizontal enterrado - fórmula de Dwight"""
+    if _escalares(resistividade, comprimento, diametro, profundidade):
+        return _avaliar_escalar(lambda: (resistividade / (2 * math.pi * comprimento)) * (
+            math.log(2 * comprimento / diametro) +
+            math.log(comprimento / (2 * profundidade)) -
+            2 + (2 * profundidade / comprimento)
+        ))
+
+    np = _np()
+    resistividade = np.asarray(resistividade, dtype=float)
+    comprimento = np.asarray(comprimento, dtype=float)
+    diametro = np.asarray(diametro, dtype=float)
+    profundidade = np.asarray(profundidade, dtype=float)
+
+    return (resistividade / (2 * math.pi * comprimento)) * (
+        np.log(2 * comprimento / diametro) +
+        np.log(comprimento / (2 * profundidade)) -
+        2 + (2 * profundidade / comprimento)
+    )
+
+
+def resistencia_malha(resistividade, area, comprimento_total, profundidade):
+    """Malha de aterramento - fórmula simplificada para malhas retangulares"""
+    if _escalares(resistividade, area, comprimento_total, profundidade):
+        return _avaliar_escalar(lambda: resistividade * (1/comprimento_total + 1/math.sqrt(20*area)) *
+                                        (1 + 1/(1 + profundidade * math.sqrt(area/10))))
+
+    np = _np()
+    resistividade = np.asarray(resistividade, dtype=float)
+    area = np.asarray(area, dtype=float)
+    comprimento_total = np.asarray(comprimento_total, dtype=float)
+    profundidade = np.asarray(profundidade, dtype=float)
+
+    return resistividade * (1/comprimento_total + 1/np.sqrt(20*area)) * (1 + 1/(1 + profundidade * np.sqrt(area/10)))
+
+
+def _termo_tratamento(resistividade_tratamento, comprimento, diametro, diametro_tratamento):
+    """Parcela do cilindro de tratamento em volta do eletrodo: ρ_t/(2πL)·ln(D_t/d)"""
+    return resistividade_tratamento / (2 * math.pi * comprimento) * math.log(diametro_tratamento / diametro)
+
+
+def resistencia_haste_tratada(resistividade, comprimento, diametro, diametro_tratamento, resistividade_tratamento):
+    """
+    Haste vertical envolta num cilindro de tratamento (bentonita, composto eletrocondutor)
+    de diâmetro D_t e resistividade ρ_t: a haste de diâmetro D_t no solo mais a camada de
+    tratamento entre d e D_t. Com ρ_t = ρ volta à haste única.
+    """
+    if _escalares(resistividade, comprimento, diametro, diametro_tratamento, resistividade_tratamento):
+        if diametro_tratamento < diametro:
+            return math.nan
+        return _avaliar_escalar(lambda: resistencia_haste_unica(resistividade, comprimento, diametro_tratamento) +
+                                        _termo_tratamento(resistividade_tratamento, comprimento, diametro,
+                                                          diametro_tratamento))
+
+    np = _np()
+    comprimento = np.asarray(comprimento, dtype=float)
+    diametro = np.asarray(diametro, dtype=float)
+    diametro_tratamento = np.asarray(diametro_tratamento, dtype=float)
+    resistividade_tratamento = np.asarray(resistividade_tratamento, dtype=float)
+
+    R = (resistencia_haste_unica(resistividade, comprimento, diametro_tratamento) +
+         resistividade_tratamento / (2 * math.pi * comprimento) * np.log(diametro_tratamento / diametro))
+    return np.where(diametro_tratamento >= diametro, R, np.nan)
+
+
+def resistencia_condutor_tratado(resistividade, comprimento, diametro, profundidade, diametro_tratamento,
+                                 resistividade_tratamento):
+    """
+    Condutor horizontal dentro de uma vala preenchida com tratamento: o condutor de
+    diâmetro D_t no solo mais a camada de tratamento entre d e D_t
+    """
+    if _escalares(resistividade, comprimento, diametro, profundidade, diametro_tratamento, resistividade_tratamento):
+        if diametro_tratamento < diametro:
+            return math.nan
+        return _avaliar_escalar(lambda: resistencia_condutor_horizontal(resistividade, comprimento, diametro_tratamento,
+                                                                        profundidade) +
+                                        _termo_tratamento(resistividade_tratamento, comprimento, diametro,
+                                                          diametro_tratamento))
+
+    np = _np()
+    comprimento = np.asarray(comprimento, dtype=float)
+    diametro = np.asarray(diametro, dtype=float)
+    diametro_tratamento = np.asarray(diametro_tratamento, dtype=float)
+    resistividade_tratamento = np.asarray(resistividade_tratamento, dtype=float)
+
+    R = (resistencia_condutor_horizontal(resistividade, comprimento, diametro_tratamento, profundidade) +
+         resistividade_tratamento / (2 * math.pi * comprimento) * np.log(diametro_tratamento / diametro))
+    return np.where(diametro_tratamento >= diametro, R, np.nan)
+
+
+# Fórmulas disponíveis, com os parâmetros geométricos (além da resistividade) na ordem da assinatura
+FORMULAS = {
+    'haste_unica': (resistencia_haste_unica, ('comprimento', 'diametro')),
+    'multiplas_hastes': (resistencia_multiplas_hastes, ('n_hastes', 'comprimento', 'diametro', 'espacamento')),
+    'condutor_horizontal': (resistencia_condutor_horizontal, ('comprimento', 'diametro', 'profundidade')),
+    'malha': (resistencia_malha, ('area', 'comprimento_total', 'profundidade')),
+    'haste_tratada': (resistencia_haste_tratada,
+                      ('comprimento', 'diametro', 'diametro_tratamento', 'resistividade_tratamento')),
+    'condutor_tratado': (resistencia_condutor_tratado,
+                         ('comprimento', 'diametro', 'profundidade', 'diametro_tratamento', 'resistividade_tratamento')),
+}
+
+# Nome exibido de cada configuração (o mesmo usado pela interface gráfica)
+CONFIGURACOES = {
+    'haste_unica': 'Haste vertical única',
+    'multiplas_hastes': 'Múltiplas hastes em linha',
+    'condutor_horizontal': 'Condutor horizontal enterrado',
+    'malha': 'Malha de aterramento',
+    'haste_tratada': 'Haste com tratamento do solo',
+    'condutor_tratado': 'Condutor horizontal com tratamento do solo',
+}
+
+
+def calcular(tipo, resistividade, **parametros):
+    """Calcula a resistência para o tipo de eletrodo informado"""
+    if tipo not in FORMULAS:
+        raise ValueError(f"Tipo de eletrodo desconhecido: {tipo}")
+
+    formula, nomes = FORMULAS[tipo]
+    faltando = [nome for nome in nomes if nome not in parametros]
+    if faltando:
+        raise ValueError(f"Parâmetros ausentes para {tipo}: {', '.join(faltando)}")
+
+    return formula(resistividade, *(parametros[nome] for nome in nomes))
+
+
+# Limites normativos (Ω) e classificação correspondente, do mais ao menos exigente
+LIMITES_NORMA = (1.0, 5.0, 10.0)
+CLASSIFICACOES = (
+    "EXCELENTE - Atende: Sistemas de equipamentos sensíveis (≤ 1 Ω)",
+    "ÓTIMO - Atende: Sistemas de telecomunicações (≤ 5 Ω)",
+    "BOM - Atende: Sistemas de potência e para-raios (≤ 10 Ω)",
+    "PRECISA MELHORAR - Não atende: Resistência acima dos limites normativos (> 10 Ω)",
+)
+
+
+def classificar_norma(resistencia):
+    """Índice em CLASSIFICACOES para cada resistência (0 = melhor, 3 = não atende; NaN também 3)"""
+    if _escalares(resistencia):
+        if resistencia != resistencia:
+            return len(LIMITES_NORMA)  # NaN: como no searchsorted do caminho vetorizado
+        return bisect.bisect_left(LIMITES_NORMA, resistencia)
+    np = _np()
+    return np.searchsorted(LIMITES_NORMA, np.asarray(resistencia, dtype=float), side='left')
+
+
+def gerar_sugestoes(configuracao, detalhes, resistencia):
+    """Sugestões para reduzir a resistência de uma configuração"""
+    sugestoes = []
+
+    if configuracao == 'Haste vertical única':
+        sugestoes.extend([
+            "Adicionar mais hastes em paralelo",
+            f"Aumentar comprimento da haste para 4-6m",
+            "Usar haste de maior diâmetro (ex: 19mm)"
+        ])
+    elif configuracao == 'Múltiplas hastes em linha':
+        sugestoes.extend([
+            f"Aumentar número de hastes",
+            f"Aumentar comprimento das hastes para 3-4m",
+            f"Reduzir espaçamento entre hastes"
+        ])
+    elif configuracao == 'Condutor horizontal enterrado':
+        sugestoes.extend([
+            f"Aumentar comprimento do condutor",
+            "Enterrar em maior profundidade (0.8-1.0m)",
+            "Adicionar hastes verticais nos extremos",
+            "Usar condutor de maior diâmetro"
+        ])
+    elif configuracao == 'Malha de aterramento':
+        sugestoes.extend([
+            f"Aumentar área da malha",
+            "Aumentar comprimento dos condutores",
+            "Adicionar hastes verticais nos cantos da malha"
+        ])
+    elif configuracao in ('Haste com tratamento do solo', 'Condutor horizontal com tratamento do solo'):
+        sugestoes.extend([
+            "Aumentar diâmetro do cilindro de tratamento",
+            "Usar composto de menor resistividade",
+            "Adicionar mais eletrodos tratados em paralelo"
+        ])
+        # O tratamento já foi aplicado: das sugestões gerais só resta o aterramento profundo
+        sugestoes.append("Usar aterramento profundo (hastes de 6-12m)")
+        return sugestoes
+
+    sugestoes.extend([
+        "Aplicar tratamento químico no solo",
+        "Usar aterramento profundo (hastes de 6-12m)",
+        "Considerar uso de composto eletrocondutor"
+    ])
+
+    return sugestoes
@@ -0,0 +1,162 @@
+import itertools
+import math
+
+import numpy as np
+
+from Motor_Calculo import resistencia_haste_unica, resistencia_multiplas_hastes, resistencia_malha, LIMITES_NORMA
+from Projeto_Inverso import n_hastes_minimo
+
+# Catálogo de referência (valores ilustrativos em R$, substitua pela tabela do fornecedor)
+CATALOGO_PADRAO = {
+    # Diâmetros nominais de haste (m)
+    'diametros': {
+        '1/2"': 0.0127,
+        '5/8"': 0.015875,
+        '3/4"': 0.01905,
+    },
+    # Preço por haste: comprimento (m) -> {diâmetro nominal: R$}
+    'custo_haste': {
+        1.5: {'1/2"': 45.0, '5/8"': 60.0, '3/4"': 85.0},
+        2.4: {'1/2"': 70.0, '5/8"': 95.0, '3/4"': 130.0},
+        3.0: {'1/2"': 90.0, '5/8"': 120.0, '3/4"': 165.0},
+        4.0: {'5/8"': 175.0, '3/4"': 240.0},
+        6.0: {'5/8"': 280.0, '3/4"': 380.0},
+    },
+    'custo_instalacao_haste': 40.0,       # cravação + conector, por haste
+    'espacamentos': (1.5, 2.4, 3.0, 4.5, 6.0),
+    'custo_cabo_m': 25.0,                 # cabo de cobre nu, por metro
+    'custo_valeta_m': 15.0,               # abertura e fechamento de valeta, por metro
+    'n_hastes_maximo': 60,
+    # Malhas quadradas: lado (m) x espaçamento entre condutores (m)
+    'lados_malha': (4, 6, 8, 10, 12, 15, 20, 25, 30, 40, 50),
+    'espacamentos_malha': (2, 3, 4, 5, 6),
+    'profundidade_malha': 0.5,
+}
+
+
+def _candidatos_hastes(catalogo):
+    for comprimento, precos in catalogo['custo_haste'].items():
+        for nome_diametro, preco in precos.items():
+            for espacamento in catalogo['espacamentos']:
+                yield comprimento, nome_diametro, preco + catalogo['custo_instalacao_haste'], espacamento
+
+
+def custo_hastes(n_hastes, preco_haste, espacamento, catalogo):
+    """Hastes + cabo e valeta interligando hastes vizinhas"""
+    ligacao = (n_hastes - 1) * espacamento * (catalogo['custo_cabo_m'] + catalogo['custo_valeta_m'])
+    return n_hastes * preco_haste + ligacao
+
+
+def otimizar_hastes(resistividade, alvo=LIMITES_NORMA[-1], catalogo=CATALOGO_PADRAO, tamanho_lote=16):
+    """
+    Projeto de hastes (única ou em linha) mais barato que atinge o alvo - branch-and-bound.
+
+    Como a fórmula de Schwarz nunca fica abaixo de R_haste/n, n >= ceil(R_haste/alvo)
+    dá um limite inferior de custo para cada (comprimento, diâmetro, espaçamento).
+    As combinações são avaliadas em ordem crescente desse limite, em lotes vetorizados,
+    e a busca para assim que o limite supera o melhor custo já encontrado.
+    """
+    candidatos = list(_candidatos_hastes(catalogo))
+    comprimentos = np.array([c[0] for c in candidatos])
+    diametros = np.array([catalogo['diametros'][c[1]] for c in candidatos])
+    precos = np.array([c[2] for c in candidatos])
+    espacamentos = np.array([c[3] for c in candidatos])
+
+    R_uma = resistencia_haste_unica(resistividade, comprimentos, diametros)
+    n_limite = np.maximum(1, np.ceil(R_uma / alvo))
+    limite_custo = custo_hastes(n_limite, precos, espacamentos, catalogo)
+    limite_custo[n_limite > catalogo['n_hastes_maximo']] = np.inf
+
+    ordem = np.argsort(limite_custo, kind='stable')
+    melhor, melhor_custo, avaliados = None, math.inf, 0
+
+    for inicio in range(0, len(ordem), tamanho_lote):
+        lote = ordem[inicio:inicio + tamanho_lote]
+        lote = lote[limite_custo[lote] < melhor_custo]
+        if len(lote) == 0:
+            break
+
+        n = n_hastes_minimo(resistividade, comprimentos[lote], diametros[lote], espacamentos[lote],
+                            alvo=alvo, n_maximo=catalogo['n_hastes_maximo'])
+        avaliados += len(lote)
+        custos = np.where(n > 0, custo_hastes(n, precos[lote], espacamentos[lote], catalogo), np.inf)
+
+        i = int(np.argmin(custos))
+        if custos[i] < melhor_custo:
+            k = lote[i]
+            melhor_custo = float(custos[i])
+            if n[i] == 1:
+                R = resistencia_haste_unica(resistividade, comprimentos[k], diametros[k])
+            else:
+                R = resistencia_multiplas_hastes(resistividade, n[i], comprimentos[k], diametros[k], espacamentos[k])
+            melhor = {
+                'tipo': 'haste_unica' if n[i] == 1 else 'multiplas_hastes',
+                'n_hastes': int(n[i]),
+                'comprimento': float(comprimentos[k]),
+                'diametro': candidatos[k][1],
+                'espacamento': float(espacamentos[k]) if n[i] > 1 else None,
+                'resistencia': float(R),
+                'custo': melhor_custo,
+            }
+
+    return melhor, avaliados, len(candidatos)
+
+
+def otimizar_malha(resistividade, alvo=LIMITES_NORMA[-1], catalogo=CATALOGO_PADRAO):
+    """Malha quadrada mais barata que atinge o alvo: avalia em ordem de custo e para na primeira"""
+    opcoes = []
+    for lado, espacamento in itertools.product(catalogo['lados_malha'], catalogo['espacamentos_malha']):
+        if espacamento > lado:
+            continue
+        condutores = math.floor(lado / espacamento) + 1
+        comprimento_total = 2 * condutores * lado
+        custo = comprimento_total * (catalogo['custo_cabo_m'] + catalogo['custo_valeta_m'])
+        opcoes.append((custo, lado, espacamento, comprimento_total))
+    opcoes.sort()
+
+    custos = np.array([o[0] for o in opcoes])
+    areas = np.array([o[1] ** 2 for o in opcoes], dtype=float)
+    comprimentos = np.array([o[3] for o in opcoes], dtype=float)
+    R = resistencia_malha(resistividade, areas, comprimentos, catalogo['profundidade_malha'])
+
+    atende = np.flatnonzero(R <= alvo)
+    if len(atende) == 0:
+        return None, len(opcoes), len(opcoes)
+
+    i = int(atende[0])
+    custo, lado, espacamento, comprimento_total = opcoes[i]
+    return {
+        'tipo': 'malha',
+        'lado': float(lado),
+        'area': float(lado ** 2),
+        'espacamento_malha': float(espacamento),
+        'comprimento_total': float(comprimento_total),
+        'profundidade': catalogo['profundidade_malha'],
+        'resistencia': float(R[i]),
+        'custo': float(custo),
+    }, i + 1, len(opcoes)
+
+
+def otimizar_projeto(resistividade, alvo=LIMITES_NORMA[-1], catalogo=CATALOGO_PADRAO, tipos=('hastes', 'malha')):
+    """Projeto mais barato entre os tipos informados; None se nenhum item do catálogo atende"""
+    projetos = []
+    if 'hastes' in tipos:
+        projetos.append(otimizar_hastes(resistividade, alvo, catalogo)[0])
+    if 'malha' in tipos:
+        projetos.append(otimizar_malha(resistividade, alvo, catalogo)[0])
+
+    projetos = [p for p in projetos if p is not None]
+    return min(projetos, key=lambda p: p['custo']) if projetos else None
+
+
+def otimizar_lote(resistividades, alvo=LIMITES_NORMA[-1], catalogo=CATALOGO_PADRAO, tipos=('hastes', 'malha')):
+    """Otimiza vários locais; reaproveita o resultado de locais com a mesma resistividade e alvo"""
+    resultados = {}
+    alvos = np.broadcast_to(np.asarray(alvo, dtype=float), np.shape(resistividades))
+    projetos = []
+    for rho, meta in zip(np.asarray(resistividades, dtype=float).ravel(), alvos.ravel()):
+        chave = (float(rho), float(meta))
+        if chave not in resultados:
+            resultados[chave] = otimizar_projeto(rho, meta, catalogo, tipos)
+        projetos.append(resultados[chave])
+    return projetos
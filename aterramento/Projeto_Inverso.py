@@ -0,0 +1,97 @@
+import numpy as np
+
+from Motor_Calculo import (resistencia_haste_unica, resistencia_multiplas_hastes,
+                           resistencia_condutor_horizontal, resistencia_malha, LIMITES_NORMA)
+
+
+def bissecao(funcao, alvo, inferior, superior, tolerancia=1e-6, iteracoes=200):
+    """
+    Menor x em [inferior, superior] com funcao(x) <= alvo, para funcao decrescente em x.
+
+    Vetorizada: todos os argumentos podem ser arrays (broadcast). Retorna NaN onde nem
+    o limite superior atinge o alvo e o próprio limite inferior onde ele já atinge.
+    """
+    alvo, inferior, superior = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (alvo, inferior, superior)))
+    baixo, alto = inferior.copy(), superior.copy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        atinge_superior = funcao(alto) <= alvo
+        atinge_inferior = funcao(baixo) <= alvo
+
+        for _ in range(iteracoes):
+            if np.all(alto - baixo <= tolerancia * np.maximum(1.0, np.abs(alto))):
+                break
+            meio = 0.5 * (baixo + alto)
+            atinge = funcao(meio) <= alvo
+            alto = np.where(atinge, meio, alto)
+            baixo = np.where(atinge, baixo, meio)
+
+    resultado = np.where(atinge_inferior, inferior, alto)
+    return np.where(atinge_superior | atinge_inferior, resultado, np.nan)
+
+
+def n_hastes_minimo(resistividade, comprimento, diametro, espacamento, alvo=LIMITES_NORMA[-1], n_maximo=1000):
+    """
+    Menor número de hastes em linha com R <= alvo (0 se nem n_maximo hastes atingem).
+
+    Uma haste usa a fórmula da haste única; a partir de duas, a de Schwarz, que é
+    decrescente em n para as geometrias usuais (ln(4L/d) - 1 >= 2L/s).
+    """
+    resistividade, comprimento, diametro, espacamento, alvo = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (resistividade, comprimento, diametro, espacamento, alvo)))
+
+    def R(n):
+        return resistencia_multiplas_hastes(resistividade, n, comprimento, diametro, espacamento)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        uma_haste = resistencia_haste_unica(resistividade, comprimento, diametro) <= alvo
+        atinge = R(np.full(alvo.shape, float(n_maximo))) <= alvo
+
+    # Bisseção inteira: baixo não atinge o alvo, alto atinge
+    baixo = np.full(alvo.shape, 1, dtype=np.int64)
+    alto = np.full(alvo.shape, n_maximo, dtype=np.int64)
+    while np.any(alto - baixo > 1):
+        meio = (baixo + alto) // 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ok = R(meio) <= alvo
+        alto = np.where(ok, meio, alto)
+        baixo = np.where(ok, baixo, meio)
+
+    return np.where(uma_haste, 1, np.where(atinge, alto, 0))
+
+
+def comprimento_haste_minimo(resistividade, diametro, alvo=LIMITES_NORMA[-1], n_hastes=1, espacamento=None,
+                             comprimento_minimo=0.5, comprimento_maximo=30.0, tolerancia=1e-4):
+    """Menor comprimento de haste (m) com R <= alvo, para haste única ou n hastes em linha"""
+    if np.any(np.asarray(n_hastes) > 1) and espacamento is None:
+        raise ValueError("Informe o espaçamento para mais de uma haste")
+
+    def R(comprimento):
+        unica = resistencia_haste_unica(resistividade, comprimento, diametro)
+        if espacamento is None:
+            return unica
+        linha = resistencia_multiplas_hastes(resistividade, n_hastes, comprimento, diametro, espacamento)
+        return np.where(np.asarray(n_hastes) > 1, linha, unica)
+
+    return bissecao(R, alvo, comprimento_minimo, comprimento_maximo, tolerancia)
+
+
+def comprimento_condutor_minimo(resistividade, diametro, profundidade, alvo=LIMITES_NORMA[-1],
+                                comprimento_minimo=1.0, comprimento_maximo=5000.0, tolerancia=1e-4):
+    """Menor comprimento (m) de condutor horizontal enterrado com R <= alvo"""
+    def R(comprimento):
+        return resistencia_condutor_horizontal(resistividade, comprimento, diametro, profundidade)
+
+    return bissecao(R, alvo, comprimento_minimo, comprimento_maximo, tolerancia)
+
+
+def area_malha_minima(resistividade, comprimento_total, profundidade, alvo=LIMITES_NORMA[-1],
+                      area_minima=1.0, area_maxima=1e6, tolerancia=1e-6):
+    """
+    Menor área (m²) de malha com R <= alvo, para um comprimento total de condutores fixo.
+    Retorna NaN quando o alvo é inatingível (R tende a ρ/comprimento_total com área infinita).
+    """
+    def R(area):
+        return resistencia_malha(resistividade, area, comprimento_total, profundidade)
+
+    return bissecao(R, alvo, area_minima, area_maxima, tolerancia)
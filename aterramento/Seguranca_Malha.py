@@ -0,0 +1,107 @@
+import math
+
+import numpy as np
+
+# Constante do corpo humano por peso (IEEE Std 80): 0.116 para 50 kg, 0.157 para 70 kg
+CONSTANTE_CORPO = {50: 0.116, 70: 0.157}
+# Profundidade de referência da malha para Kh (m)
+PROFUNDIDADE_REFERENCIA = 1.0
+
+
+def resistencia_sverak(resistividade, area, comprimento_total, profundidade):
+    """
+    Resistência da malha pela equação de Sverak (IEEE Std 80):
+    Rg = ρ [1/LT + 1/√(20A) (1 + 1/(1 + h√(20/A)))], LT = condutores + hastes
+    """
+    rho = np.asarray(resistividade, dtype=float)
+    A = np.asarray(area, dtype=float)
+    LT = np.asarray(comprimento_total, dtype=float)
+    h = np.asarray(profundidade, dtype=float)
+    return rho * (1 / LT + 1 / np.sqrt(20 * A) * (1 + 1 / (1 + h * np.sqrt(20 / A))))
+
+
+def fator_camada_superficial(resistividade, resistividade_superficial, espessura_superficial):
+    """Cs = 1 - 0.09 (1 - ρ/ρs) / (2hs + 0.09); Cs = 1 sem camada superficial"""
+    rho = np.asarray(resistividade, dtype=float)
+    rho_s = np.asarray(resistividade_superficial, dtype=float)
+    hs = np.asarray(espessura_superficial, dtype=float)
+    return np.where(hs > 0, 1 - 0.09 * (1 - rho / rho_s) / (2 * hs + 0.09), 1.0)
+
+
+def tensoes_admissiveis(resistividade_superficial, fator_superficial, tempo_falta, peso=50):
+    """Tensões de toque e de passo toleráveis (V) para o tempo de falta ts (s)"""
+    if peso not in CONSTANTE_CORPO:
+        raise ValueError("peso deve ser 50 ou 70 kg")
+    k = CONSTANTE_CORPO[peso] / np.sqrt(np.asarray(tempo_falta, dtype=float))
+    Cs_rho = fator_superficial * np.asarray(resistividade_superficial, dtype=float)
+    return (1000 + 1.5 * Cs_rho) * k, (1000 + 6 * Cs_rho) * k
+
+
+def avaliar_malha(resistividade, area, comprimento_total, profundidade, corrente_malha, n_condutores,
+                  tempo_falta, diametro=0.01, espacamento=None, resistividade_superficial=None,
+                  espessura_superficial=0.0, comprimento_hastes=0.0, comprimento_haste=3.0, peso=50):
+    """
+    Verificação de segurança de uma malha quadrada conforme IEEE Std 80.
+
+    Usa os mesmos dados de calcular_malha (ρ, área, comprimento dos condutores e
+    profundidade) mais a corrente de malha IG (A), o número de condutores paralelos em
+    cada direção, o tempo de falta e a camada superficial (brita). comprimento_hastes é o
+    comprimento total das hastes na periferia (0 = malha sem hastes).
+    Todos os parâmetros aceitam arrays: vários cenários de falta são avaliados de uma vez.
+
+    Retorna Rg, GPR, Em (tensão de malha), Es (tensão de passo), as tensões toleráveis
+    e se cada critério é atendido.
+    """
+    rho = np.asarray(resistividade, dtype=float)
+    A = np.asarray(area, dtype=float)
+    LC = np.asarray(comprimento_total, dtype=float)
+    h = np.asarray(profundidade, dtype=float)
+    IG = np.asarray(corrente_malha, dtype=float)
+    n = np.asarray(n_condutores, dtype=float)
+    d = np.asarray(diametro, dtype=float)
+    LR = np.asarray(comprimento_hastes, dtype=float)
+    Lr = np.asarray(comprimento_haste, dtype=float)
+
+    if np.any(n < 2):
+        raise ValueError("A malha precisa de pelo menos 2 condutores paralelos em cada direção")
+
+    lado = np.sqrt(A)
+    D = lado / (n - 1) if espacamento is None else np.asarray(espacamento, dtype=float)
+    com_hastes = LR > 0
+
+    if resistividade_superficial is None:
+        resistividade_superficial, espessura_superficial = rho, 0.0
+    Cs = fator_camada_superficial(rho, resistividade_superficial, espessura_superficial)
+    E_toque, E_passo = tensoes_admissiveis(resistividade_superficial, Cs, tempo_falta, peso)
+
+    # Rg pela equação da norma (não a fórmula simplificada do Motor_Calculo): o GPR decide
+    # os critérios quando não passa da tensão de toque admissível
+    Rg = resistencia_sverak(rho, A, LC + LR, h)
+    GPR = IG * Rg
+
+    # Fatores geométricos
+    Kii = np.where(com_hastes, 1.0, 1 / (2 * n) ** (2 / n))
+    Kh = np.sqrt(1 + h / PROFUNDIDADE_REFERENCIA)
+    Km = 1 / (2 * math.pi) * (
+        np.log(D ** 2 / (16 * h * d) + (D + 2 * h) ** 2 / (8 * D * d) - h / (4 * d)) +
+        Kii / Kh * np.log(8 / (math.pi * (2 * n - 1))))
+    Ks = 1 / math.pi * (1 / (2 * h) + 1 / (D + h) + 1 / D * (1 - 0.5 ** (n - 2)))
+    Ki = 0.644 + 0.148 * n
+
+    # Comprimentos efetivos para as tensões de malha e de passo
+    LM = np.where(com_hastes, LC + (1.55 + 1.22 * Lr / np.sqrt(2 * A)) * LR, LC + LR)
+    LS = 0.75 * LC + 0.85 * LR
+
+    Em = rho * Km * Ki * IG / LM
+    Es = rho * Ks * Ki * IG / LS
+
+    return {
+        'resistencia': Rg,
+        'GPR': GPR,
+        'Em': Em,
+        'Es': Es,
+        'E_toque_admissivel': E_toque,
+        'E_passo_admissivel': E_passo,
+        'atende_toque': (Em <= E_toque) | (GPR <= E_toque),
+        'atende_passo': (Es <= E_passo) | (GPR <= E_toque),
+    }
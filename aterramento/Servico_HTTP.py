@@ -0,0 +1,303 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from Calculo_Lote import normalizar_tipo, processar_bloco
+from Instrumentacao import etapa
+from Motor_Calculo import CONFIGURACOES, FORMULAS, LIMITES_NORMA, classificar_norma
+
+# Pedidos /lote com mais registros que isto são divididos em blocos e calculados no pool
+# de processos; abaixo disso o cálculo (alguns µs por registro) é feito no próprio loop
+LIMITE_PROCESSOS = 20000
+TAMANHO_BLOCO_PROCESSOS = 10000
+MAXIMO_REGISTROS_LOTE = 1_000_000
+MAXIMO_CORPO = 64 * 1024 * 1024
+MAXIMO_CABECALHO = 16 * 1024
+
+
+class ErroHTTP(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+def montar_resposta(registro, resultado):
+    """Resultado de processar_bloco no formato JSON do serviço"""
+    R, classificacao, sugestoes, erro = resultado
+    if erro:
+        return {'erro': erro}
+    tipo = normalizar_tipo(registro.get('tipo'))
+    return {
+        'tipo': tipo,
+        'configuracao': CONFIGURACOES[tipo],
+        'resistencia': R,
+        'indice_norma': classificar_norma(R),
+        'classificacao': classificacao,
+        'atende': R <= LIMITES_NORMA[-1],
+        'sugestoes': sugestoes.split("; ") if sugestoes else [],
+    }
+
+
+class AgrupadorRequisicoes:
+    """
+    Junta pedidos /calcular concorrentes num único processar_bloco.
+
+    Com espera_ms=0 o lote é fechado na próxima volta do loop: entram todos os pedidos
+    lidos dos sockets naquela volta, sem acrescentar latência. Uma espera maior troca
+    latência por lotes maiores. O lote também é fechado ao atingir tamanho_maximo.
+    """
+
+    def __init__(self, tamanho_maximo=1024, espera_ms=0.0):
+        self.tamanho_maximo = tamanho_maximo
+        self.espera = espera_ms / 1000
+        self._fila = []
+        self._agendado = None
+        self.requisicoes = 0
+        self.lotes = 0
+        self.maior_lote = 0
+
+    def calcular(self, registro):
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._fila.append((registro, futuro))
+        if len(self._fila) >= self.tamanho_maximo:
+            self._despachar()
+        elif self._agendado is None:
+            if self.espera > 0:
+                self._agendado = loop.call_later(self.espera, self._despachar)
+            else:
+                self._agendado = loop.call_soon(self._despachar)
+        return futuro
+
+    def _despachar(self):
+        if self._agendado is not None:
+            self._agendado.cancel()
+            self._agendado = None
+        lote, self._fila = self._fila, []
+        if not lote:
+            return
+
+        self.requisicoes += len(lote)
+        self.lotes += 1
+        self.maior_lote = max(self.maior_lote, len(lote))
+
+        registros = [registro for registro, _ in lote]
+        try:
+            with etapa('servico.lote', tamanho=len(lote)):
+                resultados = processar_bloco(registros)
+        except Exception as e:
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+        for (registro, futuro), resultado in zip(lote, resultados):
+            if not futuro.done():
+                futuro.set_result(montar_resposta(registro, resultado))
+
+    @property
+    def estatisticas(self):
+        return {'requisicoes': self.requisicoes, 'lotes': self.lotes, 'maior_lote': self.maior_lote,
+                'media_lote': self.requisicoes / self.lotes if self.lotes else 0.0}
+
+
+class ServicoCalculo:
+    """Servidor HTTP/1.1 (keep-alive) com as rotas do serviço de cálculo"""
+
+    def __init__(self, processos=None, tamanho_lote=1024, espera_ms=0.0):
+        self.agrupador = AgrupadorRequisicoes(tamanho_lote, espera_ms)
+        self.processos = processos or os.cpu_count() or 1
+        self._pool = None
+        self.inicio = time.monotonic()
+        self.rotas = {
+            ('POST', '/calcular'): self.rota_calcular,
+            ('POST', '/lote'): self.rota_lote,
+            ('GET', '/saude'): self.rota_saude,
+            ('GET', '/tipos'): self.rota_tipos,
+        }
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processos)
+        return self._pool
+
+    def encerrar(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    async def rota_calcular(self, corpo):
+        registro = self._ler_registro(self._ler_objeto(corpo))
+        tipo = normalizar_tipo(registro.get('tipo'))
+        if tipo in FORMULAS:
+            faltando = [nome for nome in ('resistividade', *FORMULAS[tipo][1]) if nome not in registro]
+            if faltando:
+                raise ErroHTTP(HTTPStatus.BAD_REQUEST, f"Parâmetros ausentes para {tipo}: {', '.join(faltando)}")
+        resposta = await self.agrupador.calcular(registro)
+        if 'erro' in resposta:
+            raise ErroHTTP(HTTPStatus.BAD_REQUEST, resposta['erro'])
+        return resposta
+
+    async def rota_lote(self, corpo):
+        registros = self._ler_objeto(corpo).get('registros')
+        if not isinstance(registros, list) or not all(isinstance(r, dict) for r in registros):
+            raise ErroHTTP(HTTPStatus.BAD_REQUEST, "Campo 'registros' deve ser uma lista de objetos")
+        registros = [self._ler_registro(registro) for registro in registros]
+        if len(registros) > MAXIMO_REGISTROS_LOTE:
+            raise ErroHTTP(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                           f"Máximo de {MAXIMO_REGISTROS_LOTE} registros por lote")
+
+        if len(registros) <= LIMITE_PROCESSOS:
+            with etapa('servico.lote', tamanho=len(registros)):
+                resultados = processar_bloco(registros)
+        else:
+            loop = asyncio.get_running_loop()
+            blocos = [registros[i:i + TAMANHO_BLOCO_PROCESSOS]
+                      for i in range(0, len(registros), TAMANHO_BLOCO_PROCESSOS)]
+            with etapa('servico.lote_processos', tamanho=len(registros)):
+                parciais = await asyncio.gather(
+                    *(loop.run_in_executor(self.pool, processar_bloco, bloco) for bloco in blocos))
+            resultados = [resultado for parcial in parciais for resultado in parcial]
+
+        return {'resultados': [montar_resposta(registro, resultado)
+                               for registro, resultado in zip(registros, resultados)]}
+
+    async def rota_saude(self, corpo):
+        return {'status': 'ok', 'tempo_ativo_s': time.monotonic() - self.inicio,
+                'processos': self.processos, **self.agrupador.estatisticas}
+
+    async def rota_tipos(self, corpo):
+        return {tipo: {'configuracao': CONFIGURACOES[tipo], 'parametros': ['resistividade', *nomes]}
+                for tipo, (_, nomes) in FORMULAS.items()}
+
+    @staticmethod
+    def _ler_objeto(corpo):
+        try:
+            dados = json.loads(corpo)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ErroHTTP(HTTPStatus.BAD_REQUEST, f"JSON inválido: {e}")
+        if not isinstance(dados, dict):
+            raise ErroHTTP(HTTPStatus.BAD_REQUEST, "O corpo deve ser um objeto JSON")
+        return dados
+
+    @staticmethod
+    def _ler_registro(registro):
+        """O tipo pode vir como número (código do menu); Calculo_Lote espera texto"""
+        tipo = registro.get('tipo')
+        if tipo is not None and not isinstance(tipo, str):
+            registro['tipo'] = str(tipo)
+        return registro
+
+    async def atender(self, leitor, escritor):
+        """Atende uma conexão; pedidos em sequência enquanto o cliente mantiver keep-alive"""
+        try:
+            while True:
+                try:
+                    cabecalho = await leitor.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    self._responder(escritor, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                    {'erro': "Cabeçalho muito grande"}, manter=False)
+                    break
+
+                try:
+                    metodo, caminho, versao, cabecalhos = self._ler_cabecalho(cabecalho)
+                    tamanho = int(cabecalhos.get('content-length', 0))
+                except (ValueError, UnicodeDecodeError):
+                    self._responder(escritor, HTTPStatus.BAD_REQUEST, {'erro': "Requisição malformada"},
+                                    manter=False)
+                    break
+                if tamanho > MAXIMO_CORPO:
+                    self._responder(escritor, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                    {'erro': "Corpo muito grande"}, manter=False)
+                    break
+                corpo = await leitor.readexactly(tamanho) if tamanho else b''
+
+                conexao = cabecalhos.get('connection', '').lower()
+                manter = conexao == 'keep-alive' if versao == 'HTTP/1.0' else conexao != 'close'
+
+                status, resposta = await self._despachar(metodo, caminho.split('?', 1)[0], corpo)
+                self._responder(escritor, status, resposta, manter)
+                await escritor.drain()
+                if not manter:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _despachar(self, metodo, caminho, corpo):
+        rota = self.rotas.get((metodo, caminho))
+        if rota is None:
+            if any(c == caminho for _, c in self.rotas):
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'erro': f"Método {metodo} não permitido em {caminho}"}
+            return HTTPStatus.NOT_FOUND, {'erro': f"Rota inexistente: {caminho}"}
+        try:
+            return HTTPStatus.OK, await rota(corpo)
+        except ErroHTTP as e:
+            return e.status, {'erro': e.mensagem}
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'erro': f"{type(e).__name__}: {e}"}
+
+    @staticmethod
+    def _ler_cabecalho(bloco):
+        linhas = bloco.decode('latin-1').split('\r\n')
+        metodo, caminho, versao = linhas[0].split(' ', 2)
+        cabecalhos = {}
+        for linha in linhas[1:]:
+            if linha:
+                nome, _, valor = linha.partition(':')
+                cabecalhos[nome.strip().lower()] = valor.strip()
+        return metodo, caminho, versao, cabecalhos
+
+    @staticmethod
+    def _responder(escritor, status, resposta, manter):
+        corpo = json.dumps(resposta, ensure_ascii=False).encode('utf-8')
+        escritor.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(corpo)}\r\n"
+            f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode('latin-1') + corpo)
+
+    async def iniciar(self, host='127.0.0.1', porta=8080):
+        return await asyncio.start_server(self.atender, host, porta, limit=MAXIMO_CABECALHO)
+
+
+async def servir(host='127.0.0.1', porta=8080, **opcoes):
+    servico = ServicoCalculo(**opcoes)
+    servidor = await servico.iniciar(host, porta)
+    enderecos = ", ".join(f"{s.getsockname()[0]}:{s.getsockname()[1]}" for s in servidor.sockets)
+    print(f"Serviço de cálculo de aterramento em http://{enderecos}", flush=True)
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servico.encerrar()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serviço HTTP/JSON de cálculo da resistência de aterramento.",
+        epilog="Rotas: POST /calcular {tipo, resistividade, geometria}; POST /lote {registros: [...]}; "
+               "GET /tipos; GET /saude. O tipo aceita o código do menu (1-4) ou o nome da fórmula.")
+    parser.add_argument('--host', default='127.0.0.1', help="endereço de escuta (padrão: 127.0.0.1)")
+    parser.add_argument('--porta', type=int, default=8080, help="porta TCP (padrão: 8080)")
+    parser.add_argument('--processos', type=int,
+                        help="processos para lotes grandes (padrão: número de CPUs)")
+    parser.add_argument('--tamanho-lote', type=int, default=1024,
+                        help="máximo de pedidos /calcular agrupados num cálculo (padrão: 1024)")
+    parser.add_argument('--espera-ms', type=float, default=0.0,
+                        help="tempo que um pedido aguarda outros para formar o lote (padrão: 0)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(servir(args.host, args.porta, processos=args.processos,
+                           tamanho_lote=args.tamanho_lote, espera_ms=args.espera_ms))
+    except KeyboardInterrupt:
+        pass
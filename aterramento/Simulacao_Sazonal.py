@@ -0,0 +1,407 @@
+import argparse
+import csv
+import itertools
+import json
+import math
+import sys
+import time
+
+import numpy as np
+
+from Calculo_Lote import converter_numero, normalizar_tipo
+from Motor_Calculo import FORMULAS, LIMITES_NORMA
+
+# Curvas padrão de correção (IEEE Std 142, tabelas de resistividade × umidade e × temperatura).
+# Umidade em % do peso (solo franco-arenoso) e temperatura em °C, com ρ em Ω·m; só a forma
+# da curva é usada: o fator é ρ(x) / ρ(x_referência). Abaixo de 0 °C a água congela e ρ salta.
+CURVA_UMIDADE_PADRAO = ((2.5, 1500.0), (5.0, 430.0), (10.0, 185.0), (15.0, 105.0), (20.0, 63.0), (30.0, 42.0))
+CURVA_TEMPERATURA_PADRAO = ((-15.0, 3300.0), (-5.0, 790.0), (-0.1, 300.0), (0.0, 138.0), (10.0, 99.0),
+                            (20.0, 72.0))
+UMIDADE_REFERENCIA = 20.0
+TEMPERATURA_REFERENCIA = 20.0
+
+LINHAS_POR_BLOCO = 2000
+NOMES_MESES = ('Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez')
+NOMES_ESTACOES = ('Verão', 'Outono', 'Inverno', 'Primavera')
+# Estação (índice em NOMES_ESTACOES) de cada mês, de janeiro a dezembro
+ESTACOES_MES = {
+    'sul': (0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0),
+    'norte': (2, 2, 3, 3, 3, 0, 0, 0, 1, 1, 1, 2),
+}
+
+
+class CurvaCorrecao:
+    """
+    Fator multiplicativo de ρ em função de uma variável (umidade, temperatura), por
+    interpolação linear de log ρ entre os pontos da curva. Fora da curva vale o extremo.
+    """
+
+    def __init__(self, pontos, referencia):
+        pontos = sorted((float(x), float(rho)) for x, rho in pontos)
+        self.x = np.array([x for x, _ in pontos])
+        self.log_rho = np.log([rho for _, rho in pontos])
+        self.referencia = referencia
+        self._log_referencia = float(np.interp(referencia, self.x, self.log_rho))
+
+    def __call__(self, valores):
+        return np.exp(np.interp(valores, self.x, self.log_rho) - self._log_referencia)
+
+
+def carregar_curvas(caminho=None):
+    """
+    Curvas de umidade e temperatura; o JSON opcional pode trocar qualquer uma:
+    {"umidade": [[x, ρ], ...], "umidade_referencia": 20, "temperatura": [...], "temperatura_referencia": 20}
+    """
+    config = {}
+    if caminho:
+        with open(caminho, encoding='utf-8') as arquivo:
+            config = json.load(arquivo)
+    return (CurvaCorrecao(config.get('umidade', CURVA_UMIDADE_PADRAO),
+                          config.get('umidade_referencia', UMIDADE_REFERENCIA)),
+            CurvaCorrecao(config.get('temperatura', CURVA_TEMPERATURA_PADRAO),
+                          config.get('temperatura_referencia', TEMPERATURA_REFERENCIA)))
+
+
+def ler_locais(caminho):
+    """
+    CSV de locais: local, tipo, resistividade (medida nas condições de referência) e a
+    geometria do tipo, nas mesmas colunas de Calculo_Lote.
+    Retorna (locais, ρ de referência, R por Ω·m, parcela fixa de R) de cada eletrodo.
+    """
+    with open(caminho, newline='', encoding='utf-8') as arquivo:
+        linhas = list(csv.DictReader(arquivo))
+    if not linhas:
+        raise ValueError(f"Nenhum local em {caminho}")
+
+    locais = [linha.get('local', str(i + 1)) for i, linha in enumerate(linhas)]
+    resistividade = np.array([converter_numero(linha.get('resistividade')) for linha in linhas])
+    unitaria = np.full(len(linhas), np.nan)
+    fixa = np.zeros(len(linhas))
+
+    # R é afim em ρ (R = ρ·g + c, c ≠ 0 só com tratamento, cuja resistividade não varia com
+    # o clima): cada eletrodo é avaliado com ρ = 0 e ρ = 1, agrupado por tipo
+    tipos = [normalizar_tipo(linha.get('tipo')) for linha in linhas]
+    for tipo in set(tipos):
+        indices = [i for i, t in enumerate(tipos) if t == tipo]
+        if tipo not in FORMULAS:
+            raise ValueError(f"Tipo de eletrodo desconhecido em {locais[indices[0]]}: {linhas[indices[0]].get('tipo')}")
+        formula, nomes = FORMULAS[tipo]
+        geometria = [np.array([converter_numero(linhas[i].get(nome)) for i in indices]) for nome in nomes]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fixa[indices] = formula(np.zeros(len(indices)), *geometria)
+            unitaria[indices] = formula(np.ones(len(indices)), *geometria) - fixa[indices]
+
+    invalidos = [local for local, rho, r, c in zip(locais, resistividade, unitaria, fixa)
+                 if not (rho > 0 and math.isfinite(r) and r > 0 and math.isfinite(c) and c >= 0)]
+    if invalidos:
+        raise ValueError(f"Valores inválidos nos locais: {', '.join(invalidos)}")
+    return locais, resistividade, unitaria, fixa
+
+
+def _colunas_serie(cabecalho, locais, caminho):
+    """Índice da coluna de cada local; uma única coluna de valores vale para todos"""
+    nomes = [nome.strip() for nome in cabecalho[1:]]
+    if len(nomes) == 1:
+        return [1]
+    posicao = {nome: i + 1 for i, nome in enumerate(nomes)}
+    faltando = [local for local in locais if local not in posicao]
+    if faltando:
+        raise ValueError(f"{caminho}: sem coluna para os locais {', '.join(faltando[:10])}")
+    return [posicao[local] for local in locais]
+
+
+def ler_series(caminho_umidade, caminho_temperatura, locais, linhas_por_bloco=LINHAS_POR_BLOCO):
+    """
+    Lê as séries em blocos, sem carregar os arquivos inteiros. Cada CSV tem a coluna data
+    (ISO 8601) e uma coluna por local (ou uma só, comum a todos), com as mesmas datas nos dois.
+    Gera (datas, umidade, temperatura) com forma (linhas,) e (linhas, locais ou 1).
+    """
+    with open(caminho_umidade, encoding='utf-8') as umidade, open(caminho_temperatura, encoding='utf-8') as temperatura:
+        leitores = []
+        for arquivo, caminho in ((umidade, caminho_umidade), (temperatura, caminho_temperatura)):
+            colunas = _colunas_serie(arquivo.readline().rstrip('\r\n').split(','), locais, caminho)
+            leitores.append((arquivo, colunas))
+
+        while True:
+            blocos = []
+            for arquivo, colunas in leitores:
+                linhas = [linha for linha in itertools.islice(arquivo, linhas_por_bloco) if linha.strip()]
+                if not linhas:
+                    blocos.append(None)
+                    continue
+                datas = np.array([linha[:linha.index(',')] for linha in linhas], dtype='datetime64[s]')
+                usadas = sorted(set(colunas))
+                valores = np.loadtxt(linhas, delimiter=',', usecols=usadas, ndmin=2)
+                blocos.append((datas, valores[:, [usadas.index(coluna) for coluna in colunas]]))
+            if blocos == [None, None]:
+                return
+            if None in blocos:
+                raise ValueError("As séries de umidade e temperatura têm tamanhos diferentes")
+            (datas, valores_umidade), (datas_temperatura, valores_temperatura) = blocos
+            if len(datas) != len(datas_temperatura) or np.any(datas != datas_temperatura):
+                raise ValueError(f"Datas diferentes nas séries de umidade e temperatura a partir de {datas[0]}")
+            yield datas, valores_umidade, valores_temperatura
+
+
+def series_sinteticas(n_locais, anos, inicio='2015-01-01', linhas_por_bloco=LINHAS_POR_BLOCO,
+                      hemisferio='sul', semente=0):
+    """
+    Séries horárias de exemplo: ciclo anual de umidade (estação seca no inverno) e de
+    temperatura, ciclo diário de temperatura e ruído, com amplitudes diferentes por local.
+    """
+    gerador = np.random.default_rng(semente)
+    umidade_media = gerador.uniform(12, 25, n_locais)
+    umidade_amplitude = gerador.uniform(3, 7, n_locais)
+    temperatura_media = gerador.uniform(10, 26, n_locais)
+    temperatura_amplitude = gerador.uniform(3, 8, n_locais)
+    defasagem = 0.0 if hemisferio == 'sul' else math.pi
+
+    origem = np.datetime64(inicio, 'h')
+    total = int(round(anos * 365.25 * 24))
+    for inicio_bloco in range(0, total, linhas_por_bloco):
+        horas = np.arange(inicio_bloco, min(inicio_bloco + linhas_por_bloco, total))
+        # Fase anual: 0 em janeiro (verão no hemisfério sul)
+        anual = np.cos(2 * math.pi * horas / (365.25 * 24) + defasagem)[:, None]
+        diario = np.cos(2 * math.pi * (horas % 24 - 15) / 24)[:, None]
+        umidade = umidade_media + umidade_amplitude * anual + gerador.normal(0, 1, (len(horas), n_locais))
+        temperatura = (temperatura_media + temperatura_amplitude * anual + 3 * diario +
+                       gerador.normal(0, 1, (len(horas), n_locais)))
+        yield ((origem + horas).astype('datetime64[s]'), np.clip(umidade, 1, None), temperatura)
+
+
+def gravar_series(blocos, locais, caminho_umidade, caminho_temperatura):
+    """Grava blocos (datas, umidade, temperatura) nos CSVs lidos por ler_series"""
+    cabecalho = "data," + ",".join(locais) + "\n"
+    with open(caminho_umidade, 'w', encoding='utf-8') as umidade, \
+            open(caminho_temperatura, 'w', encoding='utf-8') as temperatura:
+        umidade.write(cabecalho)
+        temperatura.write(cabecalho)
+        for datas, valores_umidade, valores_temperatura in blocos:
+            rotulos = np.datetime_as_string(datas, unit='m')
+            for arquivo, valores in ((umidade, valores_umidade), (temperatura, valores_temperatura)):
+                arquivo.writelines(f"{rotulo},{','.join(linha)}\n" for rotulo, linha in
+                                   zip(rotulos, np.char.mod('%.1f', valores).tolist()))
+
+
+class ResultadoSazonal:
+    """Acumuladores por local e por mês de R(t), reduzidos à medida que os blocos chegam"""
+
+    def __init__(self, locais, limite, hemisferio):
+        n = len(locais)
+        self.locais = locais
+        self.limite = limite
+        self.hemisferio = hemisferio
+        self.horas_mes = np.zeros(12)
+        self.soma_mes = np.zeros((12, n))        # Σ R·Δt
+        self.horas_acima_mes = np.zeros((12, n))
+        self.maximo = np.full(n, -np.inf)
+        self.data_maximo = np.full(n, np.datetime64('NaT'), dtype='datetime64[s]')
+        self.minimo = np.full(n, np.inf)
+        self.amostras = 0
+        self.inicio = None
+        self.fim = None
+
+    def acumular(self, datas, R, duracao):
+        meses = datas.astype('datetime64[M]').astype(np.int64) % 12
+        acima = (R > self.limite) * duracao[:, None]
+        ponderado = R * duracao[:, None]
+        for mes in np.unique(meses):
+            linhas = meses == mes
+            self.horas_mes[mes] += duracao[linhas].sum()
+            self.soma_mes[mes] += ponderado[linhas].sum(axis=0)
+            self.horas_acima_mes[mes] += acima[linhas].sum(axis=0)
+
+        indice = R.argmax(axis=0)
+        maximo_bloco = R[indice, np.arange(R.shape[1])]
+        novo = maximo_bloco > self.maximo
+        self.maximo[novo] = maximo_bloco[novo]
+        self.data_maximo[novo] = datas[indice[novo]]
+        self.minimo = np.minimum(self.minimo, R.min(axis=0))
+
+        self.amostras += len(datas)
+        self.inicio = datas[0] if self.inicio is None else self.inicio
+        self.fim = datas[-1]
+
+    @property
+    def horas(self):
+        return self.horas_mes.sum()
+
+    @property
+    def horas_acima(self):
+        return self.horas_acima_mes.sum(axis=0)
+
+    @property
+    def media(self):
+        return self.soma_mes.sum(axis=0) / self.horas
+
+    def _por_estacao(self, por_mes):
+        estacoes = np.asarray(ESTACOES_MES[self.hemisferio])
+        return np.stack([por_mes[estacoes == e].sum(axis=0) for e in range(len(NOMES_ESTACOES))])
+
+    @property
+    def media_mensal(self):
+        """R médio por mês (12 × locais); NaN nos meses sem dados"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.soma_mes / self.horas_mes[:, None]
+
+    @property
+    def media_estacao(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self._por_estacao(self.soma_mes) / self._por_estacao(self.horas_mes)[:, None]
+
+    @property
+    def horas_acima_estacao(self):
+        return self._por_estacao(self.horas_acima_mes)
+
+    def pior_mes(self):
+        """Mês de maior R médio de cada local"""
+        return np.argmax(np.nan_to_num(self.media_mensal, nan=-np.inf), axis=0)
+
+    def pior_estacao(self):
+        return np.argmax(np.nan_to_num(self.media_estacao, nan=-np.inf), axis=0)
+
+    def resumo_geral(self):
+        """Estação e mês com mais locais-hora acima do limite, somando todos os locais"""
+        horas_estacao = self._por_estacao(self.horas_mes)
+        acima_estacao = self.horas_acima_estacao.sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fracao_estacao = acima_estacao / (horas_estacao * len(self.locais))
+            fracao_mes = self.horas_acima_mes.sum(axis=1) / (self.horas_mes * len(self.locais))
+        return {
+            'locais': len(self.locais),
+            'amostras': self.amostras,
+            'periodo': (str(self.inicio), str(self.fim)),
+            'locais_acima_alguma_vez': int(np.sum(self.maximo > self.limite)),
+            'fracao_tempo_acima': float(self.horas_acima.sum() / (self.horas * len(self.locais))),
+            'fracao_acima_estacao': dict(zip(NOMES_ESTACOES, np.nan_to_num(fracao_estacao).tolist())),
+            'pior_estacao': NOMES_ESTACOES[int(np.argmax(np.nan_to_num(fracao_estacao, nan=-1)))],
+            'pior_mes': NOMES_MESES[int(np.argmax(np.nan_to_num(fracao_mes, nan=-1)))],
+        }
+
+    def linhas_relatorio(self):
+        """Uma linha por local para o CSV de saída"""
+        media, horas_acima = self.media, self.horas_acima
+        pior_mes, pior_estacao = self.pior_mes(), self.pior_estacao()
+        media_estacao, acima_estacao = self.media_estacao, self.horas_acima_estacao
+        horas_estacao = self._por_estacao(self.horas_mes)
+        for i, local in enumerate(self.locais):
+            e = pior_estacao[i]
+            yield {
+                'local': local,
+                'R_medio': f"{media[i]:.4f}",
+                'R_minimo': f"{self.minimo[i]:.4f}",
+                'R_maximo': f"{self.maximo[i]:.4f}",
+                'data_maximo': str(self.data_maximo[i]),
+                'horas_acima_limite': f"{horas_acima[i]:.1f}",
+                'fracao_acima_limite': f"{horas_acima[i] / self.horas:.4f}",
+                'pior_mes': NOMES_MESES[pior_mes[i]],
+                'pior_estacao': NOMES_ESTACOES[e],
+                'R_medio_pior_estacao': f"{media_estacao[e, i]:.4f}",
+                'fracao_acima_pior_estacao': f"{acima_estacao[e, i] / horas_estacao[e]:.4f}",
+            }
+
+
+def simular(blocos, locais, resistividade, resistencia_unitaria, curva_umidade, curva_temperatura,
+            limite=LIMITES_NORMA[-1], hemisferio='sul', resistencia_fixa=None):
+    """
+    R(t) = ρ_ref · f_umidade(w(t)) · f_temperatura(T(t)) · R_unitária + R_fixa de cada local,
+    calculado bloco a bloco. blocos: iterável de (datas, umidade, temperatura) como os de
+    ler_series. Cada amostra vale o intervalo desde a anterior, limitado ao passo típico
+    da série (mediana do primeiro bloco): lacunas nos dados não contam como tempo.
+    """
+    resultado = ResultadoSazonal(list(locais), limite, hemisferio)
+    fator_local = (np.asarray(resistividade, dtype=float) * np.asarray(resistencia_unitaria, dtype=float))[None, :]
+    if resistencia_fixa is not None:
+        fixa = np.asarray(resistencia_fixa, dtype=float)[None, :]
+    anterior, passo = None, None
+
+    for datas, umidade, temperatura in blocos:
+        if anterior is None:
+            passo = float(np.median(np.diff(datas).astype(np.float64))) / 3600 if len(datas) > 1 else 1.0
+            anterior = datas[0] - np.timedelta64(int(round(passo * 3600)), 's')
+        duracao = np.minimum(np.diff(np.concatenate([[anterior], datas])).astype(np.float64) / 3600, passo)
+        anterior = datas[-1]
+
+        R = curva_umidade(umidade)
+        R *= curva_temperatura(temperatura)
+        R = R * fator_local
+        if resistencia_fixa is not None:
+            R += fixa
+        resultado.acumular(datas, R, duracao)
+
+    if resultado.amostras == 0:
+        raise ValueError("Séries vazias")
+    return resultado
+
+
+def imprimir_relatorio(resultado, maximo_locais=10):
+    resumo = resultado.resumo_geral()
+    print("=" * 70)
+    print("SIMULAÇÃO SAZONAL DA RESISTÊNCIA DE ATERRAMENTO")
+    print("=" * 70)
+    print(f"Período: {resumo['periodo'][0]} a {resumo['periodo'][1]} ({resumo['amostras']} amostras)")
+    print(f"Locais: {resumo['locais']}")
+    print(f"Locais acima de {resultado.limite:g} Ω em algum momento: {resumo['locais_acima_alguma_vez']}")
+    print(f"Tempo acima do limite (todos os locais): {resumo['fracao_tempo_acima']:.1%}")
+    print(f"Pior estação: {resumo['pior_estacao']} | Pior mês: {resumo['pior_mes']}")
+    print("Tempo acima do limite por estação: " +
+          ", ".join(f"{nome} {fracao:.1%}" for nome, fracao in resumo['fracao_acima_estacao'].items()))
+
+    linhas = sorted(resultado.linhas_relatorio(), key=lambda linha: -float(linha['fracao_acima_limite']))
+    print(f"\n{'Local':<12}{'R médio':>9}{'R máx':>9}{'Data do máximo':>22}{'Acima':>8}  Pior estação")
+    print("-" * 70)
+    for linha in linhas[:maximo_locais]:
+        print(f"{linha['local'][:12]:<12}{float(linha['R_medio']):>9.2f}{float(linha['R_maximo']):>9.2f}"
+              f"{linha['data_maximo']:>22}{float(linha['fracao_acima_limite']):>8.1%}  {linha['pior_estacao']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Resistência de aterramento ao longo do tempo com ρ corrigido pela umidade e temperatura.",
+        epilog="Séries: CSVs com a coluna data (ISO 8601) e uma coluna por local (ou uma só, comum a "
+               "todos). Locais: CSV com local, tipo, resistividade nas condições de referência e geometria.")
+    parser.add_argument('locais', nargs='?', help="CSV de locais e eletrodos")
+    parser.add_argument('--umidade', help="CSV da série de umidade do solo (%% em peso)")
+    parser.add_argument('--temperatura', help="CSV da série de temperatura do solo (°C)")
+    parser.add_argument('--curvas', help="JSON com curvas de correção próprias")
+    parser.add_argument('--limite', type=float, default=LIMITES_NORMA[-1], help="limite em Ω (padrão: 10)")
+    parser.add_argument('--hemisferio', choices=['sul', 'norte'], default='sul',
+                        help="define as estações pelos meses (padrão: sul)")
+    parser.add_argument('--saida', help="grava o relatório por local neste CSV")
+    parser.add_argument('--exemplo', nargs=2, type=float, metavar=('LOCAIS', 'ANOS'),
+                        help="simula séries sintéticas em memória (malhas de 20 × 20 m, ρ de 50 a 600 Ω·m)")
+    args = parser.parse_args()
+
+    curva_umidade, curva_temperatura = carregar_curvas(args.curvas)
+    inicio = time.perf_counter()
+    try:
+        if args.exemplo:
+            n_locais, anos = int(args.exemplo[0]), args.exemplo[1]
+            locais = [f"L{i + 1:04d}" for i in range(n_locais)]
+            resistividade = np.random.default_rng(1).uniform(50, 600, n_locais)
+            unitaria = np.full(n_locais, FORMULAS['malha'][0](1.0, 400.0, 240.0, 0.6))
+            fixa = None
+            blocos = series_sinteticas(n_locais, anos, hemisferio=args.hemisferio)
+        else:
+            if not (args.locais and args.umidade and args.temperatura):
+                parser.error("informe o CSV de locais, --umidade e --temperatura (ou use --exemplo)")
+            locais, resistividade, unitaria, fixa = ler_locais(args.locais)
+            blocos = ler_series(args.umidade, args.temperatura, locais)
+
+        resultado = simular(blocos, locais, resistividade, unitaria, curva_umidade, curva_temperatura,
+                            args.limite, args.hemisferio, fixa)
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        sys.exit(1)
+    duracao = time.perf_counter() - inicio
+
+    imprimir_relatorio(resultado)
+    print(f"\nProcessado em {duracao:.1f} s "
+          f"({resultado.amostras * len(resultado.locais) / duracao / 1e6:.1f} milhões de valores por segundo)")
+
+    if args.saida:
+        with open(args.saida, 'w', newline='', encoding='utf-8') as arquivo:
+            linhas = list(resultado.linhas_relatorio())
+            escritor = csv.DictWriter(arquivo, fieldnames=list(linhas[0]))
+            escritor.writeheader()
+            escritor.writerows(linhas)
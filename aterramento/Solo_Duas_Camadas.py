@@ -0,0 +1,225 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from Motor_Calculo import resistencia_haste_unica, resistencia_malha
+
+# Tolerância relativa da soma da série de imagens e limite de termos
+TOLERANCIA_SERIE = 1e-9
+TERMOS_MAXIMOS = 2000
+
+# Trecho mínimo na camada inferior, em diâmetros, para o modelo de fio fino valer
+TRECHO_MINIMO_DIAMETROS = 10
+
+# Modelo de solo em duas camadas: camada superior de resistividade ρ1 e espessura H
+# sobre um semi-espaço de resistividade ρ2. Uma fonte de corrente na camada superior
+# tem imagens em ±z + 2nH com peso K^|n|, onde K = (ρ2 - ρ1)/(ρ2 + ρ1).
+#
+# Para cada eletrodo a série é separada em duas partes:
+#   Σ K^n G_n = Σ K^n (G_n - g/n) + g·(-ln(1 - K))
+# onde g/n é o comportamento assintótico de G_n (imagens distantes vistas como pontos).
+# A primeira soma decai como K^n/n³ e converge com poucos termos mesmo com |K| → 1;
+# a segunda é exata. Os termos G_n - g/n dependem só da geometria e ficam em cache.
+
+
+def coeficiente_reflexao(rho1, rho2):
+    """K = (ρ2 - ρ1) / (ρ2 + ρ1)"""
+    rho1 = np.asarray(rho1, dtype=float)
+    rho2 = np.asarray(rho2, dtype=float)
+    return (rho2 - rho1) / (rho2 + rho1)
+
+
+def _numero_termos(k_maximo, razao):
+    """Menor N com |K|^N (razao/N)² / N <= TOLERANCIA_SERIE (razao = dimensão do eletrodo / H)"""
+    n = np.arange(1, TERMOS_MAXIMOS + 1)
+    with np.errstate(divide='ignore'):
+        cota = k_maximo ** n * (razao / n) ** 2 / n
+    suficientes = np.flatnonzero(cota <= TOLERANCIA_SERIE)
+    return int(n[suficientes[0]]) if len(suficientes) else TERMOS_MAXIMOS
+
+
+def _primitiva(u, raio):
+    """F(u) = u·asinh(u/a) - √(u² + a²), com F'' = 1/√(u² + a²)"""
+    return u * np.arcsinh(u / raio) - np.sqrt(u * u + raio * raio)
+
+
+def _mutua_coaxial(comprimento, raio, inicio, fim):
+    """∫∫ dz dw / √(a² + (z - w)²) para z em [0, L] (a haste) e w em [inicio, fim] (uma imagem)"""
+    F = _primitiva
+    return (F(comprimento - inicio, raio) - F(-inicio, raio)
+            - F(comprimento - fim, raio) + F(-fim, raio))
+
+
+@lru_cache(maxsize=256)
+def _termos_haste(comprimento, diametro, espessura, n_termos):
+    """Termos G_n - g/n da haste (n = 1..N), normalizados por L²"""
+    n = np.arange(1, n_termos + 1, dtype=float)
+    # Raio equivalente igual ao diâmetro: com ele o potencial médio de corrente uniforme
+    # reproduz Dwight, e a imagem encostada na interface (L → H) não faz R crescer com L
+    raio = diametro
+    centro = 2 * n * espessura
+    G = (_mutua_coaxial(comprimento, raio, centro - comprimento, centro + comprimento) +
+         _mutua_coaxial(comprimento, raio, -centro - comprimento, -centro + comprimento))
+    assintotico = 2 * comprimento ** 2 / (n * espessura)
+    termos = (G - assintotico) / comprimento ** 2
+    termos.flags.writeable = False
+    return termos
+
+
+def _mutua(inicio1, fim1, inicio2, fim2, raio):
+    """∫∫ dz dw / √(a² + (z - w)²) para z em [inicio1, fim1] e w em [inicio2, fim2]"""
+    return _mutua_coaxial(fim1 - inicio1, raio, inicio2 - inicio1, fim2 - inicio1)
+
+
+@lru_cache(maxsize=256)
+def _termos_trecho_inferior(comprimento, diametro, espessura, n_termos):
+    """
+    Termos da haste que atravessa a interface (n = 1..N), normalizados por ℓ² (ℓ = L - H):
+    trecho inferior com as imagens em -[H, L] - 2nH, menos o assintótico ℓ²/(2nH)
+    """
+    n = np.arange(1, n_termos + 1, dtype=float)
+    H, ell = espessura, comprimento - espessura
+    G = _mutua(H, comprimento, -comprimento - 2 * n * H, -H - 2 * n * H, diametro)
+    termos = (G - ell ** 2 / (2 * n * H)) / ell ** 2
+    termos.flags.writeable = False
+    return termos
+
+
+@lru_cache(maxsize=256)
+def _termos_trecho_mutuo(comprimento, diametro, espessura, n_termos):
+    """
+    Termos mútuos entre o trecho inferior e o superior (com sua imagem na superfície)
+    deslocado de 2nH, menos o assintótico ℓ/n, normalizados por H·ℓ
+    """
+    n = np.arange(1, n_termos + 1, dtype=float)
+    H, ell = espessura, comprimento - espessura
+    G = _mutua(H, comprimento, -(2 * n + 1) * H, -(2 * n - 1) * H, diametro)
+    termos = (G - ell / n) / (H * ell)
+    termos.flags.writeable = False
+    return termos
+
+
+@lru_cache(maxsize=256)
+def _termos_malha(area, profundidade, espessura, n_termos):
+    """Termos da malha (disco equivalente) menos o assintótico 2/(nH), n = 1..N"""
+    n = np.arange(1, n_termos + 1, dtype=float)
+    # Distância efetiva de um disco uniforme a si mesmo: 3πr/8 (potencial médio = 8/(3πr))
+    raio_efetivo = 3 * math.pi * math.sqrt(area / math.pi) / 8
+    D = 2 * n * espessura
+    termos = (2 / np.sqrt(D ** 2 + raio_efetivo ** 2) +
+              1 / np.sqrt((D - 2 * profundidade) ** 2 + raio_efetivo ** 2) +
+              1 / np.sqrt((D + 2 * profundidade) ** 2 + raio_efetivo ** 2) -
+              2 / (n * espessura))
+    termos.flags.writeable = False
+    return termos
+
+
+def _somar_serie(K, funcao_termos, geometria, razao):
+    """Σ K^n·termos_n, agrupando pontos de mesma geometria para reaproveitar o cache"""
+    K, *geometria = np.broadcast_arrays(K, *geometria)
+    n_termos = _numero_termos(float(np.max(np.abs(K), initial=0.0)), float(np.max(razao, initial=0.0)))
+
+    # Caso comum nas varreduras: geometria fixa e só as resistividades variando
+    if all(g.size == 0 or g.min() == g.max() for g in geometria):
+        chave = tuple(float(g.flat[0]) if g.size else 0.0 for g in geometria)
+        termos = funcao_termos(*chave, n_termos)
+        return np.polynomial.polynomial.polyval(K, np.concatenate(([0.0], termos)))
+
+    chaves = np.stack([g.ravel() for g in geometria], axis=1)
+    unicas, grupos = np.unique(chaves, axis=0, return_inverse=True)
+    soma = np.empty(K.shape)
+    K_plano, soma_plana = K.ravel(), soma.reshape(-1)
+    for i, chave in enumerate(unicas):
+        selecao = grupos.ravel() == i
+        termos = funcao_termos(*(float(v) for v in chave), n_termos)
+        # Horner: Σ_{n=1..N} K^n t_n
+        soma_plana[selecao] = np.polynomial.polynomial.polyval(K_plano[selecao], np.concatenate(([0.0], termos)))
+    return soma
+
+
+def _haste_camada_superior(rho1, K, espessura, comprimento, diametro):
+    """Haste contida na camada superior: Dwight com ρ1 mais a série de imagens"""
+    serie = _somar_serie(K, _termos_haste, (comprimento, diametro, espessura), comprimento / espessura)
+    cauda = 2 / espessura * -np.log1p(-K)
+    return resistencia_haste_unica(rho1, comprimento, diametro) + rho1 / (4 * math.pi) * (serie + cauda)
+
+
+def _haste_atravessando(rho1, rho2, K, espessura, comprimento, diametro):
+    """
+    Haste que atravessa a interface, dividida nos trechos [0, H] e [H, L] com densidade de
+    corrente uniforme em cada um e mesmo potencial: R = (R11·R22 - R12²)/(R11 + R22 - 2·R12).
+
+    R11 é a haste de comprimento H da camada superior; R22 e R12 vêm das funções de Green
+    para fonte na camada inferior, com imagens em 2H - z (peso -K) e -z - 2nH (peso
+    (1 - K²)·K^n), e para fonte na superior vista da inferior (peso (1 + K)·K^n). Nas
+    integrais o raio equivalente é o diâmetro, como em _termos_haste.
+
+    Um trecho inferior mais curto que alguns diâmetros não é fio fino (R22 fica finito
+    quando ℓ → 0): abaixo de TRECHO_MINIMO_DIAMETROS·d, R é interpolado linearmente entre
+    R11 (ℓ = 0) e o modelo no trecho mínimo, o que mantém R contínua em L = H.
+    """
+    H, d = espessura, diametro
+    minimo = TRECHO_MINIMO_DIAMETROS * d
+    fracao = np.minimum((comprimento - H) / minimo, 1.0)
+    L = np.maximum(comprimento, H + minimo)
+    ell = L - H
+    cauda = -np.log1p(-K)
+
+    R11 = _haste_camada_superior(rho1, K, H, H, d)
+
+    serie = _somar_serie(K, _termos_trecho_inferior, (L, d, H), L / H)
+    imagens = (_mutua(H, L, -L, -H, d) + ell ** 2 * (serie + cauda / (2 * H)))
+    R22 = rho2 / (4 * math.pi * ell ** 2) * (_mutua(H, L, H, L, d) - K * _mutua(H, L, 2 * H - L, H, d) +
+                                             (1 - K ** 2) * imagens)
+
+    serie = _somar_serie(K, _termos_trecho_mutuo, (L, d, H), L / H)
+    R12 = rho1 * (1 + K) / (4 * math.pi * H * ell) * (_mutua(H, L, -H, H, d) + H * ell * serie + ell * cauda)
+
+    R = (R11 * R22 - R12 ** 2) / (R11 + R22 - 2 * R12)
+    return R11 + fracao * (R - R11)
+
+
+def resistencia_haste_duas_camadas(rho1, rho2, espessura, comprimento, diametro):
+    """
+    Haste vertical em solo de duas camadas (ρ1 sobre ρ2, camada superior de espessura H).
+
+    Haste contida na camada superior (L <= H): Dwight modificada com ρ1 mais a série de
+    imagens pelo método do potencial médio. Com K = 0 coincide com resistencia_haste_unica.
+    Haste que atravessa a interface (L > H): trechos em cada camada acoplados pelas mesmas
+    séries de imagens (ver _haste_atravessando), contínua em L = H.
+    """
+    rho1, rho2, espessura, comprimento, diametro = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (rho1, rho2, espessura, comprimento, diametro)))
+    K = coeficiente_reflexao(rho1, rho2)
+    dentro = comprimento <= espessura
+
+    R = np.empty(K.shape)
+
+    if np.any(dentro):
+        R[dentro] = _haste_camada_superior(rho1[dentro], K[dentro], espessura[dentro],
+                                           comprimento[dentro], diametro[dentro])
+
+    if np.any(~dentro):
+        R[~dentro] = _haste_atravessando(rho1[~dentro], rho2[~dentro], K[~dentro], espessura[~dentro],
+                                         comprimento[~dentro], diametro[~dentro])
+
+    return R
+
+
+def resistencia_malha_duas_camadas(rho1, rho2, espessura, area, comprimento_total, profundidade):
+    """
+    Malha enterrada na camada superior (profundidade < H) de um solo de duas camadas.
+
+    A parte uniforme usa resistencia_malha com ρ1; o efeito da segunda camada vem da série
+    de imagens da malha representada por um disco equivalente de mesma área.
+    """
+    rho1, rho2, espessura, area, comprimento_total, profundidade = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (rho1, rho2, espessura, area, comprimento_total, profundidade)))
+    if np.any(profundidade >= espessura):
+        raise ValueError("A malha deve estar na camada superior (profundidade < espessura)")
+
+    K = coeficiente_reflexao(rho1, rho2)
+    serie = _somar_serie(K, _termos_malha, (area, profundidade, espessura), np.sqrt(area) / espessura)
+    cauda = 2 / espessura * -np.log1p(-K)
+    return resistencia_malha(rho1, area, comprimento_total, profundidade) + rho1 / (4 * math.pi) * (serie + cauda)
@@ -0,0 +1,394 @@
+import argparse
+import math
+import os
+import sys
+from decimal import Decimal, getcontext
+
+import numpy as np
+
+import Calculo_Simples
+import Fator_Utilizacao
+import Metodo_Momentos
+from Motor_Calculo import FORMULAS, calcular
+
+# Referência independente: as mesmas fórmulas em aritmética decimal de 40 dígitos
+getcontext().prec = 40
+PI = Decimal('3.1415926535897932384626433832795028841972')
+
+# Valores de referência (Ω), conferidos com a aritmética decimal abaixo
+TABELA_REFERENCIA = [
+    ('motor', 'haste_unica', {'resistividade': 100, 'comprimento': 3.0, 'diametro': 0.016}, 29.8154143785875),
+    ('motor', 'haste_unica', {'resistividade': 1000, 'comprimento': 2.4, 'diametro': 0.0127}, 373.212796591706),
+    ('motor', 'multiplas_hastes', {'resistividade': 100, 'n_hastes': 3, 'comprimento': 2.4, 'diametro': 0.016,
+                                   'espacamento': 2.4}, 14.7903325720791),
+    ('motor', 'multiplas_hastes', {'resistividade': 250, 'n_hastes': 6, 'comprimento': 3.0, 'diametro': 0.019,
+                                   'espacamento': 6.0}, 15.0056579179703),
+    ('motor', 'condutor_horizontal', {'resistividade': 100, 'comprimento': 15.0, 'diametro': 0.01,
+                                      'profundidade': 0.6}, 9.13771788344122),
+    ('motor', 'condutor_horizontal', {'resistividade': 500, 'comprimento': 50.0, 'diametro': 0.0106,
+                                      'profundidade': 0.8}, 16.9119488293502),
+    ('motor', 'malha', {'resistividade': 100, 'area': 36.0, 'comprimento_total': 24.0, 'profundidade': 0.5},
+     11.9441031093974),
+    ('motor', 'malha', {'resistividade': 300, 'area': 400.0, 'comprimento_total': 240.0, 'profundidade': 0.6},
+     5.56434350247064),
+    ('motor', 'haste_tratada', {'resistividade': 100, 'comprimento': 2.4, 'diametro': 0.016,
+                                'diametro_tratamento': 0.15, 'resistividade_tratamento': 2.5}, 21.3190317389825),
+    ('motor', 'condutor_tratado', {'resistividade': 100, 'comprimento': 20.0, 'diametro': 0.01, 'profundidade': 0.6,
+                                   'diametro_tratamento': 0.3, 'resistividade_tratamento': 2.5}, 4.65631095031957),
+    ('simples', 'hastes_linha', {'resistividade': 100, 'n_hastes': 3, 'comprimento': 2.4, 'diametro': 0.016},
+     15.0373974119517),
+    ('simples', 'hastes_linha', {'resistividade': 100, 'n_hastes': 7, 'comprimento': 3.0, 'diametro': 0.016},
+     6.37526440183315),
+    ('simples', 'condutor_laurent', {'resistividade': 100, 'comprimento': 15.0, 'diametro': 0.01,
+                                     'profundidade': 0.6}, 13.7068381099811),
+    ('interface', 'dwight_sem_menos_um', {'resistividade': 100, 'comprimento': 3.0, 'diametro': 0.016},
+     35.1205791483173),
+]
+
+# Tabela "Testing Data" do README: (rótulo da linha, tipo, parâmetros); o valor publicado
+# é lido do próprio README, para que a documentação não divirja do motor sem aviso
+CAMINHO_README = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'README.md')
+LINHAS_README = [
+    ('Single Rod', 'haste_unica', {'resistividade': 100, 'comprimento': 3.0, 'diametro': 0.016}),
+    ('Multiple Rods', 'multiplas_hastes', {'resistividade': 100, 'n_hastes': 3, 'comprimento': 2.4,
+                                           'diametro': 0.016, 'espacamento': 2.4}),
+    ('Horizontal Conductor', 'condutor_horizontal', {'resistividade': 100, 'comprimento': 15.0, 'diametro': 0.01,
+                                                     'profundidade': 0.6}),
+    ('Grounding Grid', 'malha', {'resistividade': 100, 'area': 36.0, 'comprimento_total': 24.0,
+                                 'profundidade': 0.5}),
+]
+ERRO_MAXIMO_README = 0.005  # Ω: o README publica duas casas decimais
+
+# Limites de erro relativo aceitos
+ERRO_MAXIMO = 1e-12        # float × decimal, escalar × vetorizado, implementações com a mesma fórmula
+ERRO_MAXIMO_DIFERENCA = 1e-9  # diferença entre dois valores próximos perde algarismos
+ERRO_MAXIMO_INTERPOLACAO = 1e-3  # tabela de η interpolada × modelo de resistências mútuas
+ERRO_MAXIMO_MOMENTOS = 0.02  # método dos momentos × fórmula fechada de Dwight
+# Segmentos por eletrodo no método dos momentos; o fio fino pede segmentos de ao menos 4 raios
+SEGMENTOS_MOMENTOS = 24
+
+
+def _d(valor):
+    return Decimal(repr(float(valor)))
+
+
+def referencia_decimal(implementacao, tipo, p):
+    """Valor de referência em decimal de 40 dígitos (convertido para float)"""
+    rho = _d(p['resistividade'])
+    if tipo in ('haste_unica', 'hastes_linha', 'dwight_sem_menos_um'):
+        L, d = _d(p['comprimento']), _d(p['diametro'])
+        R = rho / (2 * PI * L) * ((4 * L / d).ln() - (0 if tipo == 'dwight_sem_menos_um' else 1))
+        if tipo == 'hastes_linha':
+            n = int(p['n_hastes'])
+            relacao = p['espacamento'] / p['comprimento'] if 'espacamento' in p else 1.0
+            # η do arranjo completo (Arranjo_Hastes), não do caminho usado por Calculo_Simples
+            R /= n * _d(Fator_Utilizacao._fator_exato(n, relacao, p['comprimento'] / p['diametro']))
+    elif tipo == 'haste_tratada':
+        L, d, D, rho_t = (_d(p[k]) for k in ('comprimento', 'diametro', 'diametro_tratamento',
+                                              'resistividade_tratamento'))
+        R = rho / (2 * PI * L) * ((4 * L / D).ln() - 1) + rho_t / (2 * PI * L) * (D / d).ln()
+    elif tipo == 'condutor_tratado':
+        L, d, h, D, rho_t = (_d(p[k]) for k in ('comprimento', 'diametro', 'profundidade', 'diametro_tratamento',
+                                                 'resistividade_tratamento'))
+        R = (rho / (2 * PI * L) * ((2 * L / D).ln() + (L / (2 * h)).ln() - 2 + 2 * h / L) +
+             rho_t / (2 * PI * L) * (D / d).ln())
+    elif tipo == 'multiplas_hastes':
+        n, L, d, s = (_d(p[k]) for k in ('n_hastes', 'comprimento', 'diametro', 'espacamento'))
+        R = rho / (2 * PI * n * L) * ((4 * L / d).ln() - 1 + 2 * (L / s) * (2 * n / PI).ln())
+    elif tipo == 'condutor_horizontal':
+        L, d, h = (_d(p[k]) for k in ('comprimento', 'diametro', 'profundidade'))
+        R = rho / (2 * PI * L) * ((2 * L / d).ln() + (L / (2 * h)).ln() - 2 + 2 * h / L)
+    elif tipo == 'condutor_laurent':
+        L, d, h = (_d(p[k]) for k in ('comprimento', 'diametro', 'profundidade'))
+        R = rho / (PI * L) * ((2 * L / (d * h).sqrt()).ln() + Decimal('0.5'))
+    elif tipo == 'malha':
+        A, Lt, h = (_d(p[k]) for k in ('area', 'comprimento_total', 'profundidade'))
+        R = rho * (1 / Lt + 1 / (20 * A).sqrt()) * (1 + 1 / (1 + h * (A / 10).sqrt()))
+    else:
+        raise ValueError(f"Sem referência para {tipo}")
+    return float(R)
+
+
+# Implementações do projeto, todas com a assinatura (tipo, parâmetros) -> R
+
+def _motor(tipo, p):
+    return calcular(tipo, float(p['resistividade']), **{k: float(v) for k, v in p.items() if k != 'resistividade'})
+
+
+# Tipos com método calcular_<tipo> na calculadora Tk
+TIPOS_GUI = ('haste_unica', 'multiplas_hastes', 'condutor_horizontal', 'malha')
+
+
+def _gui(tipo, p):
+    # Importado aqui: só a comparação com as interfaces carrega tkinter e matplotlib
+    from Calculo_Geral_Aterramento import CalculadoraAterramento
+    # Instância sem __init__: os métodos de cálculo não usam widgets nem janela
+    calculadora = CalculadoraAterramento.__new__(CalculadoraAterramento)
+    valores = {k: float(v) for k, v in p.items() if k != 'resistividade'}
+    return getattr(calculadora, f'calcular_{tipo}')(float(p['resistividade']), valores)['resistencia']
+
+
+def _simples(tipo, p):
+    rho = float(p['resistividade'])
+    if tipo == 'haste_unica':
+        return Calculo_Simples.resistencia_haste(rho, p['comprimento'], p['diametro'])
+    if tipo == 'hastes_linha':
+        return Calculo_Simples.resistencia_hastes_linha(rho, int(p['n_hastes']), p['comprimento'], p['diametro'],
+                                                        p.get('espacamento'))[0]
+    if tipo == 'condutor_laurent':
+        return Calculo_Simples.resistencia_condutor_laurent(rho, p['comprimento'], p['diametro'], p['profundidade'])
+    if tipo == 'malha':
+        return Calculo_Simples.resistencia_malha_schwarz(rho, p['area'], p['comprimento_total'], p['profundidade'])
+    raise ValueError(f"Calculo_Simples não implementa {tipo}")
+
+
+def _interface(tipo, p):
+    from Interface_Grafica import DemonstracaoAterramentoSeparada
+    demonstracao = DemonstracaoAterramentoSeparada.__new__(DemonstracaoAterramentoSeparada)
+    return demonstracao.formula_dwight(float(p['resistividade']), float(p['comprimento']), float(p['diametro']))
+
+
+IMPLEMENTACOES = {'motor': _motor, 'gui': _gui, 'simples': _simples, 'interface': _interface}
+
+
+def amostrar(tipo, n, gerador):
+    """Entradas aleatórias na faixa física usual de cada tipo (ρ log-uniforme de 10 a 10⁴ Ω·m)"""
+    amostras = {'resistividade': np.exp(gerador.uniform(math.log(10), math.log(1e4), n))}
+    if tipo in ('haste_unica', 'multiplas_hastes', 'hastes_linha', 'dwight_sem_menos_um', 'haste_tratada'):
+        amostras['comprimento'] = gerador.uniform(0.5, 12, n)
+        amostras['diametro'] = gerador.uniform(0.008, 0.05, n)
+    if tipo in ('multiplas_hastes', 'hastes_linha'):
+        amostras['n_hastes'] = gerador.integers(2, 21, n).astype(float)
+    if tipo == 'multiplas_hastes':
+        amostras['espacamento'] = gerador.uniform(1, 4, n) * amostras['comprimento']
+    if tipo in ('condutor_horizontal', 'condutor_laurent', 'condutor_tratado'):
+        amostras['comprimento'] = gerador.uniform(5, 200, n)
+        amostras['diametro'] = gerador.uniform(0.008, 0.05, n)
+        amostras['profundidade'] = gerador.uniform(0.3, 1.5, n)
+    if tipo == 'malha':
+        amostras['area'] = gerador.uniform(4, 10000, n)
+        amostras['comprimento_total'] = gerador.uniform(2, 8, n) * np.sqrt(amostras['area'])
+        amostras['profundidade'] = gerador.uniform(0.3, 1.5, n)
+    if tipo in ('haste_tratada', 'condutor_tratado'):
+        # Cilindro de tratamento de 2 a 30× o diâmetro (até 30 cm), ρ de 0,5 a 20 Ω·m (bentonita, compostos)
+        amostras['diametro_tratamento'] = np.minimum(amostras['diametro'] * gerador.uniform(2, 30, n), 0.3)
+        amostras['resistividade_tratamento'] = gerador.uniform(0.5, 20, n)
+    return amostras
+
+
+def _linhas(amostras):
+    nomes = list(amostras)
+    return [dict(zip(nomes, valores)) for valores in zip(*(amostras[nome].tolist() for nome in nomes))]
+
+
+def _segmento(p):
+    """Tamanho de segmento do método dos momentos para o eletrodo p"""
+    return max(p['comprimento'] / SEGMENTOS_MOMENTOS, 4 * p['diametro'])
+
+
+def _erro_relativo(obtido, esperado):
+    obtido, esperado = np.asarray(obtido, dtype=float), np.asarray(esperado, dtype=float)
+    return np.abs(obtido - esperado) / np.abs(esperado)
+
+
+def verificar_tabela():
+    verificacoes = []
+    for implementacao, tipo, parametros, esperado in TABELA_REFERENCIA:
+        nome = f"tabela: {implementacao}.{tipo} {parametros}"
+        erro_decimal = _erro_relativo(referencia_decimal(implementacao, tipo, parametros), esperado)
+        erro = max(float(erro_decimal), float(_erro_relativo(IMPLEMENTACOES[implementacao](tipo, parametros), esperado)))
+        verificacoes.append((nome, erro, ERRO_MAXIMO))
+    return verificacoes
+
+
+def verificar_aleatorio(n=100_000, n_decimal=2000, semente=0):
+    """
+    Propriedades sobre lotes aleatórios. Retorna (verificacoes, divergencias):
+    verificacoes = [(nome, erro máximo, limite)]; divergencias = [(nome, mediana, p95, máximo)]
+    das diferenças relativas entre implementações que usam fórmulas diferentes de propósito.
+    """
+    gerador = np.random.default_rng(semente)
+    verificacoes, divergencias = [], []
+
+    for tipo, (formula, nomes) in FORMULAS.items():
+        amostras = amostrar(tipo, n, gerador)
+        linhas = _linhas(amostras)
+        vetorizado = formula(amostras['resistividade'], *(amostras[nome] for nome in nomes))
+        escalar = np.array([_motor(tipo, p) for p in linhas])
+
+        verificacoes.append((f"{tipo}: vetorizado × escalar", _erro_relativo(vetorizado, escalar).max(), ERRO_MAXIMO))
+        verificacoes.append((f"{tipo}: R > 0 e finito", float(np.sum(~(np.isfinite(escalar) & (escalar > 0)))), 0.0))
+
+        referencia = [referencia_decimal('motor', tipo, p) for p in linhas[:n_decimal]]
+        verificacoes.append((f"{tipo}: motor × decimal", _erro_relativo(escalar[:n_decimal], referencia).max(),
+                             ERRO_MAXIMO))
+
+        # Com tratamento, R é homogênea em (ρ, ρ_t): as duas resistividades dobram juntas
+        dobro = formula(2 * amostras['resistividade'],
+                        *(2 * amostras[nome] if nome == 'resistividade_tratamento' else amostras[nome]
+                          for nome in nomes))
+        verificacoes.append((f"{tipo}: linear em ρ", _erro_relativo(dobro, 2 * vetorizado).max(), ERRO_MAXIMO))
+
+        parte = linhas[:min(n, 20_000)]
+        if tipo in TIPOS_GUI:
+            verificacoes.append((f"{tipo}: Calculo_Geral × motor",
+                                 _erro_relativo([_gui(tipo, p) for p in parte], escalar[:len(parte)]).max(),
+                                 ERRO_MAXIMO))
+
+        if tipo in ('haste_unica', 'malha'):
+            verificacoes.append((f"{tipo}: Calculo_Simples × motor",
+                                 _erro_relativo([_simples(tipo, p) for p in linhas], escalar).max(), ERRO_MAXIMO))
+
+    # Haste: R decresce com L e com d
+    amostras = amostrar('haste_unica', n, gerador)
+    R = FORMULAS['haste_unica'][0](amostras['resistividade'], amostras['comprimento'], amostras['diametro'])
+    R_L = FORMULAS['haste_unica'][0](amostras['resistividade'], amostras['comprimento'] * 1.01, amostras['diametro'])
+    R_d = FORMULAS['haste_unica'][0](amostras['resistividade'], amostras['comprimento'], amostras['diametro'] * 1.01)
+    verificacoes.append(("haste_unica: decresce com L e d", float(np.sum((R_L >= R) | (R_d >= R))), 0.0))
+
+    # Tratamento com ρ_t = ρ e D_t = d: o eletrodo sem tratamento
+    for tipo, base in (('haste_tratada', 'haste_unica'), ('condutor_tratado', 'condutor_horizontal')):
+        amostras = amostrar(tipo, n, gerador)
+        tratado = FORMULAS[tipo][0](amostras['resistividade'],
+                                    *(amostras['resistividade'] if nome == 'resistividade_tratamento' else amostras[nome]
+                                      for nome in FORMULAS[tipo][1]))
+        mesmo_diametro = dict(amostras, diametro_tratamento=amostras['diametro'])
+        tratado_d = FORMULAS[tipo][0](*(mesmo_diametro[nome] for nome in ('resistividade',) + FORMULAS[tipo][1]))
+        original = FORMULAS[base][0](*(amostras[nome] for nome in ('resistividade',) + FORMULAS[base][1]))
+        verificacoes.append((f"{tipo}: ρ_t = ρ ou D_t = d reproduz {base}",
+                             max(_erro_relativo(tratado, original).max(), _erro_relativo(tratado_d, original).max()),
+                             ERRO_MAXIMO))
+
+    # Calculo_Simples: fórmulas próprias conferidas com a referência decimal
+    for tipo in ('hastes_linha', 'condutor_laurent'):
+        linhas = _linhas(amostrar(tipo, n_decimal, gerador))
+        verificacoes.append((f"Calculo_Simples.{tipo} × decimal",
+                             _erro_relativo([_simples(tipo, p) for p in linhas],
+                                            [referencia_decimal('simples', tipo, p) for p in linhas]).max(),
+                             ERRO_MAXIMO))
+
+    # Fator_Utilizacao: tabela interpolada conferida com o modelo completo em pontos fora da grade
+    n_fator = gerador.integers(2, Fator_Utilizacao.N_MAXIMO + 1, 200)
+    relacao = np.exp(gerador.uniform(math.log(Fator_Utilizacao.RELACAO_MINIMA),
+                                     math.log(Fator_Utilizacao.RELACAO_MAXIMA), 200))
+    esbeltez = np.exp(gerador.uniform(math.log(Fator_Utilizacao.ESBELTEZ_MINIMA),
+                                      math.log(Fator_Utilizacao.ESBELTEZ_MAXIMA), 200))
+    exatos = [Fator_Utilizacao._fator_exato(int(k), r, e) for k, r, e in zip(n_fator, relacao, esbeltez)]
+    verificacoes.append(("Fator_Utilizacao: tabela × modelo completo",
+                         _erro_relativo(Fator_Utilizacao.interpolar_tabela(n_fator, relacao, esbeltez), exatos).max(),
+                         ERRO_MAXIMO_INTERPOLACAO))
+
+    # Interface_Grafica.formula_dwight omite o "-1": a diferença para o motor deve ser exatamente ρ/(2πL)
+    linhas = _linhas(amostrar('haste_unica', min(n, 20_000), gerador))
+    interface = np.array([_interface('haste_unica', p) for p in linhas])
+    motor = np.array([_motor('haste_unica', p) for p in linhas])
+    termo = np.array([p['resistividade'] / (2 * math.pi * p['comprimento']) for p in linhas])
+    verificacoes.append(("formula_dwight - motor = ρ/(2πL)", _erro_relativo(interface - motor, termo).max(),
+                         ERRO_MAXIMO_DIFERENCA))
+    divergencias.append(("formula_dwight (sem -1) × motor", _erro_relativo(interface, motor)))
+
+    # Metodo_Momentos usa a mesma convenção de raio (o diâmetro) que as fórmulas de Dwight
+    linhas = _linhas(amostrar('haste_unica', 20, gerador))
+    momentos = [Metodo_Momentos.resolver(Metodo_Momentos.discretizar_haste(0, 0, p['comprimento'], p['diametro'],
+                                                                            _segmento(p)),
+                                         p['resistividade'])['resistencia'] for p in linhas]
+    verificacoes.append(("Metodo_Momentos × motor (haste única)",
+                         _erro_relativo(momentos, [_motor('haste_unica', p) for p in linhas]).max(),
+                         ERRO_MAXIMO_MOMENTOS))
+
+    # Divergências de modelo, só relatadas
+    linhas = _linhas(amostrar('condutor_horizontal', 20, gerador))
+    momentos = [Metodo_Momentos.resolver(Metodo_Momentos.discretizar_condutor(
+                    (0, 0, p['profundidade']), (p['comprimento'], 0, p['profundidade']), p['diametro'],
+                    _segmento(p)), p['resistividade'])['resistencia'] for p in linhas]
+    divergencias.append(("Metodo_Momentos × Dwight (condutor horizontal)",
+                         _erro_relativo(momentos, [_motor('condutor_horizontal', p) for p in linhas])))
+
+    amostras = amostrar('condutor_horizontal', n, gerador)
+    dwight = FORMULAS['condutor_horizontal'][0](amostras['resistividade'], amostras['comprimento'],
+                                                 amostras['diametro'], amostras['profundidade'])
+    laurent = [_simples('condutor_laurent', p) for p in _linhas(amostras)]
+    divergencias.append(("Laurent (Calculo_Simples) × Dwight (motor)", _erro_relativo(laurent, dwight)))
+
+    amostras = amostrar('multiplas_hastes', n, gerador)
+    schwarz = FORMULAS['multiplas_hastes'][0](amostras['resistividade'], amostras['n_hastes'], amostras['comprimento'],
+                                              amostras['diametro'], amostras['espacamento'])
+    fator = [_simples('hastes_linha', p) for p in _linhas(amostras)]
+    divergencias.append(("Fator de utilização (Calculo_Simples) × Schwarz (motor)", _erro_relativo(fator, schwarz)))
+
+    divergencias = [(nome, float(np.median(d)), float(np.percentile(d, 95)), float(d.max()))
+                    for nome, d in divergencias]
+    return verificacoes, divergencias
+
+
+def ler_valores_readme(caminho=CAMINHO_README):
+    """Valores da tabela "Testing Data" do README (linhas rótulo⇥parâmetros⇥valor Ω): {rótulo: Ω}"""
+    valores = {}
+    with open(caminho, encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            colunas = linha.rstrip('\r\n').split('\t')
+            if len(colunas) == 3 and colunas[2].endswith('Ω'):
+                valores[colunas[0]] = float(colunas[2][:-1])
+    return valores
+
+
+def comparar_readme():
+    """Valores publicados no README × motor e × formula_dwight da interface"""
+    publicados = ler_valores_readme()
+    linhas = []
+    for rotulo, tipo, parametros in LINHAS_README:
+        publicado = publicados[rotulo]
+        motor = _motor(tipo, parametros)
+        interface = _interface(tipo, parametros) if tipo == 'haste_unica' else None
+        linhas.append((tipo, publicado, motor, interface))
+    return linhas
+
+
+def imprimir_relatorio(verificacoes, divergencias, readme):
+    print("=" * 90)
+    print("VALIDAÇÃO CONTRA VALORES DE REFERÊNCIA")
+    print("=" * 90)
+    for nome, erro, limite in verificacoes:
+        marca = "✅" if erro <= limite else "❌"
+        print(f"{marca} {nome[:66]:<66} {erro:>9.2e} ≤ {limite:.0e}")
+
+    print("\n--- DIVERGÊNCIAS ENTRE MODELOS (diferença relativa, informativo) ---")
+    print(f"{'':<58}{'mediana':>10}{'p95':>10}{'máximo':>10}")
+    for nome, mediana, p95, maximo in divergencias:
+        print(f"{nome:<58}{mediana:>10.1%}{p95:>10.1%}{maximo:>10.1%}")
+
+    print("\n--- TABELA DO README ---")
+    for tipo, publicado, motor, interface in readme:
+        linha = f"{tipo:<22} publicado {publicado:>7.2f} Ω | motor {motor:>7.2f} Ω"
+        if interface is not None:
+            linha += f" | formula_dwight {interface:>7.2f} Ω"
+        if abs(publicado - motor) > ERRO_MAXIMO_README:
+            linha += "  ⚠️  diverge do motor"
+        print(linha)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Confere motor vetorizado, Calculo_Geral, Calculo_Simples e Interface_Grafica "
+                    "contra uma tabela de referência e lotes aleatórios.")
+    parser.add_argument('--amostras', type=int, default=100_000,
+                        help="entradas aleatórias por tipo (padrão: 100000)")
+    parser.add_argument('--amostras-decimal', type=int, default=2000,
+                        help="entradas conferidas com a aritmética decimal (padrão: 2000)")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    verificacoes = verificar_tabela()
+    aleatorias, divergencias = verificar_aleatorio(args.amostras, args.amostras_decimal, args.semente)
+    verificacoes += aleatorias
+    readme = comparar_readme()
+    verificacoes += [(f"README: {tipo} publicado × motor (Ω)", abs(publicado - motor), ERRO_MAXIMO_README)
+                     for tipo, publicado, motor, _ in readme]
+
+    imprimir_relatorio(verificacoes, divergencias, readme)
+
+    falhas = [nome for nome, erro, limite in verificacoes if not erro <= limite]
+    if falhas:
+        print(f"\n❌ {len(falhas)} verificação(ões) fora do limite")
+        sys.exit(1)
+    print(f"\n✅ {len(verificacoes)} verificações dentro dos limites")
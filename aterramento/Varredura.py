@@ -0,0 +1,164 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+from Motor_Calculo import FORMULAS, LIMITES_NORMA
+
+
+def _indices_grade(indice_plano, forma):
+    """np.unravel_index que também aceita a grade sem eixos (um único ponto)"""
+    return np.unravel_index(indice_plano, forma) if forma else ()
+
+
+class ResultadoVarredura:
+    """Resultado de uma varredura: eixos nomeados, valores de R e estatísticas reduzidas"""
+
+    def __init__(self, tipo, eixos, fixos, resistencia, minimo, indice_minimo, maximo, n_atende, limite):
+        self.tipo = tipo
+        self.eixos = eixos
+        self.fixos = fixos
+        self.resistencia = resistencia
+        self.minimo = minimo
+        self.indice_minimo = indice_minimo
+        self.maximo = maximo
+        self.n_atende = n_atende
+        self.limite = limite
+
+    @property
+    def forma(self):
+        return tuple(len(valores) for valores in self.eixos.values())
+
+    @property
+    def total(self):
+        return int(np.prod(self.forma, dtype=np.int64))
+
+    def ponto(self, indice_plano):
+        """Parâmetros (eixos e fixos) do ponto de índice plano informado"""
+        indices = _indices_grade(indice_plano, self.forma)
+        parametros = dict(self.fixos)
+        for (nome, valores), i in zip(self.eixos.items(), indices):
+            parametros[nome] = float(valores[i])
+        return parametros
+
+    @property
+    def ponto_minimo(self):
+        """Parâmetros do menor R válido; None se nenhum ponto da grade for válido"""
+        return None if self.indice_minimo is None else self.ponto(self.indice_minimo)
+
+    def selecionar(self, **indices):
+        """Fatia de R com alguns eixos fixados pelo índice, ex.: selecionar(diametro=0)"""
+        if self.resistencia is None:
+            raise ValueError("Varredura executada com armazenar=False")
+        fatia = tuple(indices.pop(nome, slice(None)) for nome in self.eixos)
+        if indices:
+            raise ValueError(f"Eixos inexistentes: {', '.join(indices)}")
+        return self.resistencia[fatia]
+
+    def __repr__(self):
+        eixos = ", ".join(f"{nome}[{len(valores)}]" for nome, valores in self.eixos.items())
+        return (f"ResultadoVarredura({self.tipo}: {eixos}; min={self.minimo:.4g} Ω, "
+                f"{self.n_atende}/{self.total} ≤ {self.limite} Ω)")
+
+
+def _avaliar_bloco(tipo, eixos, fixos, inicio, fim, limite, armazenar):
+    """Avalia os pontos [inicio, fim) da grade. Executado nos processos do pool."""
+    formula, nomes = FORMULAS[tipo]
+    forma = tuple(len(valores) for valores in eixos.values())
+    indices = _indices_grade(np.arange(inicio, fim), forma)
+
+    parametros = dict(fixos)
+    for (nome, valores), idx in zip(eixos.items(), indices):
+        parametros[nome] = valores[idx]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        R = formula(parametros['resistividade'], *(parametros[nome] for nome in nomes))
+    R = np.broadcast_to(R, (fim - inicio,))
+
+    validos = np.where(np.isfinite(R) & (R > 0), R, np.nan)
+    if np.all(np.isnan(validos)):
+        minimo, indice, maximo = np.inf, None, -np.inf
+    else:
+        posicao = int(np.nanargmin(validos))
+        minimo, indice, maximo = float(validos[posicao]), inicio + posicao, float(np.nanmax(validos))
+    n_atende = int(np.count_nonzero(validos <= limite))
+
+    return inicio, (R if armazenar else None), minimo, indice, maximo, n_atende
+
+
+def varrer(tipo, processos=None, tamanho_bloco=1_000_000, armazenar=True, limite=LIMITES_NORMA[-1],
+           dtype=np.float64, **parametros):
+    """
+    Varre a grade N-dimensional formada pelos parâmetros passados como sequência.
+
+    Parâmetros escalares ficam fixos; sequências viram eixos da grade, na ordem em que
+    foram passados (sem nenhuma sequência, a grade tem um único ponto). A grade é dividida em blocos distribuídos num pool de processos e
+    reduzida (mínimo, máximo, pontos que atendem ao limite) à medida que os blocos chegam.
+    Com armazenar=False só as estatísticas são mantidas, para grades que não cabem na memória.
+    Sem nenhum ponto válido (R finito e positivo), minimo e maximo são NaN e indice_minimo é None.
+
+    Ex.: varrer('haste_unica', resistividade=np.linspace(10, 1000, 500),
+                comprimento=np.linspace(1, 6, 200), diametro=[0.0127, 0.0159, 0.019])
+    """
+    if tipo not in FORMULAS:
+        raise ValueError(f"Tipo de eletrodo desconhecido: {tipo}")
+
+    _, nomes = FORMULAS[tipo]
+    aceitos = ('resistividade',) + nomes
+    desconhecidos = [nome for nome in parametros if nome not in aceitos]
+    faltando = [nome for nome in aceitos if nome not in parametros]
+    if desconhecidos:
+        raise ValueError(f"Parâmetros não usados por {tipo}: {', '.join(desconhecidos)}")
+    if faltando:
+        raise ValueError(f"Parâmetros ausentes para {tipo}: {', '.join(faltando)}")
+
+    eixos, fixos = {}, {}
+    for nome, valor in parametros.items():
+        if np.ndim(valor) == 0:
+            fixos[nome] = float(valor)
+        else:
+            eixos[nome] = np.asarray(valor, dtype=float).ravel()
+            if len(eixos[nome]) == 0:
+                raise ValueError(f"Eixo sem valores: {nome}")
+
+    forma = tuple(len(valores) for valores in eixos.values())
+    total = int(np.prod(forma, dtype=np.int64))
+    blocos = [(inicio, min(inicio + tamanho_bloco, total)) for inicio in range(0, total, tamanho_bloco)]
+
+    resistencia = np.empty(total, dtype=dtype) if armazenar else None
+    minimo, indice_minimo, maximo, n_atende = np.inf, None, -np.inf, 0
+
+    def reduzir(parcial):
+        nonlocal minimo, indice_minimo, maximo, n_atende
+        inicio, R, bloco_min, bloco_idx, bloco_max, bloco_atende = parcial
+        if R is not None:
+            resistencia[inicio:inicio + len(R)] = R
+        if bloco_min < minimo:
+            minimo, indice_minimo = bloco_min, bloco_idx
+        maximo = max(maximo, bloco_max)
+        n_atende += bloco_atende
+
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or len(blocos) == 1:
+        for inicio, fim in blocos:
+            reduzir(_avaliar_bloco(tipo, eixos, fixos, inicio, fim, limite, armazenar))
+    else:
+        # Mantém no máximo 2 blocos por processo em andamento para limitar a memória
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            pendentes = set()
+            fila = iter(blocos)
+            for inicio, fim in fila:
+                pendentes.add(pool.submit(_avaliar_bloco, tipo, eixos, fixos, inicio, fim, limite, armazenar))
+                if len(pendentes) >= 2 * processos:
+                    prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        reduzir(futuro.result())
+            for futuro in pendentes:
+                reduzir(futuro.result())
+
+    if resistencia is not None:
+        resistencia = resistencia.reshape(forma)
+    if indice_minimo is None:
+        minimo = maximo = float('nan')
+
+    return ResultadoVarredura(tipo, eixos, fixos, resistencia, minimo, indice_minimo, maximo, n_atende, limite)
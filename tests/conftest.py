@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Os módulos de aterramento/ são importados pelo nome, como nos próprios scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'aterramento'))
+os.environ.setdefault('MPLBACKEND', 'Agg')
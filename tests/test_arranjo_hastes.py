@@ -0,0 +1,57 @@
+import math
+
+import numpy as np
+import pytest
+
+from Arranjo_Hastes import (arranjo_anel, arranjo_grade, arranjo_linha, arranjo_quadrado, arranjo_triangulo,
+                            matriz_resistencias, resistencia_arranjo, resistencia_mutua)
+from Motor_Calculo import resistencia_haste_unica
+
+
+def test_formas_dos_arranjos():
+    assert arranjo_linha(4, 3.0).tolist() == [[0, 0], [3, 0], [6, 0], [9, 0]]
+    assert len(arranjo_triangulo(5.0)) == 3
+    assert len(arranjo_quadrado(5.0, hastes_por_lado=3)) == 8
+    assert arranjo_grade(3, 2, 2.0, 4.0).shape == (6, 2)
+    assert np.allclose(np.hypot(*arranjo_anel(7, 5.0).T), 5.0)
+
+
+def test_mutua_tende_a_fonte_pontual():
+    assert resistencia_mutua(1000.0, 2.4, 2.4) == pytest.approx(1 / (2 * math.pi * 1000.0), rel=1e-5)
+    assert resistencia_mutua(3.0, 2.4, 3.6) == pytest.approx(resistencia_mutua(3.0, 3.6, 2.4))
+    assert resistencia_mutua(1.0, 2.4, 2.4) > resistencia_mutua(3.0, 2.4, 2.4)
+
+
+def test_haste_isolada_e_hastes_distantes():
+    R1 = resistencia_haste_unica(100.0, 2.4, 0.016)
+    assert resistencia_arranjo(100.0, [(0, 0)], 2.4, 0.016)['resistencia'] == pytest.approx(R1)
+    distantes = resistencia_arranjo(100.0, arranjo_linha(4, 1e5), 2.4, 0.016)
+    assert distantes['resistencia'] == pytest.approx(R1 / 4, rel=1e-4)
+    assert distantes['fator_utilizacao'] == pytest.approx(1.0, rel=1e-4)
+
+
+def test_simetria_e_fator_de_utilizacao():
+    matriz = matriz_resistencias(arranjo_quadrado(6.0, 3), 2.4, 0.016)
+    assert np.allclose(matriz, matriz.T)
+    resultado = resistencia_arranjo(100.0, arranjo_anel(8, 4.0), 2.4, 0.016)
+    assert np.allclose(resultado['correntes'], 1 / 8)
+    assert 0 < resultado['fator_utilizacao'] < 1
+
+
+def test_aproximado_proximo_do_direto():
+    posicoes = arranjo_grade(25, 25, 3.0)
+    direto = resistencia_arranjo(100.0, posicoes, 2.4, 0.016, metodo='direto')
+    aproximado = resistencia_arranjo(100.0, posicoes, 2.4, 0.016, metodo='aproximado', tolerancia=1e-10)
+    assert aproximado['resistencia'] == pytest.approx(direto['resistencia'], rel=3e-3)
+    assert aproximado['pares_proximos'] < direto['pares_proximos']
+
+
+def test_erros():
+    with pytest.raises(ValueError):
+        resistencia_arranjo(100.0, [(0, 0), (0.01, 0)], 2.4, 0.016)
+    with pytest.raises(ValueError):
+        resistencia_arranjo(100.0, [(0, 0)], -2.4, 0.016)
+    with pytest.raises(ValueError):
+        resistencia_arranjo(100.0, [(0, 0, 0)], 2.4, 0.016)
+    with pytest.raises(ValueError):
+        resistencia_arranjo(100.0, [(0, 0)], 2.4, 0.016, metodo='lu')
@@ -0,0 +1,41 @@
+import pytest
+
+import Benchmark_Desempenho
+import Benchmark_Inicializacao
+from Benchmark_Desempenho import comparar
+from Motor_Calculo import FORMULAS
+
+
+def _resultado(**valores):
+    return {'metricas': {nome: {'valor': valor, 'unidade': '', 'melhor': melhor}
+                         for nome, (valor, melhor) in valores.items()}}
+
+
+def test_comparar_considera_o_sentido_da_metrica():
+    base = _resultado(latencia=(100.0, 'menor'), vazao=(1e6, 'maior'), so_base=(1.0, 'menor'))
+    atual = _resultado(latencia=(150.0, 'menor'), vazao=(2e6, 'maior'), nova=(1.0, 'menor'))
+    comparacoes = {nome: piora for nome, _, _, piora in comparar(atual, base)}
+    assert comparacoes == {'latencia': pytest.approx(0.5), 'vazao': pytest.approx(-0.5)}
+
+
+def test_latencia_e_vazao_cobrem_todas_as_formulas():
+    latencia = Benchmark_Desempenho.medir_latencia(repeticoes=1)
+    assert set(latencia) == {f'latencia.{tipo}' for tipo in FORMULAS}
+    vazao = Benchmark_Desempenho.medir_vazao([1000], repeticoes=1)
+    assert set(vazao) == {f'vazao.{tipo}.1e+03' for tipo in FORMULAS}
+    assert all(m['valor'] > 0 for m in list(latencia.values()) + list(vazao.values()))
+
+
+def test_ler_importtime():
+    saida = ("import time: self [us] | cumulative | imported package\n"
+             "import time:       120 |        120 |   _io\n"
+             "import time:      3000 |       5000 | numpy\n"
+             "import time:        50 |         50 |     numpy.version\n")
+    assert Benchmark_Inicializacao.ler_importtime(saida) == {
+        '_io': (120, 120, 1), 'numpy': (3000, 5000, 0), 'numpy.version': (50, 50, 2)}
+
+
+@pytest.mark.parametrize('modulo', ['Motor_Calculo', 'Cache_Calculo', 'Calculo_Simples'])
+def test_pontos_de_entrada_leves_nao_importam_numpy(modulo):
+    resultado = Benchmark_Inicializacao.medir_inicializacao(f'import {modulo}', repeticoes=1)
+    assert 'numpy' not in resultado['dependencias_pesadas']
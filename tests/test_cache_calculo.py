@@ -0,0 +1,68 @@
+import pytest
+
+from Cache_Calculo import CacheLRU
+
+
+def test_obter_calcula_uma_vez():
+    cache = CacheLRU(4)
+    chamadas = []
+
+    def calcular():
+        chamadas.append(1)
+        return 42.0
+
+    assert cache.obter('curva', {'rho': 100.0}, calcular) == 42.0
+    assert cache.obter('curva', {'rho': 100.0}, calcular) == 42.0
+    assert len(chamadas) == 1
+    estatisticas = cache.estatisticas()
+    assert (estatisticas['acertos'], estatisticas['falhas'], estatisticas['tamanho']) == (1, 1, 1)
+
+
+def test_chave_ignora_ordem_e_tipo_numerico():
+    assert CacheLRU.chave('f', {'a': 1, 'b': 2.0}) == CacheLRU.chave('f', {'b': 2, 'a': 1.0})
+    assert CacheLRU.chave('f', {'a': 1.0}) != CacheLRU.chave('g', {'a': 1.0})
+
+
+def test_descarta_o_menos_usado():
+    cache = CacheLRU(2)
+    cache.armazenar('f', {'x': 1}, 'um')
+    cache.armazenar('f', {'x': 2}, 'dois')
+    assert cache.consultar('f', {'x': 1}) == (True, 'um')
+    cache.armazenar('f', {'x': 3}, 'tres')
+    assert cache.consultar('f', {'x': 2}) == (False, None)
+    assert cache.consultar('f', {'x': 1}) == (True, 'um')
+    assert len(cache) == 2
+
+
+def test_tamanho_zero_nao_guarda():
+    cache = CacheLRU(0)
+    cache.armazenar('f', {'x': 1}, 'um')
+    assert len(cache) == 0
+
+
+def test_redimensionar_e_limpar():
+    cache = CacheLRU(3)
+    for x in range(3):
+        cache.armazenar('f', {'x': x}, x)
+    cache.redimensionar(1)
+    assert cache.consultar('f', {'x': 2}) == (True, 2)
+    assert len(cache) == 1
+    cache.limpar()
+    assert len(cache) == 0 and cache.estatisticas()['acertos'] == 0
+    with pytest.raises(ValueError):
+        cache.redimensionar(-1)
+    with pytest.raises(ValueError):
+        CacheLRU(-1)
+
+
+def test_calculo_unico_nao_passa_pelo_cache():
+    Calculo_Geral_Aterramento = pytest.importorskip('Calculo_Geral_Aterramento')
+    from Cache_Calculo import cache_global
+    from Motor_Calculo import calcular
+
+    calculadora = Calculo_Geral_Aterramento.CalculadoraAterramento.__new__(
+        Calculo_Geral_Aterramento.CalculadoraAterramento)
+    antes = len(cache_global)
+    resultado = calculadora.calcular_haste_unica(100.0, {'comprimento': 2.4, 'diametro': 0.016})
+    assert resultado['resistencia'] == calcular('haste_unica', 100.0, comprimento=2.4, diametro=0.016)
+    assert len(cache_global) == antes
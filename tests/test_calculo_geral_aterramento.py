@@ -0,0 +1,158 @@
+import pytest
+
+import Calculo_Geral_Aterramento
+from Calculo_Geral_Aterramento import ATRASO_RECALCULO_MS, CalculadoraAterramento
+from Motor_Calculo import calcular
+
+
+class RaizFalsa:
+    """Substitui o Tk: root.after guarda os callbacks com o atraso pedido"""
+
+    def __init__(self):
+        self.agendados = {}
+        self._proximo = 0
+
+    def after(self, intervalo_ms, callback):
+        self._proximo += 1
+        self.agendados[self._proximo] = (intervalo_ms, callback)
+        return self._proximo
+
+    def after_cancel(self, identificador):
+        self.agendados.pop(identificador, None)
+
+    def processar(self):
+        while self.agendados:
+            _, callback = self.agendados.pop(min(self.agendados))
+            callback()
+
+
+class Variavel:
+    """StringVar/BooleanVar e Entry: só get/set"""
+
+    def __init__(self, valor=""):
+        self.valor = valor
+
+    def get(self):
+        return self.valor
+
+    def set(self, valor):
+        self.valor = valor
+
+
+class WidgetFalso:
+    def __init__(self, **opcoes):
+        self.opcoes = opcoes
+        self.gerenciador = ""
+        self.configuracoes = 0
+
+    def pack(self, **_):
+        self.gerenciador = "pack"
+
+    def pack_forget(self):
+        self.gerenciador = ""
+
+    def winfo_manager(self):
+        return self.gerenciador
+
+    def cget(self, opcao):
+        return self.opcoes.get(opcao, "")
+
+    def configure(self, **opcoes):
+        self.opcoes.update(opcoes)
+        self.configuracoes += 1
+
+
+@pytest.fixture
+def calculadora(monkeypatch):
+    # Instância sem __init__ (sem janela): só o estado usado pelo recálculo ao vivo e pelo resultado
+    calc = CalculadoraAterramento.__new__(CalculadoraAterramento)
+    calc.root = RaizFalsa()
+    calc.recalculo_ao_vivo = Variavel(True)
+    calc.recalculo_agendado = None
+    calc.opcao_var = Variavel("1")
+    calc.resistividade_var = Variavel("100")
+    calc.campos_haste_unica = {'comprimento': Variavel("2.4"), 'diametro': Variavel("0.016")}
+    calc.campos_multiplas_hastes = calc.campos_condutor_horizontal = calc.campos_malha = {}
+
+    for nome in ('frame_resultado', 'label_formula', 'label_resistividade', 'frame_sugestoes',
+                 'separator_observacao'):
+        setattr(calc, nome, WidgetFalso())
+    calc.label_status = WidgetFalso(foreground='')
+    for nome in ('texto_configuracao', 'texto_resistividade', 'texto_resistencia', 'texto_status',
+                 'texto_sugestoes'):
+        setattr(calc, nome, Variavel())
+
+    # Nenhum widget pode ser criado depois da interface montada
+    def proibido(*args, **kwargs):
+        raise AssertionError("widget recriado durante o recálculo")
+    for classe in ('Label', 'Frame', 'Separator', 'LabelFrame'):
+        monkeypatch.setattr(Calculo_Geral_Aterramento.ttk, classe, proibido)
+    monkeypatch.setattr(Calculo_Geral_Aterramento.tk, 'StringVar', proibido)
+    return calc
+
+
+def _digitar(calc, campo, texto):
+    """Cada tecla muda a variável e dispara o trace, como no Tk"""
+    for i in range(1, len(texto) + 1):
+        campo.set(texto[:i])
+        calc.agendar_recalculo()
+
+
+def test_digitacao_seguida_recalcula_uma_vez(calculadora, monkeypatch):
+    resultados = []
+    original = calculadora.mostrar_resultado
+    monkeypatch.setattr(calculadora, 'mostrar_resultado',
+                        lambda resultado, rho: (resultados.append(resultado['resistencia']), original(resultado, rho)))
+
+    _digitar(calculadora, calculadora.resistividade_var, "250")
+    _digitar(calculadora, calculadora.campos_haste_unica['comprimento'], "3.0")
+    assert [atraso for atraso, _ in calculadora.root.agendados.values()] == [ATRASO_RECALCULO_MS]
+    assert resultados == []
+
+    calculadora.root.processar()
+    esperado = calcular('haste_unica', 250.0, comprimento=3.0, diametro=0.016)
+    assert resultados == [pytest.approx(esperado)]
+    assert calculadora.texto_resistencia.get() == f"{esperado:.2f} Ω"
+    assert calculadora.recalculo_agendado is None
+
+
+def test_desligar_o_modo_ao_vivo_cancela_o_pendente(calculadora):
+    _digitar(calculadora, calculadora.resistividade_var, "300")
+    calculadora.recalculo_ao_vivo.set(False)
+    calculadora.agendar_recalculo()
+    assert calculadora.root.agendados == {}
+    assert calculadora.recalculo_agendado is None
+    assert calculadora.texto_resistencia.get() == ""
+
+
+def test_resultado_atualizado_no_lugar(calculadora):
+    widgets = {nome: getattr(calculadora, nome) for nome in ('frame_resultado', 'label_status', 'frame_sugestoes')}
+
+    _digitar(calculadora, calculadora.resistividade_var, "1000")
+    calculadora.root.processar()
+    assert calculadora.frame_resultado.winfo_manager() == "pack"
+    assert calculadora.frame_sugestoes.winfo_manager() == "pack"
+    status, sugestoes = calculadora.texto_status.get(), calculadora.texto_sugestoes.get()
+    assert sugestoes
+
+    calculadora.resistividade_var.set("10")
+    calculadora.agendar_recalculo()
+    calculadora.root.processar()
+    assert {nome: getattr(calculadora, nome) for nome in widgets} == widgets
+    assert calculadora.texto_status.get() != status
+    assert calculadora.frame_sugestoes.winfo_manager() == ""
+
+    # Mesma cor de status: o label não é reconfigurado
+    configuracoes = calculadora.label_status.configuracoes
+    calculadora.resistividade_var.set("11")
+    calculadora.agendar_recalculo()
+    calculadora.root.processar()
+    assert calculadora.label_status.configuracoes == configuracoes
+
+
+def test_entrada_incompleta_e_ignorada(calculadora):
+    calculadora.campos_haste_unica['diametro'].set("0.")
+    calculadora.campos_haste_unica['diametro'].set("")
+    calculadora.agendar_recalculo()
+    calculadora.root.processar()
+    assert calculadora.frame_resultado.winfo_manager() == ""
@@ -0,0 +1,84 @@
+import csv
+
+import pytest
+
+import Calculo_Lote
+from Calculo_Lote import COLUNAS_SAIDA, normalizar_tipo, processar_arquivo, processar_bloco
+from Motor_Calculo import CLASSIFICACOES, calcular
+
+HASTE = {'tipo': '1', 'resistividade': '100', 'comprimento': '2.4', 'diametro': '0.016'}
+MALHA = {'tipo': 'malha', 'resistividade': '100', 'area': '36', 'comprimento_total': '24', 'profundidade': '0.5'}
+
+
+def test_normalizar_tipo():
+    assert normalizar_tipo(' 4 ') == 'malha'
+    assert normalizar_tipo('haste_tratada') == 'haste_tratada'
+    assert normalizar_tipo(None) == ''
+
+
+def test_processar_bloco():
+    linhas = [HASTE, MALHA, dict(HASTE, diametro='x'), {'tipo': '9', 'resistividade': '100'}]
+    (R, classificacao, sugestoes, erro), malha, invalido, desconhecido = processar_bloco(linhas)
+    assert R == pytest.approx(calcular('haste_unica', 100.0, comprimento=2.4, diametro=0.016))
+    assert classificacao == CLASSIFICACOES[-1]
+    assert sugestoes and not erro
+    assert malha[0] == pytest.approx(11.94, abs=0.005)
+    assert invalido == (None, "", "", "Valores inválidos")
+    assert desconhecido[3] == "Tipo de eletrodo desconhecido: 9"
+
+
+def test_caminho_vetorizado_igual_ao_escalar():
+    linhas = [dict(HASTE, resistividade=str(10 + i)) for i in range(Calculo_Lote.LIMITE_GRUPO_ESCALAR + 1)]
+    vetorizado = processar_bloco(linhas)
+    escalar = processar_bloco(linhas[:1]) + processar_bloco(linhas[1:Calculo_Lote.LIMITE_GRUPO_ESCALAR + 1])
+    assert [r[0] for r in vetorizado] == pytest.approx([r[0] for r in escalar], rel=1e-14)
+    assert [r[1:] for r in vetorizado] == [r[1:] for r in escalar]
+
+
+def test_processar_arquivo_em_blocos(tmp_path):
+    entrada, saida = tmp_path / 'entrada.csv', tmp_path / 'saida.csv'
+    colunas = ['id', 'tipo', 'resistividade', 'comprimento', 'diametro', 'area', 'comprimento_total',
+               'profundidade']
+    linhas = [dict(HASTE, id='a'), dict(MALHA, id='b'), dict(HASTE, id='c', resistividade='5'),
+              dict(HASTE, id='d', tipo='x')]
+    with open(entrada, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, colunas)
+        escritor.writeheader()
+        escritor.writerows(linhas)
+
+    resumo = processar_arquivo(entrada, saida, tamanho_bloco=3)
+    assert resumo == {'registros': 4, 'atendem': 1, 'nao_atendem': 2, 'erros': 1}
+
+    with open(saida, newline='', encoding='utf-8') as arquivo:
+        saidas = list(csv.DictReader(arquivo))
+    assert [linha['id'] for linha in saidas] == ['a', 'b', 'c', 'd']
+    assert float(saidas[1]['resistencia']) == pytest.approx(11.94, abs=0.005)
+    assert saidas[3]['erro'] and saidas[3]['resistencia'] == ''
+
+
+def test_csv_so_com_cabecalho_gera_saida(tmp_path):
+    entrada, saida = tmp_path / 'entrada.csv', tmp_path / 'saida.csv'
+    entrada.write_text('id,tipo,resistividade\n', encoding='utf-8')
+    resumo = processar_arquivo(entrada, saida)
+    assert resumo['registros'] == 0
+    assert saida.read_text(encoding='utf-8').splitlines() == ['id,tipo,resistividade,' + ','.join(COLUNAS_SAIDA)]
+
+
+def test_tamanho_bloco_invalido(tmp_path):
+    entrada = tmp_path / 'entrada.csv'
+    entrada.write_text('tipo,resistividade\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        processar_arquivo(entrada, tmp_path / 'saida.csv', tamanho_bloco=0)
+
+
+def test_saida_parquet(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    entrada, saida = tmp_path / 'entrada.csv', tmp_path / 'saida.parquet'
+    with open(entrada, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, list(HASTE))
+        escritor.writeheader()
+        escritor.writerow(HASTE)
+    processar_arquivo(entrada, saida, formato='parquet')
+    tabela = pq.read_table(saida).to_pydict()
+    assert tabela['resistencia'] == [pytest.approx(calcular('haste_unica', 100.0, comprimento=2.4,
+                                                            diametro=0.016))]
@@ -0,0 +1,42 @@
+import math
+
+import numpy as np
+import pytest
+
+from Motor_Calculo import (resistencia_condutor_horizontal, resistencia_condutor_tratado, resistencia_haste_tratada,
+                           resistencia_haste_unica)
+
+
+def test_rho_do_tratamento_igual_ao_solo_volta_ao_eletrodo_nu():
+    assert resistencia_haste_tratada(100.0, 2.4, 0.016, 0.2, 100.0) == pytest.approx(
+        resistencia_haste_unica(100.0, 2.4, 0.016))
+    assert resistencia_condutor_tratado(100.0, 20.0, 0.01, 0.6, 0.3, 100.0) == pytest.approx(
+        resistencia_condutor_horizontal(100.0, 20.0, 0.01, 0.6))
+
+
+def test_diametro_do_tratamento_igual_ao_do_eletrodo():
+    assert resistencia_haste_tratada(100.0, 2.4, 0.016, 0.016, 2.5) == pytest.approx(
+        resistencia_haste_unica(100.0, 2.4, 0.016))
+
+
+def test_tratamento_reduz_e_satura():
+    nua = resistencia_haste_unica(300.0, 2.4, 0.016)
+    tratadas = [resistencia_haste_tratada(300.0, 2.4, 0.016, D, 2.5) for D in (0.05, 0.15, 0.3)]
+    assert nua > tratadas[0] > tratadas[1] > tratadas[2]
+    # O limite é a haste com o diâmetro do tratamento num solo de ρ: a camada só soma ρ_t·ln(D_t/d)
+    assert tratadas[2] - resistencia_haste_unica(300.0, 2.4, 0.3) == pytest.approx(
+        2.5 / (2 * math.pi * 2.4) * math.log(0.3 / 0.016))
+
+
+def test_diametro_menor_que_o_eletrodo_e_invalido():
+    assert math.isnan(resistencia_haste_tratada(100.0, 2.4, 0.016, 0.01, 2.5))
+    assert math.isnan(resistencia_condutor_tratado(100.0, 20.0, 0.01, 0.6, 0.005, 2.5))
+    vetor = resistencia_haste_tratada(100.0, 2.4, 0.016, np.array([0.01, 0.15]), 2.5)
+    assert math.isnan(vetor[0]) and np.isfinite(vetor[1])
+
+
+def test_afim_em_rho():
+    # R = ρ·g + c: a parcela do tratamento não depende da resistividade do solo
+    R = [resistencia_condutor_tratado(rho, 20.0, 0.01, 0.6, 0.3, 2.5) for rho in (0.0, 100.0, 200.0)]
+    assert R[0] > 0
+    assert R[2] - R[1] == pytest.approx(R[1] - R[0])
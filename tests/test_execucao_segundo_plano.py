@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from Execucao_Segundo_Plano import ExecutorTarefas, TarefaCancelada
+
+
+class RaizFalsa:
+    """Substitui o Tk: root.after guarda os callbacks, que o teste roda na thread principal"""
+
+    def __init__(self):
+        self.agendados = {}
+        self._proximo = 0
+
+    def after(self, _intervalo_ms, callback):
+        self._proximo += 1
+        self.agendados[self._proximo] = callback
+        return self._proximo
+
+    def after_cancel(self, identificador):
+        self.agendados.pop(identificador, None)
+
+    def processar(self, tempo_maximo=5.0):
+        limite = time.monotonic() + tempo_maximo
+        while self.agendados and time.monotonic() < limite:
+            identificador = min(self.agendados)
+            self.agendados.pop(identificador)()
+            time.sleep(0.001)
+
+
+@pytest.fixture
+def executor():
+    raiz = RaizFalsa()
+    executor = ExecutorTarefas(raiz, intervalo_ms=1)
+    yield raiz, executor
+    executor.encerrar()
+
+
+def test_resultado_e_progresso_na_thread_principal(executor):
+    raiz, executor = executor
+    principal = threading.get_ident()
+    eventos = []
+
+    def calcular(tarefa, x):
+        tarefa.informar_progresso(0.5, "metade")
+        return 2 * x
+
+    executor.executar(calcular, 21,
+                      ao_concluir=lambda r: eventos.append(('fim', r, threading.get_ident())),
+                      ao_progresso=lambda f, m: eventos.append(('progresso', (f, m), threading.get_ident())))
+    assert executor.ocupado
+    raiz.processar()
+    assert [(tipo, valor) for tipo, valor, _ in eventos] == [('progresso', (0.5, "metade")), ('fim', 42)]
+    assert all(thread == principal for _, _, thread in eventos)
+    assert not executor.ocupado
+
+
+def test_erro_entregue_ao_callback(executor):
+    raiz, executor = executor
+    erros = []
+
+    def falhar(tarefa):
+        raise ValueError("Valores inválidos")
+
+    executor.executar(falhar, ao_concluir=lambda r: pytest.fail("não deveria concluir"), ao_erro=erros.append)
+    raiz.processar()
+    assert len(erros) == 1 and isinstance(erros[0], ValueError)
+
+
+def test_cancelamento_cooperativo(executor):
+    raiz, executor = executor
+    liberar = threading.Event()
+    chamadas = []
+
+    def longa(tarefa):
+        liberar.wait(5)
+        tarefa.verificar()
+        return 1
+
+    tarefa = executor.executar(longa, ao_concluir=chamadas.append, ao_erro=chamadas.append)
+    tarefa.cancelar()
+    liberar.set()
+    raiz.processar()
+    assert tarefa.cancelada
+    assert chamadas == []
+    with pytest.raises(TarefaCancelada):
+        tarefa.verificar()
+
+
+def test_encerrar_cancela_pendentes():
+    raiz = RaizFalsa()
+    executor = ExecutorTarefas(raiz, intervalo_ms=1)
+    liberar = threading.Event()
+    tarefa = executor.executar(lambda t: liberar.wait(5))
+    executor.encerrar()
+    liberar.set()
+    assert tarefa.cancelada
+    assert raiz.agendados == {}
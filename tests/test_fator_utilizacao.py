@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import Calculo_Simples
+from Arranjo_Hastes import arranjo_linha, resistencia_arranjo
+from Fator_Utilizacao import fator_utilizacao, interpolar_tabela
+
+
+def _arranjo(n, relacao, esbeltez):
+    return resistencia_arranjo(1.0, arranjo_linha(n, relacao * 2.4), 2.4, 2.4 / esbeltez)['fator_utilizacao']
+
+
+@pytest.mark.parametrize('esbeltez', [20, 79, 150, 236, 472, 1500])
+@pytest.mark.parametrize('n, relacao', [(2, 0.5), (4, 1.0), (10, 1.0), (25, 2.0), (60, 0.3)])
+def test_modelo_direto_igual_ao_arranjo(n, relacao, esbeltez):
+    assert fator_utilizacao(n, relacao, esbeltez) == pytest.approx(_arranjo(n, relacao, esbeltez), rel=1e-9)
+
+
+def test_tabela_acompanha_a_esbeltez():
+    gerador = np.random.default_rng(3)
+    n = gerador.integers(2, 101, 60)
+    relacao = np.exp(gerador.uniform(np.log(0.25), np.log(20), 60))
+    esbeltez = np.exp(gerador.uniform(np.log(12), np.log(1800), 60))
+    exatos = [_arranjo(int(k), r, e) for k, r, e in zip(n, relacao, esbeltez)]
+    np.testing.assert_allclose(interpolar_tabela(n, relacao, esbeltez), exatos, rtol=1e-3)
+
+
+def test_esbeltez_muda_o_fator():
+    eta = fator_utilizacao(10, 1.0, [79, 236, 472])
+    np.testing.assert_allclose(eta, [0.582, 0.631, 0.656], atol=1e-3)
+
+
+def test_fora_da_tabela_e_invalidos():
+    assert fator_utilizacao(1, 1.0) == pytest.approx(1.0)
+    assert np.isnan(fator_utilizacao(0, 1.0))
+    assert np.isnan(fator_utilizacao(3, -1.0))
+    eta = interpolar_tabela([150, 5], [1.0, 40.0], [150, 150])
+    np.testing.assert_allclose(eta, [_arranjo(150, 1.0, 150), _arranjo(5, 40.0, 150)], rtol=1e-9)
+
+
+def test_calculo_simples_usa_a_esbeltez_da_haste():
+    R, R_uma, eta = Calculo_Simples.resistencia_hastes_linha(100, 7, 3.0, 0.016, 3.0)
+    assert eta == pytest.approx(_arranjo(7, 1.0, 3.0 / 0.016), rel=1e-9)
+    assert R == pytest.approx(R_uma / (7 * eta))
+
+
+def test_calculo_simples_nao_importa_numpy():
+    diretorio = os.path.dirname(Calculo_Simples.__file__)
+    saida = subprocess.run([sys.executable, '-c', "import sys, Calculo_Simples; print('numpy' in sys.modules)"],
+                           cwd=diretorio, capture_output=True, text=True, check=True).stdout
+    assert saida.strip() == 'False'
@@ -0,0 +1,94 @@
+import json
+import math
+
+import pytest
+
+import Instrumentacao
+from Instrumentacao import _ler_ambiente, etapa
+
+
+@pytest.fixture
+def instrumentacao_ligada():
+    Instrumentacao.limpar()
+    Instrumentacao.ativar()
+    yield
+    Instrumentacao.desativar()
+    Instrumentacao.limpar()
+
+
+@pytest.mark.parametrize('valor', ['1', 'true', 'TRUE', ' yes ', 'on', 'sim'])
+def test_valores_ligado(valor):
+    assert _ler_ambiente({'ATERRAMENTO_PERFIL': valor}) == (True, None)
+
+
+@pytest.mark.parametrize('valor', ['', '0', 'false', 'no', 'off', 'nao', 'não'])
+def test_valores_desligado(valor):
+    assert _ler_ambiente({'ATERRAMENTO_PERFIL': valor}) == (False, None)
+
+
+def test_sem_variavel_fica_desligado():
+    assert _ler_ambiente({}) == (False, None)
+
+
+def test_valor_desconhecido_avisa_e_nao_vira_caminho():
+    with pytest.warns(RuntimeWarning):
+        assert _ler_ambiente({'ATERRAMENTO_PERFIL': 'trace.json'}) == (False, None)
+
+
+def test_caminho_do_trace_em_variavel_propria():
+    assert _ler_ambiente({'ATERRAMENTO_PERFIL_TRACE': 'trace.json'}) == (True, 'trace.json')
+    assert _ler_ambiente({'ATERRAMENTO_PERFIL': '1', 'ATERRAMENTO_PERFIL_TRACE': ' '}) == (True, None)
+
+
+def test_etapa_desligada_nao_registra():
+    Instrumentacao.desativar()
+    Instrumentacao.limpar()
+    with etapa('teste'):
+        pass
+    assert Instrumentacao.resumo() == {}
+
+
+def test_etapa_contexto_e_decorador(instrumentacao_ligada):
+    @etapa('decorada')
+    def dobro(x):
+        return 2 * x
+
+    with etapa('bloco'):
+        assert dobro(3) == 6
+    assert dobro(4) == 8
+
+    resumo = Instrumentacao.resumo()
+    assert resumo['decorada']['chamadas'] == 2
+    assert resumo['bloco']['chamadas'] == 1
+    assert resumo['bloco']['total_ms'] >= resumo['decorada']['maximo_ms']
+
+
+def test_exportar_chrome(instrumentacao_ligada, tmp_path):
+    with etapa('formula', tipo='malha'):
+        pass
+    caminho = tmp_path / 'trace.json'
+    Instrumentacao.exportar_chrome(caminho)
+    eventos = json.loads(caminho.read_text(encoding='utf-8'))['traceEvents']
+    assert [(e['name'], e['ph'], e['args']) for e in eventos] == [('formula', 'X', {'tipo': 'malha'})]
+
+
+def test_classificacao_da_interface_segue_o_motor():
+    Calculo_Geral_Aterramento = pytest.importorskip('Calculo_Geral_Aterramento')
+    from Motor_Calculo import CLASSIFICACOES, classificar_norma
+
+    classificar = Calculo_Geral_Aterramento.CalculadoraAterramento.classificar
+    for resistencia in (0.5, 1.0, 1.0 + 1e-12, 5.0, 7.0, 10.0, 10.5, math.inf, math.nan):
+        texto, _ = classificar(None, resistencia)
+        assert texto.endswith(CLASSIFICACOES[classificar_norma(resistencia)])
+
+
+def test_ativar_registra_a_saida_uma_vez(monkeypatch):
+    registrados = []
+    monkeypatch.setattr(Instrumentacao.atexit, 'register', registrados.append)
+    monkeypatch.setattr(Instrumentacao, '_saida_registrada', False)
+    try:
+        Instrumentacao.ativar()
+        Instrumentacao.ativar()
+    finally:
+        Instrumentacao.desativar()
+    assert registrados == [Instrumentacao._ao_sair]
@@ -0,0 +1,132 @@
+import matplotlib.pyplot as plt
+import pytest
+
+from Interface_Grafica import AtualizacaoBlit, DemonstracaoAterramentoSeparada, GerenciadorGraficos
+
+# Os emojis dos títulos não existem na fonte padrão do matplotlib
+pytestmark = pytest.mark.filterwarnings('ignore:Glyph')
+
+
+@pytest.fixture
+def graficos():
+    gerenciador = GerenciadorGraficos(maximo_figuras=2)
+    yield gerenciador
+    gerenciador.fechar_todos()
+    plt.close('all')
+
+
+def _grafico(criados):
+    def criar():
+        figura, ax = plt.subplots()
+        linha, = ax.plot([0, 1], [0, 0])
+        criados.append(figura)
+        return figura, linha
+    return criar
+
+
+def _atualizar(valor):
+    return lambda linha: linha.set_ydata([valor, valor])
+
+
+def test_janela_reaproveitada_entre_cliques(graficos):
+    criados = []
+    primeira = graficos.mostrar('comprimento', _grafico(criados), _atualizar(1.0))
+    segunda = graficos.mostrar('comprimento', _grafico(criados), _atualizar(2.0))
+    assert primeira is segunda
+    assert len(criados) == 1
+    assert list(graficos.figuras['comprimento'][1].get_ydata()) == [2.0, 2.0]
+
+
+def test_janela_fechada_e_recriada(graficos):
+    criados = []
+    figura = graficos.mostrar('diametro', _grafico(criados), _atualizar(1.0))
+    plt.close(figura)
+    nova = graficos.mostrar('diametro', _grafico(criados), _atualizar(1.0))
+    assert nova is not figura
+    assert len(criados) == 2
+
+
+def test_limite_de_janelas_fecha_a_mais_antiga(graficos):
+    criados = []
+    antiga = graficos.mostrar('a', _grafico(criados), _atualizar(0.0))
+    graficos.mostrar('b', _grafico(criados), _atualizar(0.0))
+    graficos.mostrar('a', _grafico(criados), _atualizar(0.0))
+    graficos.mostrar('c', _grafico(criados), _atualizar(0.0))
+    assert list(graficos.figuras) == ['a', 'c']
+    assert plt.fignum_exists(antiga.number)
+    graficos.fechar_todos()
+    assert graficos.figuras == {}
+    assert not plt.fignum_exists(antiga.number)
+
+
+class TemporizadorFalso:
+    def __init__(self):
+        self.inicios = 0
+
+    def start(self):
+        self.inicios += 1
+
+
+@pytest.fixture
+def demonstracao(monkeypatch):
+    demo = DemonstracaoAterramentoSeparada()
+    demo.redesenhos = []
+    monkeypatch.setattr(demo, 'atualizar_informacoes', lambda: demo.redesenhos.append(demo.rho))
+    monkeypatch.setattr(demo, 'atualizar_visualizacao_principal', lambda: None)
+    yield demo
+    demo.graficos.fechar_todos()
+    plt.close('all')
+
+
+def test_rajada_de_sliders_vira_um_redesenho(demonstracao):
+    demonstracao.temporizador = TemporizadorFalso()
+    demonstracao.agrupar_atualizacoes = True
+    for rho in (200, 300, 400):
+        demonstracao.slider_rho.set_val(rho)
+    assert demonstracao.temporizador.inicios == 1
+    assert demonstracao.redesenhos == []
+
+    demonstracao.aplicar_atualizacao()  # disparo do temporizador
+    assert demonstracao.redesenhos == [400]
+    demonstracao.slider_rho.set_val(500)
+    assert demonstracao.temporizador.inicios == 2
+
+
+def test_sem_laco_de_eventos_atualiza_na_hora(demonstracao):
+    assert not demonstracao.agrupar_atualizacoes  # Agg
+    demonstracao.slider_rho.set_val(200)
+    demonstracao.slider_rho.set_val(300)
+    assert demonstracao.redesenhos == [200, 300]
+
+
+def _blit(monkeypatch):
+    figura, ax = plt.subplots()
+    blit = AtualizacaoBlit(figura)
+    blit.adicionar(ax.plot([0, 1], [0, 1])[0])
+    chamadas = []
+    monkeypatch.setattr(figura.canvas, 'draw_idle', lambda: chamadas.append('draw_idle'))
+    monkeypatch.setattr(figura.canvas, 'blit', lambda bbox=None: chamadas.append('blit'))
+    return figura, blit, chamadas
+
+
+def test_blit_redesenha_so_os_artistas(monkeypatch):
+    figura, blit, chamadas = _blit(monkeypatch)
+    figura.canvas.draw()
+    assert blit.fundo is not None
+    blit.atualizar()
+    blit.atualizar()
+    assert chamadas == ['blit', 'blit']
+    plt.close(figura)
+
+
+def test_blit_sem_fundo_redesenha_a_figura(monkeypatch):
+    figura, blit, chamadas = _blit(monkeypatch)
+    blit.atualizar()  # antes do primeiro desenho completo
+    assert chamadas == ['draw_idle']
+
+    monkeypatch.setattr(figura.canvas, 'supports_blit', False, raising=False)
+    figura.canvas.draw()
+    assert blit.fundo is None
+    blit.atualizar()
+    assert chamadas == ['draw_idle', 'draw_idle']
+    plt.close(figura)
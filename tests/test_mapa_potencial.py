@@ -0,0 +1,48 @@
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import CloseEvent
+
+import Mapa_Potencial
+from Mapa_Potencial import MapaPotencial
+from Metodo_Momentos import discretizar_haste
+
+
+@pytest.fixture
+def geometria():
+    return discretizar_haste(0.0, 0.0, 2.4, 0.016)
+
+
+def test_processos_e_serial_iguais(geometria):
+    Mapa_Potencial.cache_tiles.limpar()
+    with MapaPotencial(geometria, 100, corrente=10, processos=2) as mapa:
+        x, y, V = mapa.calcular(-15, 15, -15, 15, 0.2)
+        pool = mapa._pool
+        assert pool is not None
+        Mapa_Potencial.cache_tiles.limpar()
+        mapa.calcular(-40, 0, -15, 15, 0.2)
+        assert mapa._pool is pool
+    assert mapa._pool is None
+
+    Mapa_Potencial.cache_tiles.limpar()
+    _, _, serial = MapaPotencial(geometria, 100, corrente=10, processos=1).calcular(-15, 15, -15, 15, 0.2)
+    np.testing.assert_allclose(V, serial, rtol=1e-12)
+    # O potencial cai com a distância à haste
+    centro = V[np.argmin(np.abs(y)), :]
+    assert centro[np.argmin(np.abs(x))] > centro[0] > 0
+
+
+def test_redesenho_reaproveita_barra_de_cores(geometria):
+    mapa = MapaPotencial(geometria, 100, processos=2)
+    figura, ax = plt.subplots()
+    for deslocamento in (0, 5, 10):
+        mapa.plotar(ax, -10 + deslocamento, 10 + deslocamento, -10, 10, resolucao=0.2)
+    assert len(figura.axes) == 2  # eixo + uma única barra de cores
+    assert len(ax.collections) == 1
+
+    CloseEvent('close_event', figura.canvas)._process()
+    assert mapa._pool is None
+    plt.close(figura)
@@ -0,0 +1,137 @@
+import math
+
+import numpy as np
+import pytest
+
+from Medicao_Wenner import (inverter_duas_camadas, inverter_uniforme, ler_sondagens, resistencia_com_modelo,
+                            resistividade_aparente_schlumberger, resistividade_aparente_wenner,
+                            schlumberger_duas_camadas, wenner_duas_camadas)
+from Motor_Calculo import calcular
+
+ESPACAMENTOS = np.geomspace(0.5, 64.0, 12)
+
+
+def _modelo(rho1, rho2, espessura):
+    return rho1, (rho2 - rho1) / (rho2 + rho1), espessura
+
+
+def test_resistividade_aparente():
+    assert resistividade_aparente_wenner(2.0, 10.0) == pytest.approx(2 * math.pi * 2.0 * 10.0)
+    assert resistividade_aparente_schlumberger(10.0, 1.0, 2.0) == pytest.approx(math.pi * 99 / 2 * 2.0)
+
+
+def test_duas_camadas_tende_as_resistividades_das_camadas():
+    rho1, K, H = _modelo(100.0, 400.0, 2.0)
+    raso, profundo = wenner_duas_camadas([1e-3, 1e5], rho1, K, H)
+    assert raso == pytest.approx(100.0, rel=1e-6)
+    assert profundo == pytest.approx(400.0, rel=1e-3)
+
+
+def test_k_nulo_e_solo_uniforme():
+    assert np.allclose(wenner_duas_camadas(ESPACAMENTOS, 250.0, 0.0, 3.0), 250.0)
+
+
+def test_inversao_uniforme():
+    leituras = np.array([200.0, 180.0, np.nan, 220.0])
+    modelo = inverter_uniforme(leituras)
+    assert modelo['resistividade'] == pytest.approx(math.exp(np.mean(np.log([200.0, 180.0, 220.0]))))
+    assert inverter_uniforme(np.full(5, 150.0))['erro_rms'] == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize('rho1, rho2, espessura', [(100.0, 400.0, 3.0), (500.0, 80.0, 1.5), (50.0, 150.0, 8.0)])
+def test_inversao_duas_camadas_recupera_o_modelo(rho1, rho2, espessura):
+    leituras = wenner_duas_camadas(ESPACAMENTOS, *_modelo(rho1, rho2, espessura))
+    modelo = inverter_duas_camadas(ESPACAMENTOS, leituras)
+    assert modelo['rho1'] == pytest.approx(rho1, rel=1e-3)
+    assert modelo['rho2'] == pytest.approx(rho2, rel=1e-3)
+    assert modelo['espessura'] == pytest.approx(espessura, rel=1e-3)
+    assert modelo['erro_rms'] < 1e-4
+
+
+def test_inversao_em_lote_com_leitura_ausente():
+    modelos = [_modelo(100.0, 400.0, 3.0), _modelo(500.0, 80.0, 1.5)]
+    leituras = np.array([wenner_duas_camadas(ESPACAMENTOS, *m) for m in modelos])
+    leituras[1, 4] = np.nan
+    resultado = inverter_duas_camadas(ESPACAMENTOS, leituras)
+    assert resultado['rho1'] == pytest.approx([100.0, 500.0], rel=1e-3)
+    assert resultado['rho2'] == pytest.approx([400.0, 80.0], rel=1e-3)
+    assert resultado['espessura'] == pytest.approx([3.0, 1.5], rel=1e-3)
+
+
+def test_schlumberger_com_geometria_de_wenner():
+    rho1, K, H = _modelo(100.0, 400.0, 3.0)
+    assert np.allclose(schlumberger_duas_camadas(1.5 * ESPACAMENTOS, 0.5 * ESPACAMENTOS, rho1, K, H),
+                       wenner_duas_camadas(ESPACAMENTOS, rho1, K, H))
+
+
+def test_inversao_schlumberger():
+    meia_corrente = np.geomspace(1.5, 150.0, 15)
+    leituras = schlumberger_duas_camadas(meia_corrente, 0.5, *_modelo(500.0, 80.0, 2.0))
+    modelo = inverter_duas_camadas(meia_corrente, leituras, arranjo='schlumberger', meia_distancia_potencial=0.5)
+    assert modelo['rho1'] == pytest.approx(500.0, rel=1e-3)
+    assert modelo['rho2'] == pytest.approx(80.0, rel=1e-3)
+    assert modelo['espessura'] == pytest.approx(2.0, rel=1e-3)
+    with pytest.raises(ValueError):
+        inverter_duas_camadas(meia_corrente, leituras, arranjo='schlumberger')
+    with pytest.raises(ValueError):
+        inverter_duas_camadas(meia_corrente, leituras, arranjo='schlumberger', meia_distancia_potencial=2.0)
+
+
+def test_inversao_com_espacamentos_por_sondagem():
+    espacamentos = np.array([[1.0, 2.0, 4.0, 8.0, 16.0, 32.0],
+                             [0.5, 1.5, 3.0, 6.0, 12.0, np.nan]])
+    modelos = [_modelo(100.0, 400.0, 3.0), _modelo(500.0, 80.0, 1.5)]
+    leituras = np.array([wenner_duas_camadas(a, *m) for a, m in zip(espacamentos, modelos)])
+    resultado = inverter_duas_camadas(espacamentos, leituras)
+    assert resultado['rho1'] == pytest.approx([100.0, 500.0], rel=1e-3)
+    assert resultado['rho2'] == pytest.approx([400.0, 80.0], rel=1e-3)
+    assert resultado['espessura'] == pytest.approx([3.0, 1.5], rel=1e-3)
+
+
+def test_ler_sondagens(tmp_path):
+    rho1, K, H = _modelo(100.0, 400.0, 3.0)
+    linhas = ["sondagem,espacamento,resistencia"]
+    for sondagem, espacamentos in (("S2", ESPACAMENTOS[:8]), ("S1", ESPACAMENTOS[::-1])):
+        for a, rho in zip(espacamentos, wenner_duas_camadas(espacamentos, rho1, K, H)):
+            linhas.append(f"{sondagem},{float(a)!r},{float(rho / (2 * math.pi * a))!r}")
+    caminho = tmp_path / "campo.csv"
+    caminho.write_text("\n".join(linhas) + "\n")
+
+    dados = ler_sondagens(caminho)
+    assert dados['sondagens'] == ["S2", "S1"]
+    assert dados['arranjo'] == 'wenner'
+    assert dados['espacamentos'].shape == (2, len(ESPACAMENTOS))
+    assert np.isnan(dados['rho_aparente'][0, 8:]).all()
+    resultado = inverter_duas_camadas(dados['espacamentos'], dados['rho_aparente'])
+    assert resultado['rho2'] == pytest.approx([400.0, 400.0], rel=1e-3)
+
+
+def test_ler_sondagens_schlumberger(tmp_path):
+    caminho = tmp_path / "campo.csv"
+    caminho.write_text("arranjo,espacamento,meia_distancia_potencial,resistencia\n"
+                       "schlumberger,10,1,2\n"
+                       "schlumberger,20,1,x\n")
+    with pytest.raises(ValueError):
+        ler_sondagens(caminho)
+    caminho.write_text("arranjo,espacamento,meia_distancia_potencial,resistencia\n"
+                       "schlumberger,10,1,2\n")
+    dados = ler_sondagens(caminho)
+    assert dados['rho_aparente'][0, 0] == pytest.approx(math.pi * 99 / 2 * 2.0)
+    assert dados['meia_distancia_potencial'][0, 0] == 1.0
+
+
+def test_inversao_rejeita_dados_insuficientes():
+    with pytest.raises(ValueError):
+        inverter_duas_camadas(ESPACAMENTOS[:2], [100.0, 120.0])
+    with pytest.raises(ValueError):
+        inverter_duas_camadas(ESPACAMENTOS, np.ones(5))
+
+
+def test_resistencia_com_modelo():
+    assert resistencia_com_modelo({'resistividade': 100.0}, 'haste_unica', comprimento=2.4, diametro=0.016) == \
+        calcular('haste_unica', 100.0, comprimento=2.4, diametro=0.016)
+    uniforme = {'rho1': 100.0, 'rho2': 100.0, 'espessura': 3.0}
+    assert resistencia_com_modelo(uniforme, 'haste_unica', comprimento=2.4, diametro=0.016) == pytest.approx(
+        calcular('haste_unica', 100.0, comprimento=2.4, diametro=0.016), rel=1e-6)
+    with pytest.raises(ValueError):
+        resistencia_com_modelo(uniforme, 'condutor_horizontal', comprimento=10.0, diametro=0.01, profundidade=0.5)
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+import Metodo_Momentos
+from Arranjo_Hastes import resistencia_arranjo
+from Metodo_Momentos import (Geometria, discretizar_condutor, discretizar_haste, discretizar_malha, gradiente_conjugado,
+                             montar_matriz, resolver)
+from Motor_Calculo import resistencia_haste_unica
+
+
+def test_haste_unica_igual_ao_motor():
+    # Mesma convenção de raio das fórmulas de Dwight do Motor_Calculo (o diâmetro no ln)
+    motor = resistencia_haste_unica(100.0, 2.4, 0.016)
+    for tamanho_segmento in (0.3, 0.1):
+        resultado = resolver(discretizar_haste(0, 0, 2.4, 0.016, tamanho_segmento), 100.0)
+        assert resultado['resistencia'] == pytest.approx(motor, rel=0.01)
+
+
+def test_haste_igual_ao_arranjo_de_hastes():
+    resultado = resolver(discretizar_haste(0, 0, 3.0, 0.016, 0.25), 100.0)
+    assert resultado['resistencia'] == pytest.approx(
+        resistencia_arranjo(100.0, [(0, 0)], 3.0, 0.016)['resistencia'], rel=0.01)
+
+
+def test_correntes_somam_um_e_sao_simetricas():
+    geometria = discretizar_haste(0, 0, 3.0, 0.016, 0.5) + discretizar_haste(4.0, 0, 3.0, 0.016, 0.5)
+    resultado = resolver(geometria, 100.0)
+    correntes = resultado['correntes']
+    assert correntes.sum() == pytest.approx(1.0)
+    assert np.allclose(correntes[:6], correntes[6:])
+    # A corrente se concentra na ponta inferior da haste
+    assert correntes[5] > correntes[2]
+
+
+def test_hastes_proximas_valem_mais_que_a_metade():
+    haste = discretizar_haste(0, 0, 3.0, 0.016)
+    sozinha = resolver(haste, 100.0)['resistencia']
+    par = resolver(haste + discretizar_haste(3.0, 0, 3.0, 0.016), 100.0)['resistencia']
+    longe = resolver(haste + discretizar_haste(3000.0, 0, 3.0, 0.016), 100.0)['resistencia']
+    assert sozinha / 2 < par < sozinha
+    assert longe == pytest.approx(sozinha / 2, rel=1e-3)
+
+
+def test_direto_igual_a_gradiente_conjugado():
+    geometria = discretizar_malha(20, 20, 5, 5, 0.5, 0.01, hastes='cantos')
+    direto = resolver(geometria, 100.0, 'direto')
+    iterativo = resolver(geometria, 100.0, 'gradiente_conjugado', tolerancia=1e-12)
+    assert iterativo['resistencia'] == pytest.approx(direto['resistencia'], rel=1e-9)
+    assert np.allclose(iterativo['correntes'], direto['correntes'], atol=1e-10)
+    assert iterativo['iteracoes'] < len(geometria)
+
+
+def test_linear_em_rho_e_matriz_em_cache():
+    geometria = discretizar_condutor((0, 0, 0.5), (20, 0, 0.5), 0.01)
+    um = resolver(geometria, 1.0)['resistencia']
+    assert resolver(geometria, 250.0)['resistencia'] == pytest.approx(250.0 * um)
+    assert Metodo_Momentos._matriz_em_cache(geometria) is Metodo_Momentos._matriz_em_cache(geometria)
+
+
+def test_matriz_simetrica_definida_positiva():
+    matriz = montar_matriz(discretizar_malha(10, 10, 3, 3, 0.6, 0.01))
+    assert np.allclose(matriz, matriz.T)
+    assert np.all(np.linalg.eigvalsh(matriz) > 0)
+
+
+def test_gradiente_conjugado():
+    gerador = np.random.default_rng(0)
+    base = gerador.normal(size=(30, 30))
+    matriz = base @ base.T + 30 * np.eye(30)
+    b = gerador.normal(size=30)
+    x, _ = gradiente_conjugado(matriz, b, 1e-12)
+    assert np.allclose(matriz @ x, b)
+
+
+def test_erros():
+    with pytest.raises(ValueError):
+        Geometria([[0, 0, -1]], [[0, 0, 1]], 0.01)
+    with pytest.raises(ValueError):
+        Geometria([[0, 0]], [[0, 1]], 0.01)
+    with pytest.raises(ValueError):
+        resolver(discretizar_haste(0, 0, 2.4, 0.016), 100.0, metodo='lu')
@@ -0,0 +1,67 @@
+import math
+
+import numpy as np
+import pytest
+
+from Monte_Carlo import HistogramaLog, amostrar, simular
+from Motor_Calculo import calcular
+
+HASTE = {'comprimento': 2.4, 'diametro': 0.016}
+R_UNITARIA = calcular('haste_unica', 1.0, **HASTE)
+
+
+def test_amostrar():
+    gerador = np.random.default_rng(0)
+    assert np.all(amostrar(3.0, 5, gerador) == 3.0)
+    valores = amostrar(('tolerancia', 10.0, 0.1), 10_000, gerador)
+    assert valores.min() >= 9.0 and valores.max() <= 11.0
+    with pytest.raises(ValueError):
+        amostrar(('weibull', 1.0, 2.0), 10, gerador)
+
+
+def test_histograma_log_percentis():
+    valores = np.random.default_rng(1).lognormal(2.0, 1.0, 200_000)
+    histograma = HistogramaLog()
+    histograma.adicionar(valores[:50_000])
+    histograma.adicionar(valores[50_000:])
+    for p in (1, 5, 50, 95, 99):
+        assert histograma.percentil(p) == pytest.approx(np.percentile(valores, p), rel=3e-3)
+
+
+def test_resistividade_lognormal_tem_percentis_analiticos():
+    # R é proporcional a ρ: com ρ lognormal, ln R é normal com a mesma dispersão
+    mediana, sigma, limite = 100.0, 0.5, 45.0
+    resultado = simular('haste_unica', dict(HASTE, resistividade=('lognormal', mediana, sigma)),
+                        n_amostras=400_000, tamanho_lote=100_000, limite=limite, semente=0)
+    R50 = mediana * R_UNITARIA
+    assert resultado['amostras'] == 400_000 and resultado['amostras_invalidas'] == 0
+    assert resultado['percentis'][50] == pytest.approx(R50, rel=5e-3)
+    assert resultado['percentis'][95] == pytest.approx(R50 * math.exp(1.6448536 * sigma), rel=1e-2)
+    assert resultado['media'] == pytest.approx(R50 * math.exp(sigma ** 2 / 2), rel=5e-3)
+    acima = 0.5 * math.erfc(math.log(limite / R50) / (sigma * math.sqrt(2)))
+    assert resultado['probabilidade_acima_limite'] == pytest.approx(acima, abs=3e-3)
+
+
+def test_parametros_fixos_e_semente():
+    resultado = simular('haste_unica', dict(HASTE, resistividade=100.0), n_amostras=1000, semente=0)
+    assert resultado['minimo'] == resultado['maximo'] == pytest.approx(100.0 * R_UNITARIA)
+    assert resultado['desvio'] == pytest.approx(0.0, abs=1e-9 * resultado['media'])
+
+    parametros = dict(HASTE, resistividade=('uniforme', 50.0, 150.0))
+    assert simular('haste_unica', parametros, 5000, semente=3) == simular('haste_unica', parametros, 5000, semente=3)
+
+
+def test_amostras_invalidas_sao_descartadas():
+    parametros = dict(HASTE, resistividade=100.0, diametro=('normal', 0.016, 0.02))
+    resultado = simular('haste_unica', parametros, n_amostras=10_000, semente=0)
+    assert resultado['amostras_invalidas'] > 0
+    assert resultado['amostras'] + resultado['amostras_invalidas'] == 10_000
+
+
+def test_erros():
+    with pytest.raises(ValueError):
+        simular('desconhecido', {}, 10)
+    with pytest.raises(ValueError):
+        simular('haste_unica', {'resistividade': 100.0}, 10)
+    with pytest.raises(ValueError):
+        simular('haste_unica', dict(HASTE, resistividade=-1.0), 10)
@@ -0,0 +1,69 @@
+import math
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import Motor_Calculo
+from Motor_Calculo import CLASSIFICACOES, FORMULAS, LIMITES_NORMA, calcular, classificar_norma
+
+GEOMETRIAS = {
+    'haste_unica': {'comprimento': 2.4, 'diametro': 0.016},
+    'multiplas_hastes': {'n_hastes': 4, 'comprimento': 2.4, 'diametro': 0.016, 'espacamento': 3.0},
+    'condutor_horizontal': {'comprimento': 20.0, 'diametro': 0.01, 'profundidade': 0.5},
+    'malha': {'area': 100.0, 'comprimento_total': 80.0, 'profundidade': 0.5},
+    'haste_tratada': {'comprimento': 2.4, 'diametro': 0.016, 'diametro_tratamento': 0.15,
+                      'resistividade_tratamento': 2.5},
+    'condutor_tratado': {'comprimento': 20.0, 'diametro': 0.01, 'profundidade': 0.6, 'diametro_tratamento': 0.3,
+                         'resistividade_tratamento': 2.5},
+}
+
+
+def test_todos_os_tipos_tem_geometria_de_teste():
+    assert set(GEOMETRIAS) == set(FORMULAS)
+
+
+@pytest.mark.parametrize('tipo', sorted(GEOMETRIAS))
+def test_escalar_igual_ao_vetorizado(tipo):
+    formula, nomes = FORMULAS[tipo]
+    resistividades = [20.0, 100.0, 1000.0]
+    escalar = [formula(rho, *(GEOMETRIAS[tipo][nome] for nome in nomes)) for rho in resistividades]
+    vetorizado = formula(np.array(resistividades), *(GEOMETRIAS[tipo][nome] for nome in nomes))
+    assert all(isinstance(valor, float) for valor in escalar)
+    np.testing.assert_allclose(vetorizado, escalar, rtol=1e-14)
+
+
+def test_valores_do_readme():
+    assert calcular('haste_unica', 100, comprimento=3.0, diametro=0.016) == pytest.approx(29.82, abs=0.005)
+    assert calcular('malha', 100, area=36, comprimento_total=24, profundidade=0.5) == pytest.approx(11.94, abs=0.005)
+
+
+def test_dominio_invalido_vira_nan():
+    assert math.isnan(calcular('haste_unica', 100, comprimento=2.4, diametro=-0.016))
+    with np.errstate(invalid='ignore'):
+        assert np.isnan(calcular('haste_unica', np.array([100.0]), comprimento=2.4, diametro=-0.016)).all()
+
+
+@pytest.mark.parametrize('resistencia', [0.0, 0.5, 1.0, 1.0001, 4.99, 5.0, 7.5, 10.0, 10.01, 1e6,
+                                         math.inf, math.nan, -1.0])
+def test_classificacao_escalar_igual_a_vetorizada(resistencia):
+    escalar = classificar_norma(resistencia)
+    vetorizado = classificar_norma([resistencia])
+    assert escalar == int(vetorizado[0])
+    assert 0 <= escalar < len(CLASSIFICACOES)
+
+
+def test_classificacao_nos_limites():
+    assert [classificar_norma(r) for r in LIMITES_NORMA] == [0, 1, 2]
+    assert classificar_norma(math.nan) == len(LIMITES_NORMA)
+    np.testing.assert_array_equal(classificar_norma(np.array([0.5, 3.0, 8.0, 12.0, np.nan])), [0, 1, 2, 3, 3])
+
+
+def test_caminho_escalar_nao_importa_numpy():
+    codigo = ("import sys, Motor_Calculo; Motor_Calculo.calcular('haste_unica', 100, comprimento=2.4, "
+              "diametro=0.016); Motor_Calculo.classificar_norma(5.0); print('numpy' in sys.modules)")
+    saida = subprocess.run([sys.executable, '-c', codigo], cwd=os.path.dirname(Motor_Calculo.__file__),
+                           capture_output=True, text=True, check=True).stdout
+    assert saida.strip() == 'False'
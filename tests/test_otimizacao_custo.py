@@ -0,0 +1,62 @@
+import math
+
+import numpy as np
+import pytest
+
+from Motor_Calculo import resistencia_malha
+from Otimizacao_Custo import (CATALOGO_PADRAO, _candidatos_hastes, custo_hastes, otimizar_hastes, otimizar_lote,
+                              otimizar_malha, otimizar_projeto)
+from Projeto_Inverso import n_hastes_minimo
+
+
+def _forca_bruta_hastes(resistividade, alvo, catalogo=CATALOGO_PADRAO):
+    melhor = math.inf
+    for comprimento, nome_diametro, preco, espacamento in _candidatos_hastes(catalogo):
+        n = int(n_hastes_minimo(resistividade, comprimento, catalogo['diametros'][nome_diametro], espacamento,
+                                alvo=alvo, n_maximo=catalogo['n_hastes_maximo']))
+        if n > 0:
+            melhor = min(melhor, custo_hastes(n, preco, espacamento, catalogo))
+    return melhor
+
+
+@pytest.mark.parametrize('resistividade, alvo', [(30.0, 10.0), (100.0, 10.0), (500.0, 10.0), (300.0, 5.0)])
+def test_branch_and_bound_igual_a_forca_bruta(resistividade, alvo):
+    projeto, avaliados, total = otimizar_hastes(resistividade, alvo)
+    assert projeto['custo'] == pytest.approx(_forca_bruta_hastes(resistividade, alvo))
+    assert projeto['resistencia'] <= alvo
+    assert avaliados <= total
+
+
+def test_hastes_inatingivel():
+    projeto, _, _ = otimizar_hastes(1e6, 1.0)
+    assert projeto is None
+
+
+def test_malha_mais_barata_que_atende():
+    projeto, _, _ = otimizar_malha(200.0, 5.0)
+    assert projeto['resistencia'] <= 5.0
+    assert resistencia_malha(200.0, projeto['area'], projeto['comprimento_total'],
+                             projeto['profundidade']) == pytest.approx(projeto['resistencia'])
+    for lado in CATALOGO_PADRAO['lados_malha']:
+        for espacamento in CATALOGO_PADRAO['espacamentos_malha']:
+            if espacamento > lado:
+                continue
+            comprimento_total = 2 * (math.floor(lado / espacamento) + 1) * lado
+            custo = comprimento_total * (CATALOGO_PADRAO['custo_cabo_m'] + CATALOGO_PADRAO['custo_valeta_m'])
+            if custo < projeto['custo']:
+                assert resistencia_malha(200.0, lado ** 2, comprimento_total, 0.5) > 5.0
+
+
+def test_projeto_escolhe_o_mais_barato():
+    projeto = otimizar_projeto(100.0, 10.0)
+    hastes = otimizar_hastes(100.0, 10.0)[0]
+    malha = otimizar_malha(100.0, 10.0)[0]
+    assert projeto['custo'] == min(hastes['custo'], malha['custo'])
+    assert otimizar_projeto(1e7, 0.1) is None
+
+
+def test_lote_reaproveita_resultados_iguais():
+    projetos = otimizar_lote(np.array([100.0, 300.0, 100.0]), 10.0)
+    assert len(projetos) == 3
+    assert projetos[0] == projetos[2]
+    assert projetos[0] == otimizar_projeto(100.0, 10.0)
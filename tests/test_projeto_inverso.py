@@ -0,0 +1,59 @@
+import math
+
+import numpy as np
+import pytest
+
+from Motor_Calculo import (resistencia_condutor_horizontal, resistencia_haste_unica, resistencia_malha,
+                           resistencia_multiplas_hastes)
+from Projeto_Inverso import (area_malha_minima, bissecao, comprimento_condutor_minimo, comprimento_haste_minimo,
+                             n_hastes_minimo)
+
+
+def test_bissecao_limites():
+    funcao = lambda x: 10.0 / x
+    assert bissecao(funcao, 2.0, 1.0, 100.0) == pytest.approx(5.0, rel=1e-5)
+    assert bissecao(funcao, 20.0, 1.0, 100.0) == 1.0
+    assert math.isnan(bissecao(funcao, 0.01, 1.0, 100.0))
+
+
+def test_bissecao_vetorizada():
+    resultado = bissecao(lambda x: 10.0 / x, np.array([2.0, 1.0, 0.5]), 1.0, 100.0)
+    assert resultado == pytest.approx([5.0, 10.0, 20.0], rel=1e-5)
+
+
+def test_n_hastes_minimo_e_o_menor():
+    rho, L, d, s = np.array([100.0, 300.0, 1000.0]), 2.4, 0.016, 3.0
+    n = n_hastes_minimo(rho, L, d, s, alvo=10.0)
+    for rho_i, n_i in zip(rho, n):
+        assert resistencia_multiplas_hastes(rho_i, n_i, L, d, s) <= 10.0
+        if n_i > 2:
+            assert resistencia_multiplas_hastes(rho_i, n_i - 1, L, d, s) > 10.0
+
+
+def test_n_hastes_minimo_haste_unica_e_inatingivel():
+    assert n_hastes_minimo(10.0, 2.4, 0.016, 3.0, alvo=10.0) == 1
+    assert n_hastes_minimo(1e6, 2.4, 0.016, 3.0, alvo=1.0, n_maximo=10) == 0
+
+
+def test_comprimento_haste_minimo():
+    L = comprimento_haste_minimo(100.0, 0.016, alvo=40.0)
+    assert resistencia_haste_unica(100.0, L, 0.016) == pytest.approx(40.0, rel=1e-3)
+    assert resistencia_haste_unica(100.0, L, 0.016) <= 40.0
+
+    L = comprimento_haste_minimo(200.0, 0.016, alvo=10.0, n_hastes=6, espacamento=3.0)
+    assert resistencia_multiplas_hastes(200.0, 6, L, 0.016, 3.0) == pytest.approx(10.0, rel=1e-3)
+
+    with pytest.raises(ValueError):
+        comprimento_haste_minimo(100.0, 0.016, n_hastes=3)
+
+
+def test_comprimento_condutor_minimo():
+    L = comprimento_condutor_minimo(100.0, 0.01, 0.5, alvo=10.0)
+    assert resistencia_condutor_horizontal(100.0, L, 0.01, 0.5) == pytest.approx(10.0, rel=1e-3)
+
+
+def test_area_malha_minima():
+    A = area_malha_minima(100.0, 200.0, 0.5, alvo=5.0)
+    assert resistencia_malha(100.0, A, 200.0, 0.5) == pytest.approx(5.0, rel=1e-3)
+    # Com área infinita R tende a ρ/comprimento_total: alvo abaixo disso é inatingível
+    assert math.isnan(area_malha_minima(100.0, 200.0, 0.5, alvo=0.4))
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from Seguranca_Malha import avaliar_malha, fator_camada_superficial, resistencia_sverak, tensoes_admissiveis
+
+# IEEE Std 80, anexo B: malha quadrada de 70 m × 70 m, 11 condutores em cada direção
+# (D = 7 m), h = 0,5 m, d = 0,01 m, ρ = 400 Ω·m, brita de 2500 Ω·m com 0,102 m,
+# IG = 1908 A, ts = 0,5 s, pessoa de 70 kg
+EXEMPLO = dict(resistividade=400.0, area=4900.0, comprimento_total=1540.0, profundidade=0.5,
+               corrente_malha=1908.0, n_condutores=11, tempo_falta=0.5, diametro=0.01,
+               resistividade_superficial=2500.0, espessura_superficial=0.102, peso=70)
+# Exemplo 2: as mesmas condições com 20 hastes de 7,5 m na periferia
+HASTES = dict(comprimento_hastes=150.0, comprimento_haste=7.5)
+
+
+def test_camada_superficial():
+    assert fator_camada_superficial(400.0, 2500.0, 0.102) == pytest.approx(0.74, abs=5e-3)
+    assert fator_camada_superficial(400.0, 2500.0, 0.0) == 1.0
+
+
+def test_tensoes_admissiveis_70kg():
+    toque, passo = tensoes_admissiveis(2500.0, 0.74, 0.5, peso=70)
+    assert toque == pytest.approx(838.2, rel=1e-3)
+    assert passo == pytest.approx(2686.6, rel=1e-3)
+
+
+def test_peso_invalido():
+    with pytest.raises(ValueError):
+        tensoes_admissiveis(2500.0, 0.74, 0.5, peso=60)
+
+
+def test_sverak():
+    # Rg → ρ/LT com área infinita; com a malha do exemplo, 2,78 Ω
+    assert resistencia_sverak(400.0, 1e14, 1540.0, 0.5) == pytest.approx(400.0 / 1540.0, rel=1e-4)
+    assert resistencia_sverak(400.0, 4900.0, 1540.0, 0.5) == pytest.approx(2.78, abs=5e-3)
+
+
+def test_exemplo_sem_hastes():
+    resultado = avaliar_malha(**EXEMPLO)
+    assert resultado['resistencia'] == pytest.approx(2.78, abs=5e-3)
+    assert resultado['GPR'] == pytest.approx(5304.0, rel=2e-3)
+    assert resultado['Em'] == pytest.approx(1002.1, rel=2e-3)
+    assert not resultado['atende_toque']
+    assert resultado['atende_passo']
+
+
+def test_exemplo_com_hastes():
+    resultado = avaliar_malha(**EXEMPLO, **HASTES)
+    # A norma usa Schwarz neste exemplo (2,75 Ω); Sverak com LT = LC + LR fica a menos de 1%
+    assert resultado['resistencia'] == pytest.approx(2.75, rel=1e-2)
+    assert resultado['GPR'] > resultado['E_toque_admissivel']
+    assert resultado['Em'] == pytest.approx(747.4, rel=5e-3)
+    assert resultado['Es'] == pytest.approx(548.9, rel=2e-3)
+    assert resultado['atende_toque']
+    assert resultado['atende_passo']
+
+
+def test_cenarios_vetorizados():
+    correntes = np.array([500.0, 1908.0, 4000.0])
+    resultado = avaliar_malha(**dict(EXEMPLO, corrente_malha=correntes))
+    for i, corrente in enumerate(correntes):
+        escalar = avaliar_malha(**dict(EXEMPLO, corrente_malha=corrente))
+        assert resultado['Em'][i] == pytest.approx(float(escalar['Em']))
+        assert resultado['Es'][i] == pytest.approx(float(escalar['Es']))
+    assert np.allclose(resultado['Em'] / correntes, resultado['Em'][0] / correntes[0])
+
+
+def test_malha_com_um_condutor():
+    with pytest.raises(ValueError):
+        avaliar_malha(**dict(EXEMPLO, n_condutores=1))
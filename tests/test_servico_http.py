@@ -0,0 +1,106 @@
+import asyncio
+import json
+
+import pytest
+
+from Motor_Calculo import CLASSIFICACOES, calcular
+from Servico_HTTP import ServicoCalculo
+
+HASTE = {'tipo': 'haste_unica', 'resistividade': 100.0, 'comprimento': 2.4, 'diametro': 0.016}
+
+
+async def _pedido(leitor, escritor, metodo, caminho, dados=None):
+    corpo = b'' if dados is None else (dados if isinstance(dados, bytes) else json.dumps(dados).encode())
+    escritor.write(f"{metodo} {caminho} HTTP/1.1\r\nHost: teste\r\nContent-Length: {len(corpo)}\r\n\r\n".encode()
+                   + corpo)
+    await escritor.drain()
+    cabecalho = (await leitor.readuntil(b'\r\n\r\n')).decode('latin-1')
+    status = int(cabecalho.split(' ', 2)[1])
+    tamanho = int(next(linha.split(':', 1)[1] for linha in cabecalho.split('\r\n')
+                       if linha.lower().startswith('content-length')))
+    return status, json.loads(await leitor.readexactly(tamanho))
+
+
+def _executar(cenario, **opcoes):
+    async def principal():
+        servico = ServicoCalculo(processos=1, **opcoes)
+        servidor = await servico.iniciar('127.0.0.1', 0)
+        porta = servidor.sockets[0].getsockname()[1]
+        try:
+            async with servidor:
+                return await cenario(servico, porta)
+        finally:
+            servico.encerrar()
+    return asyncio.run(principal())
+
+
+def test_calcular_e_keep_alive():
+    async def cenario(servico, porta):
+        leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+        respostas = [await _pedido(leitor, escritor, 'POST', '/calcular', HASTE),
+                     await _pedido(leitor, escritor, 'POST', '/calcular', dict(HASTE, tipo=1))]
+        escritor.close()
+        return respostas
+
+    for status, resposta in _executar(cenario):
+        assert status == 200
+        assert resposta['resistencia'] == pytest.approx(calcular('haste_unica', 100.0, comprimento=2.4,
+                                                                 diametro=0.016))
+        assert resposta['classificacao'] == CLASSIFICACOES[resposta['indice_norma']]
+        assert resposta['atende'] is False
+
+
+def test_pedidos_concorrentes_sao_agrupados():
+    async def cenario(servico, porta):
+        conexoes = [await asyncio.open_connection('127.0.0.1', porta) for _ in range(20)]
+        respostas = await asyncio.gather(*(_pedido(leitor, escritor, 'POST', '/calcular',
+                                                   dict(HASTE, resistividade=10.0 * (i + 1)))
+                                           for i, (leitor, escritor) in enumerate(conexoes)))
+        for _, escritor in conexoes:
+            escritor.close()
+        return respostas, servico.agrupador.estatisticas
+
+    respostas, estatisticas = _executar(cenario, espera_ms=20)
+    for i, (status, resposta) in enumerate(respostas):
+        assert status == 200
+        assert resposta['resistencia'] == pytest.approx(
+            calcular('haste_unica', 10.0 * (i + 1), comprimento=2.4, diametro=0.016))
+    assert estatisticas['requisicoes'] == 20
+    assert estatisticas['lotes'] < 20
+
+
+def test_lote_e_rotas_de_consulta():
+    async def cenario(servico, porta):
+        leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+        lote = await _pedido(leitor, escritor, 'POST', '/lote',
+                             {'registros': [HASTE, {'tipo': 'malha', 'resistividade': 100.0}]})
+        tipos = await _pedido(leitor, escritor, 'GET', '/tipos')
+        saude = await _pedido(leitor, escritor, 'GET', '/saude')
+        escritor.close()
+        return lote, tipos, saude
+
+    (status, lote), (_, tipos), (_, saude) = _executar(cenario)
+    assert status == 200
+    primeiro, segundo = lote['resultados']
+    assert primeiro['tipo'] == 'haste_unica'
+    assert 'erro' in segundo
+    assert tipos['malha']['parametros'] == ['resistividade', 'area', 'comprimento_total', 'profundidade']
+    assert saude['status'] == 'ok'
+
+
+def test_erros():
+    async def cenario(servico, porta):
+        leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+        respostas = [
+            await _pedido(leitor, escritor, 'POST', '/calcular', b'{nao e json'),
+            await _pedido(leitor, escritor, 'POST', '/calcular', [1, 2]),
+            await _pedido(leitor, escritor, 'POST', '/calcular', {'tipo': 'haste_unica', 'resistividade': 100}),
+            await _pedido(leitor, escritor, 'POST', '/lote', {'registros': 'x'}),
+            await _pedido(leitor, escritor, 'GET', '/calcular'),
+            await _pedido(leitor, escritor, 'GET', '/inexistente'),
+        ]
+        escritor.close()
+        return respostas
+
+    status = [s for s, resposta in _executar(cenario) if 'erro' in resposta]
+    assert status == [400, 400, 400, 400, 405, 404]
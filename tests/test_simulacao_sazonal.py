@@ -0,0 +1,104 @@
+import csv
+
+import numpy as np
+import pytest
+
+from Motor_Calculo import calcular
+from Simulacao_Sazonal import (NOMES_ESTACOES, CurvaCorrecao, carregar_curvas, gravar_series, ler_locais, ler_series,
+                               series_sinteticas, simular)
+
+HASTE = {'tipo': 'haste_unica', 'comprimento': '2.4', 'diametro': '0.016'}
+TRATADA = {'tipo': 'haste_tratada', 'comprimento': '2.4', 'diametro': '0.016', 'diametro_tratamento': '0.15',
+           'resistividade_tratamento': '2.5'}
+
+
+def _gravar_locais(caminho, linhas):
+    colunas = sorted({coluna for linha in linhas for coluna in linha})
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, colunas)
+        escritor.writeheader()
+        escritor.writerows(linhas)
+    return caminho
+
+
+def _constantes(n_horas, locais, umidade, temperatura, inicio='2020-01-01T00'):
+    datas = (np.datetime64(inicio, 'h') + np.arange(n_horas)).astype('datetime64[s]')
+    forma = (n_horas, locais)
+    yield datas, np.full(forma, umidade), np.full(forma, temperatura)
+
+
+def test_curva_correcao():
+    curva = CurvaCorrecao(((10.0, 400.0), (20.0, 100.0)), referencia=20.0)
+    assert curva(20.0) == pytest.approx(1.0)
+    assert curva(15.0) == pytest.approx(2.0)  # log ρ linear: média geométrica
+    assert curva(np.array([0.0, 50.0])) == pytest.approx([4.0, 1.0])
+    umidade, temperatura = carregar_curvas()
+    assert umidade(umidade.referencia) == pytest.approx(1.0)
+    assert temperatura(-5.0) > temperatura(0.0) > temperatura(20.0)
+
+
+def test_ler_locais_separa_parcela_fixa(tmp_path):
+    caminho = _gravar_locais(tmp_path / 'locais.csv', [dict(HASTE, local='A', resistividade='100'),
+                                                      dict(TRATADA, local='B', resistividade='300')])
+    locais, resistividade, unitaria, fixa = ler_locais(caminho)
+    assert locais == ['A', 'B']
+    assert fixa[0] == 0.0
+    assert unitaria[0] == pytest.approx(calcular('haste_unica', 1.0, comprimento=2.4, diametro=0.016))
+    assert fixa[1] > 0
+    tratada = calcular('haste_tratada', 300.0, comprimento=2.4, diametro=0.016, diametro_tratamento=0.15,
+                       resistividade_tratamento=2.5)
+    assert resistividade[1] * unitaria[1] + fixa[1] == pytest.approx(tratada)
+
+
+def test_ler_locais_invalidos(tmp_path):
+    with pytest.raises(ValueError, match='B'):
+        ler_locais(_gravar_locais(tmp_path / 'a.csv', [dict(HASTE, local='A', resistividade='100'),
+                                                       dict(HASTE, local='B', resistividade='-1')]))
+    with pytest.raises(ValueError):
+        ler_locais(_gravar_locais(tmp_path / 'b.csv', [dict(HASTE, local='A', resistividade='100', tipo='x')]))
+
+
+def test_condicoes_de_referencia_mantem_r():
+    umidade, temperatura = carregar_curvas()
+    resultado = simular(_constantes(48, 2, umidade.referencia, temperatura.referencia), ['A', 'B'],
+                        [100.0, 50.0], [0.4, 0.4], umidade, temperatura, limite=30.0, resistencia_fixa=[0.0, 2.0])
+    assert resultado.media == pytest.approx([40.0, 22.0])
+    assert resultado.horas == pytest.approx(48.0)
+    assert resultado.horas_acima == pytest.approx([48.0, 0.0])
+
+
+def test_lacunas_nao_contam_como_tempo():
+    umidade, temperatura = carregar_curvas()
+    datas = np.concatenate([np.arange(10), np.arange(100, 110)]).astype('timedelta64[h]') + \
+        np.datetime64('2020-01-01T00', 'h')
+    blocos = [(datas.astype('datetime64[s]'), np.full((20, 1), 20.0), np.full((20, 1), 20.0))]
+    resultado = simular(blocos, ['A'], [100.0], [0.1], umidade, temperatura)
+    assert resultado.horas == pytest.approx(20.0)
+
+
+def test_arquivos_em_blocos_de_qualquer_tamanho(tmp_path):
+    locais = ['A', 'B', 'C']
+    caminho_umidade, caminho_temperatura = tmp_path / 'umidade.csv', tmp_path / 'temperatura.csv'
+    gravar_series(series_sinteticas(3, 1, linhas_por_bloco=1000), locais, caminho_umidade, caminho_temperatura)
+    umidade, temperatura = carregar_curvas()
+
+    resultados = [simular(ler_series(caminho_umidade, caminho_temperatura, locais, tamanho), locais,
+                          [100.0, 200.0, 300.0], [0.4, 0.4, 0.4], umidade, temperatura)
+                  for tamanho in (333, 5000)]
+    assert resultados[0].amostras == resultados[1].amostras == 8766
+    assert resultados[0].media == pytest.approx(resultados[1].media, rel=1e-12)
+    assert np.allclose(resultados[0].media_mensal, resultados[1].media_mensal, rtol=1e-12)
+    # Séries sintéticas do hemisfério sul: solo mais seco e frio no inverno
+    assert [NOMES_ESTACOES[e] for e in resultados[0].pior_estacao()] == ['Inverno'] * 3
+
+
+def test_series_com_datas_diferentes(tmp_path):
+    caminho_umidade, caminho_temperatura = tmp_path / 'umidade.csv', tmp_path / 'temperatura.csv'
+    caminho_umidade.write_text("data,A\n2020-01-01T00:00,20\n2020-01-01T01:00,20\n")
+    caminho_temperatura.write_text("data,A\n2020-01-01T00:00,20\n2020-01-01T02:00,20\n")
+    with pytest.raises(ValueError):
+        list(ler_series(caminho_umidade, caminho_temperatura, ['A']))
+    caminho_temperatura.write_text("data,B\n2020-01-01T00:00,20\n")
+    caminho_umidade.write_text("data,A,C\n2020-01-01T00:00,20,20\n")
+    with pytest.raises(ValueError):
+        list(ler_series(caminho_umidade, caminho_temperatura, ['B']))
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from Motor_Calculo import resistencia_haste_unica, resistencia_malha
+from Solo_Duas_Camadas import coeficiente_reflexao, resistencia_haste_duas_camadas, resistencia_malha_duas_camadas
+
+CONTRASTES = [(100, 1000), (1000, 100), (100, 100), (100, 5000), (1000, 10), (100, 100000)]
+
+
+def test_coeficiente_reflexao():
+    assert coeficiente_reflexao(100, 300) == pytest.approx(0.5)
+    assert coeficiente_reflexao(300, 100) == pytest.approx(-0.5)
+
+
+@pytest.mark.parametrize('comprimento', [0.5, 2.4, 3.0])
+def test_solo_uniforme_na_camada_superior(comprimento):
+    R = resistencia_haste_duas_camadas(100, 100, 3.0, comprimento, 0.016)
+    assert R == pytest.approx(resistencia_haste_unica(100, comprimento, 0.016), rel=1e-12)
+
+
+def test_solo_uniforme_atravessando_a_interface():
+    comprimentos = np.array([3.5, 4.0, 6.0, 10.0])
+    R = resistencia_haste_duas_camadas(100, 100, 3.0, comprimentos, 0.016)
+    np.testing.assert_allclose(R, resistencia_haste_unica(100, comprimentos, 0.016), rtol=0.01)
+
+
+@pytest.mark.parametrize('rho1, rho2', CONTRASTES)
+def test_continua_em_L_igual_a_H(rho1, rho2):
+    H = 3.0
+    R = resistencia_haste_duas_camadas(rho1, rho2, H, np.array([H - 1e-6, H, H + 1e-6]), 0.016)
+    np.testing.assert_allclose(R, R[1], rtol=1e-4)
+
+
+@pytest.mark.parametrize('rho1, rho2', CONTRASTES)
+@pytest.mark.parametrize('espessura', [0.5, 3.0, 8.0])
+def test_resistencia_nao_cresce_com_o_comprimento(rho1, rho2, espessura):
+    diametro = 0.016
+    comprimentos = np.sort(np.concatenate([np.linspace(30 * diametro, 3 * espessura, 200),
+                                           espessura + np.linspace(-0.05, 0.05, 101)]))
+    R = resistencia_haste_duas_camadas(rho1, rho2, espessura, comprimentos, diametro)
+    assert np.all(np.isfinite(R)) and np.all(R > 0)
+    assert np.all(np.diff(R) <= 1e-9 * R[1:])
+
+
+def test_limites_da_camada_inferior():
+    # Camada inferior muito condutiva: a haste que a atinge fica bem abaixo da que não atinge
+    R = resistencia_haste_duas_camadas(1000, 10, 3.0, [2.9, 4.0], 0.016)
+    assert R[1] < 0.1 * R[0]
+    # Camada inferior muito resistiva: o trecho nela quase não contribui
+    R = resistencia_haste_duas_camadas(100, 1e6, 3.0, [3.0, 3.5], 0.016)
+    assert R[1] == pytest.approx(R[0], rel=0.01)
+
+
+def test_malha_solo_uniforme():
+    R = resistencia_malha_duas_camadas(100, 100, 5.0, 400.0, 240.0, 0.6)
+    assert R == pytest.approx(resistencia_malha(100, 400.0, 240.0, 0.6), rel=1e-12)
+
+
+def test_malha_abaixo_da_interface():
+    with pytest.raises(ValueError):
+        resistencia_malha_duas_camadas(100, 300, 0.5, 400.0, 240.0, 0.6)
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import Validacao_Referencia
+from Validacao_Referencia import ERRO_MAXIMO_README, LINHAS_README, comparar_readme, ler_valores_readme
+
+
+def test_tabela_de_referencia():
+    falhas = [(nome, erro) for nome, erro, limite in Validacao_Referencia.verificar_tabela() if not erro <= limite]
+    assert not falhas
+
+
+def test_readme_concorda_com_o_motor():
+    assert set(ler_valores_readme()) >= {rotulo for rotulo, _, _ in LINHAS_README}
+    for tipo, publicado, motor, _ in comparar_readme():
+        assert publicado == pytest.approx(motor, abs=ERRO_MAXIMO_README), tipo
+
+
+def test_lote_aleatorio_pequeno():
+    verificacoes, _ = Validacao_Referencia.verificar_aleatorio(n=500, n_decimal=50, semente=1)
+    falhas = [(nome, erro) for nome, erro, limite in verificacoes if not erro <= limite]
+    assert not falhas
+
+
+def test_importacao_nao_carrega_interfaces():
+    diretorio = os.path.dirname(Validacao_Referencia.__file__)
+    codigo = "import sys, Validacao_Referencia; print('tkinter' in sys.modules, 'matplotlib' in sys.modules)"
+    saida = subprocess.run([sys.executable, '-c', codigo], cwd=diretorio, capture_output=True, text=True,
+                           check=True).stdout
+    assert saida.strip() == 'False False'
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from Motor_Calculo import resistencia_haste_unica, resistencia_multiplas_hastes
+from Varredura import varrer
+
+
+def test_sem_eixos_e_um_ponto():
+    resultado = varrer('haste_unica', resistividade=100, comprimento=2.4, diametro=0.016)
+    esperado = resistencia_haste_unica(100, 2.4, 0.016)
+    assert resultado.forma == () and resultado.total == 1
+    assert resultado.minimo == pytest.approx(esperado)
+    assert float(resultado.resistencia) == pytest.approx(esperado)
+    assert resultado.ponto_minimo == {'resistividade': 100.0, 'comprimento': 2.4, 'diametro': 0.016}
+
+
+def test_grade_igual_a_formula():
+    resistividade = np.linspace(10, 1000, 7)
+    comprimento = np.linspace(1, 6, 5)
+    resultado = varrer('haste_unica', processos=1, resistividade=resistividade, comprimento=comprimento,
+                       diametro=0.016)
+    esperado = resistencia_haste_unica(resistividade[:, None], comprimento[None, :], 0.016)
+    np.testing.assert_allclose(resultado.resistencia, esperado, rtol=1e-15)
+    assert resultado.minimo == pytest.approx(esperado.min())
+    assert resultado.maximo == pytest.approx(esperado.max())
+    assert resultado.n_atende == np.count_nonzero(esperado <= 10.0)
+    assert resultado.ponto_minimo == {'resistividade': 10.0, 'comprimento': 6.0, 'diametro': 0.016}
+    np.testing.assert_allclose(resultado.selecionar(comprimento=0), esperado[:, 0])
+
+
+def test_blocos_processos_e_sem_armazenar_concordam():
+    parametros = dict(resistividade=np.linspace(10, 1000, 40), n_hastes=np.arange(2, 12),
+                      comprimento=[2.4, 3.0], diametro=0.016, espacamento=np.linspace(2, 6, 9))
+    serial = varrer('multiplas_hastes', processos=1, **parametros)
+    paralelo = varrer('multiplas_hastes', processos=2, tamanho_bloco=333, **parametros)
+    estatisticas = varrer('multiplas_hastes', processos=1, tamanho_bloco=100, armazenar=False, **parametros)
+    np.testing.assert_array_equal(paralelo.resistencia, serial.resistencia)
+    for resultado in (paralelo, estatisticas):
+        assert (resultado.minimo, resultado.indice_minimo, resultado.maximo, resultado.n_atende) == \
+            (serial.minimo, serial.indice_minimo, serial.maximo, serial.n_atende)
+    assert estatisticas.resistencia is None
+    with pytest.raises(ValueError):
+        estatisticas.selecionar(n_hastes=0)
+    ponto = serial.ponto_minimo
+    assert serial.minimo == pytest.approx(resistencia_multiplas_hastes(
+        ponto['resistividade'], ponto['n_hastes'], ponto['comprimento'], ponto['diametro'], ponto['espacamento']))
+
+
+def test_pontos_invalidos_sao_ignorados_nas_estatisticas():
+    with np.errstate(invalid='ignore'):
+        resultado = varrer('haste_unica', resistividade=100, comprimento=[-1.0, 2.4], diametro=0.016)
+    assert resultado.minimo == pytest.approx(resistencia_haste_unica(100, 2.4, 0.016))
+    assert resultado.indice_minimo == 1
+
+
+def test_grade_sem_pontos_validos_nao_tem_minimo():
+    with np.errstate(invalid='ignore'):
+        resultado = varrer('haste_unica', processos=1, tamanho_bloco=2, resistividade=100,
+                           comprimento=[-1.0, -2.0, -3.0], diametro=0.016)
+    assert np.isnan(resultado.minimo) and np.isnan(resultado.maximo)
+    assert resultado.indice_minimo is None
+    assert resultado.ponto_minimo is None
+    assert resultado.n_atende == 0
+
+
+@pytest.mark.parametrize('tipo, parametros', [
+    ('inexistente', dict(resistividade=100)),
+    ('haste_unica', dict(resistividade=100, comprimento=2.4)),
+    ('haste_unica', dict(resistividade=100, comprimento=2.4, diametro=0.016, area=10)),
+    ('haste_unica', dict(resistividade=[], comprimento=2.4, diametro=0.016)),
+])
+def test_parametros_invalidos(tipo, parametros):
+    with pytest.raises(ValueError):
+        varrer(tipo, **parametros)